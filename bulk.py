@@ -0,0 +1,245 @@
+# bulk.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /<resource>/bulk endpoints ke shared helpers.
+#   - Poori list ek pass me validate hoti hai (*Create schema se)
+#   - Foreign keys / unique fields ek-ek query me check hote hain (per row nahi)
+#   - Rows chunks me multi-row INSERT / executemany se ek hi transaction me jati hain
+#   - Generated ids input order me wapas milti hain
+#   - Inserted rows commit par change_seq paati hain (models/change_seq.py, /changes feed)
+#
+# IDS:
+#   RETURNING wale dialects (SQLite ≥ 3.35, MariaDB ≥ 10.5) → DB khud ids deta hai.
+#   MySQL (RETURNING nahi) → multi-row INSERT ki ids lastrowid se sirf tab gini ja sakti hain
+#   jab InnoDB ek statement ko lagataar ids de: innodb_autoinc_lock_mode 0/1 (step =
+#   auto_increment_increment, Galera / multi-primary par > 1). Lock mode 2 (interleaved,
+#   MySQL 8 ka default) par concurrent inserts ki ids aapas me mil sakti hain → row-by-row
+#   INSERT, har row ki apni lastrowid (slow magar sahi).
+#
+# MODES:
+#   partial=false (default) → koi bhi row ghalat ho to kuch insert nahi hota (422/409)
+#   partial=true            → ghalat rows "errors" me report hoti hain, baqi insert hoti hain
+# ────────────────────────────────────────────────────────────────
+
+import weakref
+
+from fastapi import HTTPException, Query
+from pydantic import ValidationError
+from sqlalchemy import insert, select, text
+from sqlalchemy.exc import DBAPIError
+
+from models.change_seq import ChangeSeqMixin, mark_changed
+
+MAX_BULK_ROWS = 10_000
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 5_000
+
+
+class BulkParams:
+    """
+    FastAPI dependency: ?chunk_size= aur ?partial= query params.
+    Usage: params: BulkParams = Depends(BulkParams)
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=MAX_CHUNK_SIZE,
+                                description="Ek INSERT statement me kitni rows"),
+        partial: bool = Query(False, description="Ghalat rows skip karke baqi insert karo"),
+    ):
+        self.chunk_size = chunk_size
+        self.partial = partial
+
+
+def check_size(payload: list):
+    if len(payload) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=413, detail=f"Max {MAX_BULK_ROWS} rows per bulk request")
+
+
+def validate_rows(schema, payload: list):
+    """
+    Har row ko schema se validate karta hai.
+    Returns: (valid, errors) — valid = [(index, dict)], errors = [{"index", "errors"}]
+    """
+    valid, errors = [], []
+    for index, item in enumerate(payload):
+        try:
+            valid.append((index, schema.model_validate(item).model_dump()))
+        except ValidationError as e:
+            errors.append({"index": index, "errors": e.errors(include_url=False, include_context=False)})
+    return valid, errors
+
+
+def check_parents(db, rows, fk_field: str, parent_model):
+    """
+    FK check ek query me: rows jinka parent (fk_field) exist nahi karta ya soft-deleted hai.
+    Returns: (ok_rows, errors)
+    """
+    wanted = {data[fk_field] for _, data in rows}
+    if not wanted:
+        return rows, []
+    found = set(db.execute(
+        select(parent_model.id).where(parent_model.id.in_(wanted), parent_model.is_deleted == 0)
+    ).scalars())
+
+    ok_rows, errors = [], []
+    for index, data in rows:
+        if data[fk_field] in found:
+            ok_rows.append((index, data))
+        else:
+            errors.append({"index": index, "errors": [
+                {"loc": [fk_field], "msg": f"{parent_model.__tablename__} id {data[fk_field]} not found",
+                 "type": "foreign_key"}
+            ]})
+    return ok_rows, errors
+
+
+def check_unique(db, rows, column):
+    """
+    Unique column (e.g. Client.email) ka check ek query me: DB me pehle se maujood
+    values aur payload ke andar duplicates dono pakre jate hain. None values skip.
+    Returns: (ok_rows, errors)
+    """
+    field = column.key
+    values = {data[field] for _, data in rows if data.get(field) is not None}
+    taken = set(db.execute(select(column).where(column.in_(values))).scalars()) if values else set()
+
+    ok_rows, errors = [], []
+    for index, data in rows:
+        value = data.get(field)
+        if value is not None and value in taken:
+            errors.append({"index": index, "errors": [
+                {"loc": [field], "msg": f"{field} '{value}' already exists", "type": "unique"}
+            ]})
+            continue
+        if value is not None:
+            taken.add(value)
+        ok_rows.append((index, data))
+    return ok_rows, errors
+
+
+_id_steps = weakref.WeakKeyDictionary()  # MySQL engine → multi-row INSERT ki id step (None = consecutive nahi)
+
+
+def _mysql_id_step(db):
+    """auto_increment_increment agar ek statement ki ids guaranteed lagataar hon, warna None."""
+    bind = db.get_bind()
+    engine = getattr(bind, "engine", bind)
+    if engine not in _id_steps:
+        step, lock_mode = db.execute(
+            text("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode")
+        ).one()
+        _id_steps[engine] = int(step) if int(lock_mode) in (0, 1) else None
+    return _id_steps[engine]
+
+
+def _insert_chunk(db, table, values):
+    """Ek chunk insert karke generated ids (values ke order me) return karta hai."""
+    dialect = db.get_bind().dialect
+    if dialect.insert_executemany_returning:
+        # SQLite ≥ 3.35 / MariaDB ≥ 10.5 / Postgres: executemany + RETURNING
+        stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        return list(db.execute(stmt, values).scalars())
+
+    if dialect.name == "sqlite":
+        # Purana SQLite (RETURNING nahi): ek writer, ids lagataar; lastrowid aakhri row ki id
+        last_id = db.execute(insert(table).values(values)).lastrowid
+        return list(range(last_id - len(values) + 1, last_id + 1))
+
+    step = _mysql_id_step(db) if dialect.name == "mysql" else None
+    if step is None:
+        # Ids lagataar hone ki guarantee nahi → har row alag INSERT, apni lastrowid
+        return [db.execute(insert(table).values(data)).lastrowid for data in values]
+
+    # MySQL (lock mode 0/1): ek multi-row "INSERT ... VALUES (...), (...)"; lastrowid pehli id,
+    # baqi auto_increment_increment ke faslay par
+    first_id = db.execute(insert(table).values(values)).lastrowid
+    return list(range(first_id, first_id + step * len(values), step))
+
+
+def bulk_insert(db, model, rows, chunk_size: int = DEFAULT_CHUNK_SIZE, partial: bool = False):
+    """
+    Step by step:
+    1. Rows ko chunk_size ke hisaab se tukron me baanto
+    2. Har chunk ek INSERT statement (ya executemany) se jata hai — sab ek transaction me
+    3. partial mode me har chunk SAVEPOINT me chalta hai; fail ho to us chunk ki rows
+       ek-ek karke try hoti hain taa-ke sirf ghalat row report ho
+    4. Aakhir me ek commit
+
+    rows: [(index, dict)] (validate_rows / check_* ka output)
+    Returns: ({index: id}, errors)
+    """
+    table = model.__table__
+    ids, errors = {}, []
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        values = [data for _, data in chunk]
+
+        if not partial:
+            try:
+                new_ids = _insert_chunk(db, table, values)
+            except DBAPIError as e:
+                db.rollback()
+                raise HTTPException(status_code=409, detail={
+                    "message": "Bulk insert failed; no rows were saved",
+                    "error": str(e.orig),
+                    "chunk_start_index": chunk[0][0],
+                })
+            ids.update(zip((index for index, _ in chunk), new_ids))
+            continue
+
+        try:
+            with db.begin_nested():
+                new_ids = _insert_chunk(db, table, values)
+            ids.update(zip((index for index, _ in chunk), new_ids))
+        except DBAPIError:
+            # Chunk me koi row ghalat hai → row-by-row, har row apne SAVEPOINT me
+            for index, data in chunk:
+                try:
+                    with db.begin_nested():
+                        ids[index] = _insert_chunk(db, table, [data])[0]
+                except DBAPIError as e:
+                    errors.append({"index": index, "errors": [
+                        {"loc": [], "msg": str(e.orig), "type": "database"}
+                    ]})
+
+    if issubclass(model, ChangeSeqMixin):
+        mark_changed(db, table.name, ids.values())  # Core insert: ORM flush events ids nahi dekhte
+    db.commit()
+    return ids, errors
+
+
+def bulk_result(total: int, ids: dict, errors: list) -> dict:
+    """Response ka "data" hissa: ids input order me (failed row → None) + per-row errors."""
+    return {
+        "received": total,
+        "inserted": len(ids),
+        "failed": len(errors),
+        "ids": [ids.get(i) for i in range(total)],
+        "errors": sorted(errors, key=lambda e: e["index"]),
+    }
+
+
+def run_bulk(db, model, schema, payload: list, params: BulkParams, checks=()):
+    """
+    Poora bulk flow (routers isi ko call karte hain):
+    size check → validate → FK/unique checks → (strict mode me errors par 422) → insert → result
+
+    checks: functions (db, rows) → (ok_rows, errors), e.g.
+        lambda db, rows: check_parents(db, rows, "project_id", Project)
+    """
+    check_size(payload)
+    rows, errors = validate_rows(schema, payload)
+    for check in checks:
+        rows, check_errors = check(db, rows)
+        errors += check_errors
+
+    if errors and not params.partial:
+        raise HTTPException(status_code=422, detail={
+            "message": "Bulk payload has invalid rows; no rows were saved",
+            "errors": sorted(errors, key=lambda e: e["index"]),
+        })
+
+    ids, db_errors = bulk_insert(db, model, rows, params.chunk_size, params.partial)
+    return bulk_result(len(payload), ids, errors + db_errors)
@@ -0,0 +1,365 @@
+# cache.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Read-through response cache (UI in endpoints ko lagataar poll karti hai, writes kam hain):
+#   /projects/list, /clients/list, /ui/projects, /clients/view/{id}
+#
+#   - Key = path + sorted query params
+#   - In-process LRU: TTL + total size bound (bytes)
+#   - Har entry un tables (tags) se judi hoti hai jin se wo bani; kisi table par
+#     commit hote hi sirf usi table ki entries invalid hoti hain
+#   - Optional shared store (SQLite file): kai uvicorn workers ek dusre ki entries
+#     reuse karte hain aur invalidation sab workers tak pohanchti hai
+#   - conditional_get (conditional.py) ke andar: entry apna ETag (DB fingerprint se bana)
+#     sath rakhti hai; aaj ka ETag alag ho to entry stale (kisi aur process ki write jo
+#     is worker ke versions tak nahi pohanchi) — taaza body, warna 304 purane data par atak jata
+#
+# INVALIDATION (automatic):
+#   Session events write hone wali tables note karte hain — ORM flush (create_*
+#   handlers) aur session.execute(insert/update/delete) (bulk + aage ke update/delete
+#   handlers) — aur commit ke baad invalidate() chalta hai. Handlers ko kuch yaad
+#   rakhna nahi parta.
+#
+# ENV VARS:
+#   CACHE_ENABLED=1              → 0 = cache bilkul off
+#   CACHE_TTL_SECONDS=30         → entry ki max umar
+#   CACHE_MAX_BYTES=33554432     → in-process cache ka size bound (32 MB)
+#   CACHE_SHARED_PATH=           → SQLite file (e.g. /tmp/fpt_cache.db) = shared store on
+# ────────────────────────────────────────────────────────────────
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1").lower() in ("1", "true", "yes")
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+CACHE_SHARED_PATH = os.getenv("CACHE_SHARED_PATH") or None
+
+# Response ke ye headers cache me nahi jate (har response apna banata hai)
+_SKIP_HEADERS = {"content-length", "content-type", "set-cookie", "x-cache"}
+
+
+class _Entry:
+    __slots__ = ("body", "media_type", "headers", "tags", "versions", "etag", "expires_at", "size")
+
+    def __init__(self, body, media_type, headers, tags, versions, etag, expires_at):
+        self.body = body
+        self.media_type = media_type
+        self.headers = headers
+        self.tags = tags
+        self.versions = versions
+        self.etag = etag  # conditional_get ka ETag jis par body bani (None = bina conditional_get)
+        self.expires_at = expires_at
+        self.size = len(body) + 256  # body + thora bookkeeping overhead
+
+
+class _SharedStore:
+    """
+    SQLite-file store jo ek machine ke saare workers share karte hain.
+    cache_versions: har table ka version (invalidate par +1)
+    cache_entries:  serialized responses + jin versions par bani thin
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._sets = 0
+        if hasattr(os, "register_at_fork"):
+            # gunicorn preload: parent ki sqlite connection fork ke baad child me use na ho
+            os.register_at_fork(after_in_child=self._forget_connections)
+        with self._conn() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_versions (tag TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(cache_entries)")}
+            if columns and "etag" not in columns:  # purani shared file: entries sirf cache hain, phir ban jayengi
+                conn.execute("DROP TABLE IF EXISTS cache_entries")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, body BLOB NOT NULL, "
+                "media_type TEXT, headers TEXT, tags TEXT, versions TEXT, etag TEXT, expires_at REAL NOT NULL)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        # Har thread ki apni connection (sqlite3 connections threads me share nahi hoti)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _forget_connections(self):
+        self._local = threading.local()
+
+    def versions(self, tags) -> dict:
+        tags = list(tags)
+        marks = ",".join("?" * len(tags))
+        found = dict(self._conn().execute(
+            f"SELECT tag, version FROM cache_versions WHERE tag IN ({marks})", tags
+        ).fetchall())
+        return {tag: found.get(tag, 0) for tag in tags}
+
+    def bump(self, tags):
+        self._conn().executemany(
+            "INSERT INTO cache_versions (tag, version) VALUES (?, 1) "
+            "ON CONFLICT(tag) DO UPDATE SET version = version + 1",
+            [(tag,) for tag in tags],
+        )
+
+    def get(self, key: str):
+        row = self._conn().execute(
+            "SELECT body, media_type, headers, tags, versions, etag, expires_at FROM cache_entries "
+            "WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        body, media_type, headers, tags, versions, etag, expires_at = row
+        return _Entry(bytes(body), media_type, json.loads(headers), tuple(json.loads(tags)),
+                      json.loads(versions), etag, expires_at)
+
+    def set(self, key: str, entry: _Entry):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries "
+            "(key, body, media_type, headers, tags, versions, etag, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, entry.body, entry.media_type, json.dumps(entry.headers), json.dumps(entry.tags),
+             json.dumps(entry.versions), entry.etag, entry.expires_at),
+        )
+        self._sets += 1
+        if self._sets % 100 == 0:
+            self._prune(conn)
+
+    def _prune(self, conn):
+        # Expired entries hatao; phir bhi size bound se zyada ho to sab se pehle expire hone wali
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM cache_entries").fetchone()[0]
+        while total > self.max_bytes:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE key IN "
+                "(SELECT key FROM cache_entries ORDER BY expires_at LIMIT 50)"
+            )
+            total = conn.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM cache_entries").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Usage (endpoint ke andar):
+        return response_cache.cached(request, ("projects",), lambda: FastJSONResponse(...))
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL_SECONDS, max_bytes: int = CACHE_MAX_BYTES,
+                 shared_path: str = CACHE_SHARED_PATH, enabled: bool = CACHE_ENABLED):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._entries = OrderedDict()  # key → _Entry, LRU order (aakhri = sab se taaza)
+        self._by_tag = {}              # tag → {keys}, precise invalidation ke liye
+        self._versions = {}            # tag → version (shared store na ho to yahi source)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._shared = _SharedStore(shared_path, max_bytes) if shared_path else None
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0,
+                      "invalidations": 0, "shared_hits": 0}
+
+    # ── keys / versions ─────────────────────────────────────────
+    @staticmethod
+    def key_for(request) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{query}"
+
+    def versions(self, tags) -> dict:
+        if self._shared is not None:
+            return self._shared.versions(tags)
+        return {tag: self._versions.get(tag, 0) for tag in tags}
+
+    # ── local LRU ───────────────────────────────────────────────
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+
+    def _put(self, key: str, entry: _Entry):
+        if entry.size > self.max_bytes:
+            return  # itni bari response cache nahi hoti
+        self._drop(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.stats["evictions"] += 1
+
+    @staticmethod
+    def etag_for(request):
+        """conditional_get ne is request ke liye jo ETag banaya (request.state par), warna None."""
+        return getattr(request.state, "etag", None)
+
+    def get(self, key: str, etag=None):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._drop(key)
+                self.stats["expirations"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None and self._shared is not None:
+            entry = self._shared.get(key)
+            if entry is not None:
+                with self._lock:
+                    self.stats["shared_hits"] += 1
+                    self._put(key, entry)
+
+        # Dusre worker ne table invalidate kar di ho (shared versions), ya DB fingerprint
+        # (ETag) entry banne ke baad badal gaya ho (kisi aur process ki write) → stale
+        if entry is not None and (entry.versions != self.versions(entry.tags) or entry.etag != etag):
+            with self._lock:
+                self._drop(key)
+                self.stats["invalidations"] += 1
+            entry = None
+
+        with self._lock:
+            self.stats["hits" if entry is not None else "misses"] += 1
+        return entry
+
+    def set(self, key: str, response, tags, versions: dict, etag=None):
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS}
+        entry = _Entry(bytes(response.body), response.media_type, headers, tuple(tags), versions,
+                       etag, time.time() + self.ttl)
+        with self._lock:
+            self._put(key, entry)
+        if self._shared is not None:
+            self._shared.set(key, entry)
+
+    def invalidate(self, *tables):
+        """Di gayi tables se bani saari entries invalid (sirf wohi, baqi cache bacha rehta hai)."""
+        tables = [t for t in tables if t]
+        if not tables:
+            return
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+                for key in list(self._by_tag.get(table, ())):
+                    self._drop(key)
+                    self.stats["invalidations"] += 1
+        if self._shared is not None:
+            self._shared.bump(tables)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries), "bytes": self._bytes,
+                    "max_bytes": self.max_bytes, "ttl_seconds": self.ttl,
+                    "shared": self._shared is not None, "enabled": self.enabled}
+
+    # ── endpoint helpers ────────────────────────────────────────
+    @staticmethod
+    def _respond(entry: _Entry, state: str) -> Response:
+        return Response(content=entry.body, media_type=entry.media_type,
+                        headers={**entry.headers, "X-Cache": state})
+
+    def cached(self, request, tags, build):
+        """
+        Step by step:
+        1. Key (path + query) se entry dhoondo → mili (aur ETag wahi) to seedha bytes (DB/serialization skip)
+        2. Na mili: versions note karo, build() se response banao
+        3. 200 response ki body tags + versions ke sath cache me
+        """
+        if not self.enabled:
+            return build()
+        key, etag = self.key_for(request), self.etag_for(request)
+        entry = self.get(key, etag)
+        if entry is not None:
+            return self._respond(entry, "HIT")
+
+        # Versions build se PEHLE: beech me write hui to entry foran stale hogi (purana data nahi)
+        versions = self.versions(tags)
+        response = build()
+        if response.status_code == 200 and hasattr(response, "body"):
+            self.set(key, response, tags, versions, etag)
+            response.headers["X-Cache"] = "MISS"
+        return response
+
+    async def cached_async(self, request, tags, build):
+        """cached() ka async version: build ek coroutine function hai (async routers)."""
+        if not self.enabled:
+            return await build()
+        key, etag = self.key_for(request), self.etag_for(request)
+        entry = self.get(key, etag)
+        if entry is not None:
+            return self._respond(entry, "HIT")
+
+        versions = self.versions(tags)
+        response = await build()
+        if response.status_code == 200 and hasattr(response, "body"):
+            self.set(key, response, tags, versions, etag)
+            response.headers["X-Cache"] = "MISS"
+        return response
+
+
+response_cache = ResponseCache()
+
+
+# ── Write tracking: commit par sirf likhi gayi tables invalidate ──
+def _written(session) -> set:
+    return session.info.setdefault("cache_written_tables", set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    # ORM create/update/delete (e.g. db.add(Project(...)); db.commit())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            _written(session).add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_execute(orm_execute_state):
+    # session.execute(insert(...)/update(...)/delete(...)) — bulk + Core-style writes
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _written(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    # after_commit SAVEPOINT release (begin_nested, e.g. partial bulk) par bhi chalta hai — tab
+    # data abhi commit nahi hua: yahan invalidate karna = beech ki GET purana data naye version
+    # par cache kar leti. Sirf bahar wali transaction ke commit par.
+    if session.in_nested_transaction():
+        return
+    tables = session.info.pop("cache_written_tables", None)
+    if tables:
+        response_cache.invalidate(*tables)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_on_rollback(session, transaction):
+    # Sirf outermost rollback / close par bhoolo (commit par upar pop ho chuka); failed
+    # SAVEPOINT ke baad bhi pehle likhi tables commit par invalidate honi chahiye
+    if transaction.parent is None:
+        session.info.pop("cache_written_tables", None)
@@ -0,0 +1,138 @@
+# change_feed.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Delta sync (/changes?since=<cursor>) ka engine: clients, projects, tasks, invoices
+#   ki wo rows jo cursor ke baad bani / badli / soft-delete huin — ek hi paginated stream me.
+#   Mobile / reporting clients poori tables dobara pull nahi karte; sync ka cost
+#   changes ki tadaad ke barabar hai, dataset size ke nahi.
+#
+# ORDER + CURSOR:
+#   Stream ka order (change_seq, entity, id) hai. change_seq commit order me barhta hai
+#   (models/change_seq.py) — updated_at nahi: wo write ke waqt lagta hai, commit baad me,
+#   aur lambi transaction ki rows updated_at-cursor ke peeche commit ho kar reh jati thin.
+#   Jo seq reader ko dikhe us se chhote saare seq commit ho chuke hote hain, is liye
+#   koi lag / horizon nahi — commit hote hi change agli poll me.
+#   Cursor (change_seq, entity, id) ko opaque token me rakhta hai; har table ki branch
+#   "change_seq > :seq" (index ix_<table>_change_seq) se sirf limit + 1 rows padhti hai,
+#   phir UNION ALL + merge ek hi SQL statement me.
+#   Upsert rows ka data (*Out schema columns) phir per-table ek "id IN (...)" query se.
+#   Yani har page: 1 feed query + har entity ki zyada se zyada 1 data query.
+#
+# NOTE:
+#   Purane (updated_at wale) cursors par 400 → client shuru se (since ke bagair) sync kare.
+#   change_seq NULL rows (app ke bahar se likhi) feed me nahi aati.
+# ────────────────────────────────────────────────────────────────
+
+from collections import defaultdict
+
+from sqlalchemy import String, and_, literal, or_, select, union_all
+
+from models.client import Client
+from models.invoice import Invoice
+from models.project import Project
+from models.task import Task
+from pagination import decode_token, encode_token
+from schemas.client import ClientOut
+from schemas.invoice import InvoiceOut
+from schemas.project import ProjectOut
+from schemas.task import TaskOut
+from serialization import rows_by_id
+
+# entity name → (model, output schema); names alphabetical order me compare hote hain (cursor tie-break)
+ENTITIES = {
+    "clients": (Client, ClientOut),
+    "invoices": (Invoice, InvoiceOut),
+    "projects": (Project, ProjectOut),
+    "tasks": (Task, TaskOut),
+}
+
+
+def encode_since(change_seq: int, entity: str, row_id: int) -> str:
+    return encode_token({"seq": change_seq, "e": entity, "id": row_id})
+
+
+def decode_since(cursor):
+    """Cursor → (change_seq, entity, id); ghalat (ya purana updated_at wala) cursor par ValueError."""
+    if not cursor:
+        return None
+    data = decode_token(cursor)
+    try:
+        return int(data["seq"]), str(data["e"]), int(data["id"])
+    except (KeyError, TypeError) as exc:
+        raise ValueError(str(exc)) from exc
+
+
+def _after(name: str, model, since):
+    """Is table ki wo rows jo (change_seq, entity, id) order me cursor ke baad hain."""
+    if since is None:
+        return model.change_seq.is_not(None)
+    seq, entity, last_id = since
+    if name > entity:
+        return model.change_seq >= seq
+    if name < entity:
+        return model.change_seq > seq
+    return or_(model.change_seq > seq, and_(model.change_seq == seq, model.id > last_id))
+
+
+def _feed_query(entities, since, limit: int):
+    branches = []
+    for name in entities:
+        model, _ = ENTITIES[name]
+        branch = (
+            select(
+                literal(name, String).label("entity"),
+                model.id.label("id"),
+                model.change_seq.label("change_seq"),
+                model.updated_at.label("updated_at"),
+                model.is_deleted.label("is_deleted"),
+            )
+            .where(_after(name, model, since))
+            .order_by(model.change_seq, model.id)
+            .limit(limit + 1)
+            .subquery(f"{name}_changes")
+        )
+        branches.append(select(branch))
+    feed = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery("feed")
+    return select(feed).order_by(feed.c.change_seq, feed.c.entity, feed.c.id).limit(limit + 1)
+
+
+def _upsert_data(db, items) -> dict:
+    """Non-deleted changes ka current data: {entity: {id: row dict}} (har entity ki ek query)."""
+    ids = defaultdict(list)
+    for item in items:
+        if not item.is_deleted:
+            ids[item.entity].append(item.id)
+    return {name: rows_by_id(db, *ENTITIES[name], entity_ids) for name, entity_ids in ids.items()}
+
+
+def changes_since(db, cursor=None, limit: int = 500, entities=None):
+    """
+    Step by step:
+    1. Cursor decode (None = shuru se, yani poora snapshot pages me)
+    2. Har entity ki (change_seq, id) index range se limit + 1 rows, UNION ALL, global order
+    3. Non-deleted rows ka data per entity ek query se
+    4. Returns (changes, page_info); next_cursor hamesha milta hai — agli poll isi se karein
+       change: {"entity", "id", "op": "upsert" | "delete", "updated_at", "data"}
+    """
+    since = decode_since(cursor)
+    entities = sorted(entities or ENTITIES)
+
+    items = db.execute(_feed_query(entities, since, limit)).all()
+    has_more = len(items) > limit
+    items = items[:limit]
+    data = _upsert_data(db, items)
+
+    changes = []
+    for item in items:
+        row = None if item.is_deleted else data.get(item.entity, {}).get(item.id)
+        changes.append({
+            "entity": item.entity,
+            "id": item.id,
+            # Feed query aur data query ke beech row delete/hard-delete ho gayi ho to bhi "delete"
+            "op": "upsert" if row is not None else "delete",
+            "updated_at": item.updated_at,
+            "data": row,
+        })
+
+    next_cursor = encode_since(items[-1].change_seq, items[-1].entity, items[-1].id) if items else cursor
+    return changes, {"limit": limit, "next_cursor": next_cursor, "has_more": has_more}
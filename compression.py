@@ -0,0 +1,271 @@
+# compression.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Dynamic responses (JSON lists, HTML pages, NDJSON exports) ka on-the-fly compression.
+#   - Content negotiation: client ke Accept-Encoding (q-values) me se server ki pasand:
+#       zstd → br → gzip   (zstd / br sirf tab jab zstandard / brotli install hon)
+#   - Sirf text-type responses (JSON, HTML, CSV, JS, SVG...) aur COMPRESS_MIN_SIZE se bari
+#   - Streaming responses (StreamingResponse / exports / ?stream=1 pages) chunk by chunk
+#     compress hote hain — har chunk ke baad flush, is liye TTFB aur incremental
+#     rendering waise hi rehte hain
+#   - Pehle se encoded responses (precompressed static files) ko haath nahi lagata
+#   - Compress hui response ka ETag encoding-specific ho jata hai ("<hash>-br", "<hash>-gzip"):
+#     bytes badal gaye, magar validator strong rehta hai (har encoding ka apna). conditional.py
+#     If-None-Match me ye suffix hata kar compare karta hai aur 304 par client wala ETag
+#     hi lautata hai → 200 aur 304 dono par ek hi ETag
+#
+# USAGE:
+#   app.add_middleware(CompressionMiddleware)   (main.py)
+#   Static files build-time par compress hote hain: scripts/build_static.py
+#
+# ENV VARS:
+#   COMPRESS_ENABLED=1        → 0 = middleware off
+#   COMPRESS_MIN_SIZE=1024    → is se chhoti (non-streaming) bodies as-is
+#   COMPRESS_GZIP_LEVEL=6  COMPRESS_BR_LEVEL=4  COMPRESS_ZSTD_LEVEL=3
+# ────────────────────────────────────────────────────────────────
+
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "1").lower() in ("1", "true", "yes")
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+LEVELS = {
+    "gzip": int(os.getenv("COMPRESS_GZIP_LEVEL", "6")),
+    "br": int(os.getenv("COMPRESS_BR_LEVEL", "4")),
+    "zstd": int(os.getenv("COMPRESS_ZSTD_LEVEL", "3")),
+}
+
+COMPRESSIBLE_TYPES = {
+    "application/json", "application/x-ndjson", "application/javascript", "application/xml",
+    "application/manifest+json", "image/svg+xml",
+}
+
+
+# ── Codecs: har ek ka compress(chunk) / flush() (stream ke beech) / finish() ──
+class _Gzip:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip header
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _Brotli:
+    def __init__(self, level: int):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+# Server ki pasand ka order (pehla = behtar ratio / speed); sirf installed codecs
+CODECS = {}
+if zstandard is not None:
+    CODECS["zstd"] = _Zstd
+if brotli is not None:
+    CODECS["br"] = _Brotli
+CODECS["gzip"] = _Gzip
+
+# Precompressed files ke extensions (scripts/build_static.py + static_assets.py)
+EXTENSIONS = {"zstd": ".zst", "br": ".br", "gzip": ".gz"}
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """'"abc"' + br → '"abc-br"' (W/ prefix, agar ho, wahi rehta hai)."""
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def strip_etag_encoding(etag: str) -> str:
+    """encoded_etag ka ulta: '"abc-br"' → '"abc"' (baqi ETags as-is)."""
+    for encoding in EXTENSIONS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+def compress_bytes(data: bytes, encoding: str, level: int = None) -> bytes:
+    """Poori body ek baar me (build script / chhoti responses)."""
+    codec = CODECS[encoding](LEVELS[encoding] if level is None else level)
+    return codec.compress(data) + codec.finish()
+
+
+def negotiate(accept_encoding: str, available=None):
+    """
+    Accept-Encoding header → sab se behtar encoding jo dono taraf chale (ya None = identity).
+    "gzip;q=0" = mana; "*" = jo bhi server de.
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    wildcard = accepted.get("*", 0.0)
+    candidates = [enc for enc in (available or CODECS) if accepted.get(enc, wildcard) > 0]
+    if not candidates:
+        return None
+    # Client ki q-value pehle, barabar ho to server ka order
+    return max(candidates, key=lambda enc: accepted.get(enc, wildcard))
+
+
+def is_compressible(content_type: str) -> bool:
+    media = (content_type or "").split(";")[0].strip().lower()
+    return media.startswith("text/") or media in COMPRESSIBLE_TYPES or media.endswith(("+json", "+xml"))
+
+
+class _Responder:
+    """Ek request ke response messages: start ko pehli body tak rok kar faisla karta hai."""
+
+    def __init__(self, send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start = None
+        self.codec = None
+        self.decided = False
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        status = self.start["status"]
+        if status < 200 or status in (204, 206, 304):
+            return False
+        headers = {k.lower(): v for k, v in self.start.get("headers", [])}
+        if b"content-encoding" in headers:
+            return False  # precompressed static file ya kisi aur ne pehle hi encode kiya
+        if not is_compressible(headers.get(b"content-type", b"").decode("latin-1")):
+            return False
+        return more_body or len(body) >= self.minimum_size
+
+    def _compressed_headers(self, length=None) -> list:
+        headers = []
+        for key, value in self.start.get("headers", []):
+            name = key.lower()
+            if name == b"content-length":
+                continue
+            if name == b"etag":
+                # compressed bytes ≠ original bytes → har encoding ka apna (strong) ETag
+                value = encoded_etag(value.decode("latin-1"), self.encoding).encode("latin-1")
+            if name == b"vary":
+                continue
+            headers.append((key, value))
+        vary = [v for k, v in self.start.get("headers", []) if k.lower() == b"vary"]
+        headers.append((b"vary", b", ".join(vary + [b"Accept-Encoding"])))
+        headers.append((b"content-encoding", self.encoding.encode()))
+        if length is not None:
+            headers.append((b"content-length", str(length).encode()))
+        return headers
+
+    async def __call__(self, message):
+        kind = message["type"]
+        if kind == "http.response.start":
+            self.start = message
+            return
+        if self.start is None:
+            await self.send(message)  # start se pehle ke messages (e.g. http.response.debug) as-is
+            return
+        if self.decided:
+            if self.codec is None or kind != "http.response.body":
+                await self.send(message)
+                return
+            more = message.get("more_body", False)
+            data = self.codec.compress(message.get("body", b""))
+            data += self.codec.flush() if more else self.codec.finish()
+            await self.send({"type": "http.response.body", "body": data, "more_body": more})
+            return
+
+        # Pehla body (ya koi aur) message: ab faisla
+        self.decided = True
+        if kind != "http.response.body":
+            await self.send(self.start)
+            await self.send(message)
+            return
+        body = message.get("body", b"")
+        more = message.get("more_body", False)
+        if not self._should_compress(body, more):
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        self.codec = CODECS[self.encoding](LEVELS[self.encoding])
+        if more:
+            # Streaming: length maloom nahi (chunked); har chunk compress + flush
+            await self.send({**self.start, "headers": self._compressed_headers()})
+            data = self.codec.compress(body) + self.codec.flush()
+        else:
+            data = self.codec.compress(body) + self.codec.finish()
+            await self.send({**self.start, "headers": self._compressed_headers(len(data))})
+        await self.send({"type": "http.response.body", "body": data, "more_body": more})
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware (BaseHTTPMiddleware nahi — streaming body buffer nahi hoti).
+    Step by step:
+    1. Accept-Encoding se encoding chuno (koi nahi / HEAD request → response as-is)
+    2. Response start ko pehli body tak roko; type / size / Content-Encoding dekh kar faisla
+    3. Compress ho to Content-Length hata kar (streaming) ya naya laga kar (single body) bhejo
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate(accept)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _Responder(send, encoding, self.minimum_size))
@@ -0,0 +1,203 @@
+# conditional.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Conditional GET (ETag / If-None-Match, Last-Modified / If-Modified-Since) read endpoints ke liye.
+#   Client pichli response ka ETag bhejta hai; data nahi badla to 304 (khali body) —
+#   na ORM query, na rows ka serialization, na re-download.
+#
+# ETAG KAISE BANTA HAI:
+#   Endpoint jin tables se banta hai unka sasta "fingerprint" (ek SQL statement):
+#     MAX(updated_at), COUNT(*) per table
+#       - insert / update / soft-delete → updated_at badalta hai (index (updated_at, id) se O(1))
+#       - COUNT(*) → hard delete bhi pakra jaye
+#   + request path + sorted query params (har page/filter ka apna ETag)
+#   → sha1 → strong ETag: "…"
+#   Last-Modified = tables ka MAX(updated_at); ETag na bheja ho to If-Modified-Since se 304.
+#   CompressionMiddleware compressed body ka ETag "…-br" / "…-gzip" bana deta hai; If-None-Match
+#   me ye suffix hata kar compare hota hai aur 304 client wala ETag hi lautata hai.
+#
+#   Fingerprint process me ETAG_FINGERPRINT_TTL seconds tak yaad rehta hai, magar is
+#   process ke writes (cache.py ke per-table versions) par foran naya banta hai.
+#   Dusre workers/processes ke writes zyada se zyada TTL ke andar nazar aate hain.
+#
+#   build() se pehle ETag request.state.etag par rakha jata hai; response_cache (cache.py)
+#   entry ke sath yahi ETag store karta hai aur sirf isi ETag par HIT deta hai — 304 / ETag
+#   hamesha usi body ka jo waqai serve hui (stale per-worker HIT + taaza ETag nahi).
+#
+# USAGE (endpoint ke andar):
+#   return conditional_get(request, db, ("projects",), build)              # sync
+#   return await conditional_get_async(request, db, ("projects",), build)  # async (build coroutine fn)
+#
+# ENV VARS:
+#   ETAG_FINGERPRINT_TTL=1   → seconds; 0 = har request par fingerprint query
+# ────────────────────────────────────────────────────────────────
+
+import hashlib
+import os
+import time
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Response
+from sqlalchemy import func, literal, select, union_all
+
+from cache import response_cache
+from compression import strip_etag_encoding
+from models.client import Client
+from models.invoice import Invoice
+from models.project import Project
+from models.task import Task
+
+ETAG_FINGERPRINT_TTL = float(os.getenv("ETAG_FINGERPRINT_TTL", "1"))
+
+TABLES = {model.__tablename__: model for model in (Client, Project, Task, Invoice)}
+
+_fingerprints = {}  # tables → (expires_at, local versions, (fingerprint, last_modified))
+
+
+def _fingerprint_query(tables):
+    """Har table ki ek row (name, max updated_at, count) — UNION ALL, ek statement."""
+    parts = [
+        select(literal(name).label("t"), func.max(TABLES[name].updated_at), func.count())
+        for name in tables
+    ]
+    return parts[0] if len(parts) == 1 else union_all(*parts)
+
+
+def _remembered(tables):
+    hit = _fingerprints.get(tables)
+    if hit and hit[0] > time.time() and hit[1] == response_cache.versions(tables):
+        return hit[2]
+    return None
+
+
+def _remember(tables, versions, rows):
+    rows = sorted(rows, key=lambda row: row[0])
+    value = "|".join(f"{name}:{updated.isoformat() if updated else '-'}:{count}" for name, updated, count in rows)
+    last_modified = max((updated for _, updated, _ in rows if updated is not None), default=None)
+    _fingerprints[tables] = (time.time() + ETAG_FINGERPRINT_TTL, versions, (value, last_modified))
+    return value, last_modified
+
+
+def table_fingerprint(db, tables):
+    """
+    Tables ka current (fingerprint, last_modified) (sync Session); TTL ke andar dobara query nahi.
+    last_modified = MAX(updated_at) naive UTC (khali tables par None).
+    """
+    tables = tuple(sorted(tables))
+    found = _remembered(tables)
+    if found is None:
+        versions = response_cache.versions(tables)  # query se PEHLE (beech ka write → agli baar naya)
+        found = _remember(tables, versions, db.execute(_fingerprint_query(tables)).all())
+    return found
+
+
+async def table_fingerprint_async(db, tables):
+    """table_fingerprint ka AsyncSession version."""
+    tables = tuple(sorted(tables))
+    found = _remembered(tables)
+    if found is None:
+        versions = response_cache.versions(tables)
+        found = _remember(tables, versions, (await db.execute(_fingerprint_query(tables))).all())
+    return found
+
+
+def make_etag(request, fingerprint: str, extra: str = "") -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    raw = f"{request.url.path}?{query}#{fingerprint}#{extra}"
+    return '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+
+def http_date(value) -> str:
+    """Naive UTC datetime → HTTP-date (Last-Modified format, seconds tak)."""
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def not_modified_since(request, last_modified) -> bool:
+    """If-Modified-Since >= last_modified (seconds precision) → True."""
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+
+def etag_matches(request, etag: str):
+    """
+    If-None-Match: list of ETags ya "*"; W/ prefix ignore (weak comparison, RFC 9110) aur
+    compression.py ka encoding suffix ("…-br") bhi. Match par client ka wahi ETag (W/ ke bagair)
+    return hota hai — 304 usi ko lautata hai jo 200 par mila tha; warna None.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return etag
+        candidate = candidate.removeprefix("W/")
+        if strip_etag_encoding(candidate) == etag:
+            return candidate
+    return None
+
+
+def _validators(request, fingerprint, last_modified, extra: str):
+    """(response headers, Last-Modified wala datetime ya None)."""
+    headers = {"ETag": make_etag(request, fingerprint, extra), "Cache-Control": "no-cache"}
+    # extra (e.g. aaj ki date) Last-Modified me nahi aa sakta → us surat me sirf ETag
+    if extra:
+        last_modified = None
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers, last_modified
+
+
+def _is_fresh(request, headers: dict, last_modified) -> bool:
+    # RFC 9110: If-None-Match ho to If-Modified-Since ignore hota hai.
+    # Last-Modified seconds tak hota hai (HTTP-date), is liye ETag hi asal validator hai.
+    if request.headers.get("if-none-match"):
+        matched = etag_matches(request, headers["ETag"])
+        if matched is None:
+            return False
+        headers["ETag"] = matched  # compressed 200 ka "…-br" ETag 304 par bhi wahi
+        return True
+    return not_modified_since(request, last_modified)
+
+
+def _tag(response, headers: dict):
+    if response.status_code == 200:
+        response.headers.update(headers)  # no-cache: browser har baar revalidate kare (304 sasta hai)
+    return response
+
+
+def conditional_get(request, db, tables, build, extra: str = ""):
+    """
+    Step by step:
+    1. Tables ka fingerprint + MAX(updated_at) (ek chhoti aggregate query ya yaad rakha hua)
+    2. ETag / Last-Modified banao; If-None-Match (ya If-Modified-Since) fresh ho → 304,
+       build() kabhi call nahi hota
+    3. Warna build() ki response par ETag + Last-Modified laga kar return
+       (build ke andar response_cache sirf isi ETag wali entry serve karta hai)
+    extra: response jis cheez par aur depend kare (e.g. aaj ki date) wo ETag me shamil
+    """
+    fingerprint, last_modified = table_fingerprint(db, tables)
+    headers, last_modified = _validators(request, fingerprint, last_modified, extra)
+    if _is_fresh(request, headers, last_modified):
+        return Response(status_code=304, headers=headers)
+    request.state.etag = headers["ETag"]  # response_cache entry isi ETag se bandhti hai
+    return _tag(build(), headers)
+
+
+async def conditional_get_async(request, db, tables, build, extra: str = ""):
+    """conditional_get ka async version: build ek coroutine function hai."""
+    fingerprint, last_modified = await table_fingerprint_async(db, tables)
+    headers, last_modified = _validators(request, fingerprint, last_modified, extra)
+    if _is_fresh(request, headers, last_modified):
+        return Response(status_code=304, headers=headers)
+    request.state.etag = headers["ETag"]  # response_cache entry isi ETag se bandhti hai
+    return _tag(await build(), headers)
@@ -1,15 +1,39 @@
 # database.py
-from sqlalchemy import create_engine, text
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from db_pool import engine_kwargs, instrument_engine, pool_stats, warm_pool, warm_pool_async
+from metrics import instrument_sql
+from sqlite_mode import SQLITE_TUNING, RoutingSession, is_sqlite_file, tune_engine, writer_engine_kwargs
 
-# ✅ Apni DB URL yahan set karein
+# ✅ Apni DB URL yahan set karein (ya DATABASE_URL env var, dekhein .env)
 # Agar XAMPP/MariaDB custom port (e.g., 3307) hai to port update kar dein.
 # DB_URL = "mysql+pymysql://root:@localhost:3306/freelance_project_tracker"
 
-DB_URL = "mysql+pymysql://root:@localhost:3306/freelance_project_tracker"
+DB_URL = os.getenv("DATABASE_URL", "mysql+pymysql://root:@localhost:3306/freelance_project_tracker")
 
-engine = create_engine(DB_URL, pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+# Edge / single-node: DATABASE_URL=sqlite:///path/tracker.db → SQLite mode (WAL + pragmas,
+# reads pool par, writes ek writer connection par — dekhein sqlite_mode.py)
+SQLITE_MODE = SQLITE_TUNING and is_sqlite_file(DB_URL)
+
+# Pool size / overflow / recycle / timeout / pre-ping env vars se aate hain (dekhein db_pool.py)
+engine = create_engine(DB_URL, future=True, **engine_kwargs(DB_URL))
+instrument_engine(engine)
+instrument_sql(engine)  # per-request SQL count / time (metrics.py)
+writer_engine = engine  # MySQL: ek hi engine reads + writes dono
+if SQLITE_MODE:
+    tune_engine(engine)
+    writer_engine = tune_engine(create_engine(DB_URL, future=True, **writer_engine_kwargs(DB_URL)), writer=True)
+    instrument_engine(writer_engine)
+    instrument_sql(writer_engine)
+    SessionLocal = sessionmaker(bind=engine, class_=RoutingSession, writer=writer_engine,
+                                autocommit=False, autoflush=False, future=True)
+else:
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 Base = declarative_base()
 
 def get_db():
@@ -19,9 +43,133 @@ def get_db():
     finally:
         db.close()
 
+# --- Async engine (optional) ---
+# USE_ASYNC_DB=1 ho to main.py async routers mount karta hai; har request DB ka
+# intezar event loop par karti hai (threadpool thread pin nahi hota), is liye
+# concurrency connection pool se limit hoti hai, threads se nahi.
+#   MySQL  → mysql+aiomysql (pip install aiomysql)
+#   SQLite → sqlite+aiosqlite (local testing; pip install aiosqlite)
+USE_ASYNC_DB = os.getenv("USE_ASYNC_DB", "0").lower() in ("1", "true", "yes")
+
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql+mysqldb": "mysql+aiomysql",
+    "mariadb+pymysql": "mariadb+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """Sync DB URL ka async-driver wala version (e.g. mysql+pymysql → mysql+aiomysql)."""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+ASYNC_DB_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DB_URL)
+
+async_engine = None
+AsyncSessionLocal = None
+if USE_ASYNC_DB:
+    # Import yahan: async driver/greenlet sirf tab chahiye jab async mode on ho
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(ASYNC_DB_URL, **engine_kwargs(ASYNC_DB_URL, async_mode=True))
+    if SQLITE_MODE:
+        tune_engine(async_engine.sync_engine)  # sirf pragmas (writer routing sync SessionLocal me)
+    instrument_engine(async_engine.sync_engine)
+    instrument_sql(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# --- Pool metrics (checked-out, overflow, checkout wait, invalidations) ---
+def get_pool_stats() -> dict:
+    stats = {"sync": pool_stats(engine)}
+    if writer_engine is not engine:
+        stats["sqlite_writer"] = pool_stats(writer_engine)  # checkout wait = writes ki line
+    if async_engine is not None:
+        stats["async"] = pool_stats(async_engine.sync_engine)
+    return stats
+
+# --- Startup: pool warm-up (main.py startup hook) ---
+async def warm_up() -> dict:
+    """
+    Sync aur async pools ek sath warm karo (sync wala thread me, event loop block nahi hota).
+    DB_WARMUP_TIMEOUT tak hi intezar; DB down ho (koi connection na khule) to error raise.
+    """
+    start = time.perf_counter()
+    jobs = {"sync": asyncio.to_thread(warm_pool, engine)}
+    if writer_engine is not engine:
+        jobs["sqlite_writer"] = asyncio.to_thread(warm_pool, writer_engine)
+    if async_engine is not None:
+        jobs["async"] = warm_pool_async(async_engine)
+    results = await asyncio.gather(*jobs.values())
+    pools = dict(zip(jobs, results))
+    return {"pools": pools, "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+def _dispose_after_fork():
+    # gunicorn preload (run.py): master ki koi connection fork ke baad child me share na ho;
+    # close=False → parent ke sockets band nahi karte, child apni nayi connections kholta hai
+    engine.dispose(close=False)
+    if writer_engine is not engine:
+        writer_engine.dispose(close=False)
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=False)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_after_fork)
+
+# --- Schema: models se tables + indexes + search (FTS5 / FULLTEXT) ---
+def init_db(bind=None) -> list:
+    """
+    Missing tables banao (create_all, maujood tables ko haath nahi lagata) — SQLite edge installs
+    ka "migration" yahi hai. Step by step:
+    1. Saare models + search.py import (tables register + after_create par FTS5 / FULLTEXT DDL)
+    2. Ek transaction me create_all (SQLite mode: writer par BEGIN IMMEDIATE → kai workers ek
+       sath start hon to bhi ek hi banata hai, baqi wahi tables dekhte hain)
+    3. SQLite: purani file jisme tables thin magar FTS tables nahi → FTS bana kar index bharo;
+       change_seq column (/changes feed) na ho to jodo
+    Returns: jin tables ka FTS index banaya gaya.
+    """
+    import models.client, models.project, models.task, models.invoice, models.email_outbox  # noqa: F401
+    import search
+    from models.change_seq import ensure_sqlite_change_seq
+
+    bind = bind if bind is not None else writer_engine
+    with bind.begin() as conn:
+        Base.metadata.create_all(conn)
+        if conn.dialect.name == "sqlite":
+            ensure_sqlite_change_seq(conn, ("clients", "projects", "tasks", "invoices"))
+            return search.ensure_sqlite_fts(conn)
+    return []
+
 # --- Optional: simple connectivity check at startup (import in main.py & call) ---
 def check_connection():
     print(f"🔗 Using DB URL: {engine.url}")
     with engine.connect() as conn:
         conn.execute(text("SELECT 1"))
     print("✅ Database connection successful!")
+
+# --- Diagnostics: kisi block me kitni SQL statements chali (N+1 detection) ---
+@contextmanager
+def count_queries(bind=None):
+    """
+    Usage:
+        with count_queries() as statements:
+            ...  # DB work
+        print(len(statements))
+    """
+    bind = bind if bind is not None else engine
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
@@ -0,0 +1,267 @@
+# db_pool.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Connection pool ki configuration (env vars se) aur instrumentation.
+#   database.py dono engines (sync + async) isi module se banata hai.
+#
+# ENV VARS (defaults SQLAlchemy jaise hi hain):
+#   DB_POOL_SIZE=5         → har worker process me permanent connections
+#   DB_MAX_OVERFLOW=10     → load par pool_size ke upar extra connections
+#   DB_POOL_TIMEOUT=30     → checkout ke liye max intezar (seconds), phir TimeoutError
+#   DB_POOL_RECYCLE=1800   → itne seconds purani connection dobara connect (-1 = off);
+#                            MySQL wait_timeout se chhota rakhein
+#   DB_POOL_PRE_PING=1     → har checkout par "SELECT 1" round-trip (0 = off; recycle kaafi ho to)
+#   DB_WARMUP_CONNECTIONS=<DB_POOL_SIZE> → startup par itni connections ek sath khol kar pool me
+#                            rakhein (0 = warm-up / DB check off)
+#   DB_WARMUP_TIMEOUT=3    → warm-up ka max waqt (seconds); is ke baad boot jaari, baqi
+#                            connections pehli requests par khulti hain (loud ❌ log ke sath)
+#   DB_WARMUP_REQUIRED=0   → 1 = warm-up timeout par startup fail (DB hang ho to worker
+#                            "ready" na bane; orchestrator restart / rollout rok de)
+#
+# METRICS (pool_stats()):
+#   checked_out, overflow_in_use, checkout wait time (total/max), timeouts,
+#   connects, invalidations — taa-ke pool ko uvicorn worker count ke hisaab se size kiya ja sake.
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", "1")
+WARMUP_CONNECTIONS = int(os.getenv("DB_WARMUP_CONNECTIONS", str(POOL_SIZE)))
+WARMUP_TIMEOUT = float(os.getenv("DB_WARMUP_TIMEOUT", "3"))
+WARMUP_REQUIRED = _env_bool("DB_WARMUP_REQUIRED", "0")
+
+
+class PoolMetrics:
+    """Ek engine ke pool ke counters (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.overflow_high_water = 0
+
+    def observe_checkout(self, wait_seconds: float, overflow_in_use: int):
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_total += wait_seconds
+            if wait_seconds > self.checkout_wait_max:
+                self.checkout_wait_max = wait_seconds
+            if overflow_in_use > self.overflow_high_water:
+                self.overflow_high_water = overflow_in_use
+
+    def incr(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts_total": self.checkouts,
+                "checkout_wait_seconds_total": round(self.checkout_wait_total, 6),
+                "checkout_wait_seconds_max": round(self.checkout_wait_max, 6),
+                "checkout_timeouts_total": self.timeouts,
+                "connects_total": self.connects,
+                "invalidations_total": self.invalidations,
+                "soft_invalidations_total": self.soft_invalidations,
+                "overflow_high_water": self.overflow_high_water,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """
+    QueuePool checkout (_do_get) ko time karta hai: pool khali ho to yahi
+    wo waqt hai jo request connection ke intezar me guzarti hai (nayi
+    connection khulni ho to connect time bhi isi me shamil hai).
+    """
+
+    metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.incr("timeouts")
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_checkout(time.perf_counter() - start, max(self.overflow(), 0))
+        return conn
+
+    def recreate(self):
+        # engine.dispose() naya pool banata hai; counters wahi rehne chahiye
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncPool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_kwargs(url: str, async_mode: bool = False) -> dict:
+    """create_engine / create_async_engine ke pool arguments (env config se)."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        # In-memory SQLite ka apna single-connection pool hota hai
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncPool if async_mode else InstrumentedQueuePool,
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_timeout": POOL_TIMEOUT,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_pre_ping": POOL_PRE_PING,
+    }
+
+
+def instrument_engine(engine) -> PoolMetrics:
+    """Engine ke pool par metrics lagata hai (sync Engine ya AsyncEngine.sync_engine)."""
+    metrics = PoolMetrics()
+    engine.pool.metrics = metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.incr("connects")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("soft_invalidations")
+
+    return metrics
+
+
+def pool_stats(engine) -> dict:
+    """Pool ki current halat + cumulative metrics (JSON/Prometheus ke liye)."""
+    pool = engine.pool
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow_in_use": max(pool.overflow(), 0),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
+
+
+def _warmup_target(pool, connections: int) -> int:
+    if not isinstance(pool, QueuePool):
+        return min(connections, 1)  # in-memory SQLite ka single-connection pool: sirf connectivity check
+    return min(connections, pool.size())
+
+
+def warm_pool(engine, connections: int = WARMUP_CONNECTIONS, timeout: float = WARMUP_TIMEOUT) -> dict:
+    """
+    Startup warm-up (sync engine): pool ki connections ek ke baad ek nahi, ek sath kholo.
+    Step by step:
+    1. Har connection apni daemon thread me: connect + SELECT 1, phir pakre rakho
+       (warna pool wahi ek connection baar baar de deta)
+    2. Sab khul jayen ya timeout guzre → sab chhor do; khuli connections pool me idle rehti hain
+    3. Ek bhi na khuli aur errors aaye → pehli error raise (DB down: boot fail, pehle jaisa)
+    Return: {"opened", "requested", "timed_out"}
+    """
+    target = _warmup_target(engine.pool, connections)
+    if target <= 0:
+        return {"opened": 0, "requested": 0, "timed_out": False}
+    lock = threading.Lock()
+    done, release = threading.Event(), threading.Event()
+    opened, errors = [], []
+
+    def _finish(bucket, item):
+        with lock:
+            bucket.append(item)
+            if len(opened) + len(errors) == target:
+                done.set()
+
+    def _open():
+        try:
+            conn = engine.connect()
+        except Exception as exc:
+            _finish(errors, exc)
+            return
+        try:
+            conn.exec_driver_sql("SELECT 1")
+        except Exception as exc:
+            conn.close()
+            _finish(errors, exc)
+            return
+        _finish(opened, conn)
+        release.wait()  # timeout ke baad khuli (der se) connection bhi foran pool me wapas
+        conn.close()
+
+    for i in range(target):
+        threading.Thread(target=_open, name=f"db-warmup-{i}", daemon=True).start()
+    timed_out = not done.wait(timeout)
+    release.set()
+    with lock:
+        result = {"opened": len(opened), "requested": target, "timed_out": timed_out}
+        if not opened and errors:
+            raise errors[0]
+    return result
+
+
+async def warm_pool_async(async_engine, connections: int = WARMUP_CONNECTIONS,
+                          timeout: float = WARMUP_TIMEOUT) -> dict:
+    """warm_pool ka async version (AsyncEngine): connects asyncio.gather se, poore batch par timeout."""
+    target = _warmup_target(async_engine.sync_engine.pool, connections)
+    if target <= 0:
+        return {"opened": 0, "requested": 0, "timed_out": False}
+    opened = []
+
+    async def _open():
+        conn = await async_engine.connect()
+        try:
+            await conn.exec_driver_sql("SELECT 1")
+        except Exception:
+            await conn.close()
+            raise
+        opened.append(conn)
+
+    timed_out, errors = False, []
+    try:
+        results = await asyncio.wait_for(asyncio.gather(*(_open() for _ in range(target)), return_exceptions=True),
+                                         timeout)
+        errors = [r for r in results if isinstance(r, BaseException)]
+    except asyncio.TimeoutError:
+        timed_out = True
+    finally:
+        for conn in opened:
+            await conn.close()
+    if not opened and errors:
+        raise errors[0]
+    return {"opened": len(opened), "requested": target, "timed_out": timed_out}
@@ -0,0 +1,91 @@
+# email_worker.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   email_outbox table se emails bhejne wala alag process (web workers se independent).
+#   API (/email/send, /email/send-batch) sirf row insert karti hai; ye worker:
+#   1️⃣ due rows ka batch claim karta hai (outbox.claim_batch)
+#   2️⃣ SMTP pool ki --concurrency connections par parallel bhejta hai
+#   3️⃣ results likhta hai: sent / retry with backoff / failed (outbox.complete)
+#
+# USAGE:
+#   python email_worker.py                          (hamesha chalta rahe; Ctrl+C / SIGTERM par batch khatam karke band)
+#   python email_worker.py --concurrency 8 --batch-size 200
+#   python email_worker.py --once                   (jo due hai bhejo aur exit — cron ke liye)
+#
+#   Zyada throughput ke liye kai processes chala sakte hain; claim SKIP LOCKED se hota hai.
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import os
+import signal
+import socket
+import time
+
+from database import SessionLocal
+from outbox import claim_batch, complete
+from smtp_pool import SENDER_EMAIL, SMTPConnectionPool, build_message
+
+_stopping = False
+
+
+def _stop(signum, frame):
+    global _stopping
+    _stopping = True
+    print("🛑 Stop signal mila, current batch khatam karke band ho rahe hain...")
+
+
+def run_once(pool: SMTPConnectionPool, worker_id: str, batch_size: int) -> int:
+    """Ek batch claim + send + complete. Returns: kitne messages process hue."""
+    db = SessionLocal()
+    try:
+        token, rows = claim_batch(db, worker_id, batch_size)
+        if not rows:
+            return 0
+        msgs = [build_message(r.receiver, r.subject, r.body, SENDER_EMAIL) for r in rows]
+        results = pool.send_many(msgs)
+        complete(db, token, rows, results)
+
+        sent = sum(ok for ok, _ in results)
+        print(f"📤 {sent}/{len(rows)} sent (batch {token})")
+        return len(rows)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Email outbox worker")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("EMAIL_WORKER_CONCURRENCY", "4")),
+                        help="Parallel SMTP connections")
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("EMAIL_WORKER_BATCH_SIZE", "100")),
+                        help="Ek claim me kitni rows")
+    parser.add_argument("--poll-interval", type=float, default=float(os.getenv("EMAIL_WORKER_POLL_SECONDS", "1")),
+                        help="Queue khali ho to itne seconds baad dobara check")
+    parser.add_argument("--once", action="store_true", help="Due emails bhej kar exit")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    pool = SMTPConnectionPool.from_env(max_connections=args.concurrency)
+    print(f"🚀 Email worker {worker_id} (concurrency={args.concurrency}, batch={args.batch_size})")
+
+    try:
+        while not _stopping:
+            try:
+                processed = run_once(pool, worker_id, args.batch_size)
+            except Exception as e:
+                # DB down waghera: thori der ruk kar dobara (claimed rows lease ke baad wapas aa jayengi)
+                print(f"❌ Worker error: {e}")
+                processed = 0
+                time.sleep(args.poll_interval * 5)
+            if args.once and processed == 0:
+                break
+            if processed < args.batch_size:
+                time.sleep(0 if args.once else args.poll_interval)
+    finally:
+        pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
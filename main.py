@@ -3,50 +3,114 @@
 # PURPOSE:
 #   Ye app ka main entry point hai.
 #   - FastAPI instance create karta hai
-#   - Static files aur templates mount karta hai
-#   - Routers include karta hai (API + UI)
-#   - Startup event pe DB connection check karta hai
+#   - Static files (precompressed / fingerprinted) aur templates mount karta hai
+#   - Routers include karta hai (API + UI; USE_ASYNC_DB=1 par async API routers)
+#   - Startup event pe DB pool warm-up (concurrent, timeout ke sath) karta hai
+#     (timeout: loud ❌ log; DB_WARMUP_REQUIRED=1 par startup fail — db_pool.py)
+#     (SQLite mode: pehle models se missing tables / FTS bana leta hai — sqlite_mode.py)
+#   - Notification pipeline (notifications.py) start/stop karta hai
+#   - CompressionMiddleware (compression.py): dynamic responses gzip / br / zstd
+#   - MetricsMiddleware (metrics.py): per-route latency / SQL / size → /metrics
+#   Production me isay run.py chalata hai (multi-worker; dev: uvicorn main:app --reload)
+#
+# NOTE (imports):
+#   Routers jaan boojh kar module import par hi load hote hain (lazy nahi): run.py gunicorn
+#   preload_app se app master me ek baar import karta hai aur workers fork hote hain, to ye
+#   cost har worker boot me nahi aati. Router ko startup hook me import karna wahi kaam har
+#   worker me dobara karwata. Lazy sirf heavy, kam use hone wali cheezen: NumPy (reports.py)
+#   sirf /invoices/reports par, aur sync / async API routers me se sirf mount hone wala set.
 # ────────────────────────────────────────────────────────────────
 
+import asyncio
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
-from database import engine
-from routers import background_task, projects, tasks, invoices, frontend, client, emailer    # import routers
+from database import SQLITE_MODE, USE_ASYNC_DB, init_db, warm_up
+from db_pool import WARMUP_REQUIRED
+from compression import COMPRESS_ENABLED, CompressionMiddleware
+from metrics import METRICS_ENABLED, MetricsMiddleware
+from notifications import notifications
+from sqlite_mode import SQLITE_INIT_SCHEMA
+from static_assets import PrecompressedStaticFiles
+from templating import make_templates
+from routers import background_task, frontend, client, emailer, health, dashboard, changes, search, metrics    # import routers
+
+# USE_ASYNC_DB=1 → JSON API routers ke async (AsyncSession) versions use karo (same URLs)
+# Sirf wahi set import hota hai jo mount hoga (dusra set boot time par load nahi hota)
+if USE_ASYNC_DB:
+    from routers import projects_async as projects, tasks_async as tasks, invoices_async as invoices
+    from routers import clients_api_async as clients_api
+else:
+    from routers import projects, tasks, invoices, clients_api
 
 # 1️⃣ FastAPI app initialize karte hain
 app = FastAPI(title="Freelance Tracker")
 
 # 2️⃣ Static directory mount karna (images, CSS, JS ke liye)
-app.mount("/static", StaticFiles(directory="static"), name="static")
+#    scripts/build_static.py ke baad: hashed files immutable cache + precompressed (.br/.gz) variants
+app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
 
-# 3️⃣ Template engine setup (Jinja2)
-templates = Jinja2Templates(directory="templates")
+# 3️⃣ Template engine setup (Jinja2 + bytecode cache + fragment cache — templating.py)
+templates = make_templates("templates")
 app.state.templates = templates  # store in app.state for use in routers
 
 # 4️⃣ Routers include (API + UI routes)
 app.include_router(frontend.router)   # /ui/projects (HTML frontend)
 app.include_router(client.router)     # /clients/... (JSON + HTML view)
+app.include_router(clients_api.router)  # /clients/create, /clients/list (JSON API)
 app.include_router(projects.router)   # /projects/... (JSON API)
 app.include_router(tasks.router)      # /tasks/... (JSON API)
-app.include_router(background_task.router)  # /send-notification/...
+app.include_router(background_task.router)  # /background/send-notification/... (async queue)
 app.include_router(emailer.router)
-# app.include_router(invoices.router) # optional enable later
+app.include_router(invoices.router)   # /invoices/... (JSON API)
+app.include_router(health.router)     # /health/db-pool (pool metrics)
+app.include_router(dashboard.router)  # /dashboard (per-client counters)
+app.include_router(changes.router)    # /changes?since= (delta sync feed)
+app.include_router(search.router)     # /search?q= (full-text, ranked)
+app.include_router(metrics.router)    # /metrics (Prometheus text format)
 
-# 5️⃣ App startup pe database test karte hain (for early failure detection)
+# 5️⃣ App startup pe DB pool warm-up (early failure detection + pehli requests ko connect ka intezar nahi)
+#    Connections ek sath khulti hain; DB_WARMUP_TIMEOUT se zyada boot nahi rukta (db_pool.py)
+#    Timeout = DB hang ho sakta hai: chup chaap "ready" nahi — ❌ log, DB_WARMUP_REQUIRED=1 par fail
 @app.on_event("startup")
-def startup_event():
-    print("🔍 Checking database connection...")
+async def startup_event():
+    print("🔍 Warming up database pool...")
     try:
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1")).scalar()
-            if result == 1:
-                print("✅ Database connection successful!")
-            else:
-                print("⚠️ Database responded unexpectedly.")
+        if SQLITE_MODE and SQLITE_INIT_SCHEMA:
+            fts = await asyncio.to_thread(init_db)  # nayi / purani SQLite file: missing tables + FTS
+            if fts:
+                print(f"🔎 SQLite FTS index built for: {', '.join(fts)}")
+        result = await warm_up()
     except OperationalError as e:
         print("❌ Database connection failed!")
         print("Error details:", e)
         raise e
+    timed_out = []
+    for name, pool in result["pools"].items():
+        if pool["timed_out"]:
+            timed_out.append(name)
+            print(f"❌ {name} pool warm-up TIMED OUT after {result['elapsed_ms']} ms: "
+                  f"{pool['opened']}/{pool['requested']} connections — database slow ya hang ho sakta hai "
+                  f"(baqi pehli requests par khulengi)")
+        else:
+            print(f"✅ Database connection successful! {name} pool: {pool['opened']}/{pool['requested']} "
+                  f"connections in {result['elapsed_ms']} ms")
+    if timed_out and WARMUP_REQUIRED:
+        raise RuntimeError(f"DB warm-up timed out ({', '.join(timed_out)}) and DB_WARMUP_REQUIRED is set")
+
+# 6️⃣ Notification pipeline: async worker start, shutdown par pending lines flush
+@app.on_event("startup")
+async def start_notifications():
+    await notifications.start()
+
+@app.on_event("shutdown")
+async def stop_notifications():
+    await notifications.stop()
+
+# 7️⃣ Response compression (zstd / br / gzip, Accept-Encoding ke mutabiq; streaming bhi) — COMPRESS_ENABLED=0 par off
+#    Metrics se pehle add → metrics ke andar chalta hai, is liye response size = wire (compressed) bytes
+if COMPRESS_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# 8️⃣ Request metrics + opt-in profiler (pure ASGI middleware; METRICS_ENABLED=0 par off) → /metrics
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
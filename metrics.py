@@ -0,0 +1,346 @@
+# metrics.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Request-level visibility: time kahan ja raha hai?
+#   MetricsMiddleware (pure ASGI, har request par):
+#     - per-route latency histogram (route = path template, e.g. /clients/view/{client_id})
+#     - SQL statements ki tadaad + DB time per request (engine events, instrument_sql)
+#     - response size (bytes; streaming responses ke saare chunks)
+#   Aggregates /metrics par Prometheus text format me (routers/metrics.py).
+#
+# PROFILING (opt-in):
+#   PROFILE_ENABLED=1 ho to "X-Profile: 1" header wali request ka stack sampler chalta hai;
+#   PROFILE_SAMPLE_RATE > 0 ho to itni requests (0.01 = 1%) khud profile hoti hain.
+#   Har PROFILE_INTERVAL seconds par request ke threads (event loop par request ki coroutine
+#   chain + threadpool me sync endpoint) ke stacks note hote hain → PROFILE_DIR me
+#   "folded stacks" file (speedscope.app / flamegraph.pl se khulti hai); path response ke
+#   X-Profile-File header me. Deterministic cProfile yahan kaam nahi karta: wo sirf usi thread
+#   ko dekhta hai jisme enable hua, aur sync endpoints threadpool me chalte hain.
+#
+# NOTE:
+#   Counters har worker process ke apne hain — Prometheus har worker ko alag scrape kare
+#   (ya worker label ke sath aggregate karein).
+#
+# ENV VARS:
+#   METRICS_ENABLED=1          → 0 = middleware bilkul nahi lagta
+#   PROFILE_ENABLED=0          → 1 = X-Profile header maana jata hai
+#   PROFILE_SAMPLE_RATE=0      → requests ka hissa jo bina header profile ho (0..1)
+#   PROFILE_INTERVAL=0.005     → sampler interval (seconds)
+#   PROFILE_DIR=<tmp>/fpt_profiles
+# ────────────────────────────────────────────────────────────────
+
+import contextvars
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+from sqlalchemy import event
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1").lower() in ("1", "true", "yes")
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "0").lower() in ("1", "true", "yes")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+PROFILE_DIR = os.getenv("PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "fpt_profiles")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SQL_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+# ── Per-request SQL stats (contextvar; threadpool me bhi copy hota hai) ──
+class RequestStats:
+    __slots__ = ("sql_count", "sql_seconds")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+
+
+_current = contextvars.ContextVar("request_stats", default=None)
+
+
+def instrument_sql(engine):
+    """
+    Engine (sync Engine ya AsyncEngine.sync_engine) ki har statement current request
+    ke RequestStats me ginti hai. Request ke bahar (workers, scripts) kuch nahi hota.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        if stats is not None and conn.info.get("metrics_started"):
+            stats.sql_count += 1
+            stats.sql_seconds += time.perf_counter() - conn.info["metrics_started"].pop()
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # Fail hone wali statement ka bhi time/ginti (after_cursor_execute nahi chalta)
+        stats = _current.get()
+        started = context.connection.info.get("metrics_started") if context.connection is not None else None
+        if stats is not None and started:
+            stats.sql_count += 1
+            stats.sql_seconds += time.perf_counter() - started.pop()
+
+
+# ── Prometheus-style aggregates ─────────────────────────────────
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+_INF = 'le="+Inf"'
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Fixed buckets per label set (thread-safe)."""
+
+    def __init__(self, name: str, help_text: str, labels, buckets):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}  # label values → [bucket counts..., sum, count]
+
+    def observe(self, values, amount: float):
+        with self._lock:
+            series = self._series.get(values)
+            if series is None:
+                series = self._series[values] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if amount <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += amount
+            series[-1] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {values: list(data) for values, data in self._series.items()}
+        for values, data in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, data):
+                cumulative += count
+                le = 'le="%s"' % _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labels, values, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_labels(self.labels, values, _INF)} {data[-1]}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, values)} {_number(data[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labels, values)} {data[-1]}")
+        return lines
+
+
+class CounterMetric:
+    def __init__(self, name: str, help_text: str, labels):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = Counter()
+
+    def inc(self, values, amount: float = 1):
+        with self._lock:
+            self._values[values] += amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {_number(value)}")
+        return lines
+
+
+ROUTE_LABELS = ("method", "route")
+
+REQUESTS = CounterMetric("http_requests_total", "HTTP requests by route and status code.",
+                         ("method", "route", "status"))
+LATENCY = Histogram("http_request_duration_seconds", "Request latency (first byte in to last byte out).",
+                    ROUTE_LABELS, LATENCY_BUCKETS)
+SQL_COUNT = Histogram("http_request_sql_statements", "SQL statements executed per request.",
+                      ROUTE_LABELS, SQL_COUNT_BUCKETS)
+SQL_TIME = Histogram("http_request_sql_seconds", "Time spent in SQL execution per request.",
+                     ROUTE_LABELS, SQL_TIME_BUCKETS)
+RESPONSE_SIZE = Histogram("http_response_size_bytes", "Response body size.", ROUTE_LABELS, SIZE_BUCKETS)
+
+REQUEST_METRICS = (REQUESTS, LATENCY, SQL_COUNT, SQL_TIME, RESPONSE_SIZE)
+
+
+def _gauges(prefix: str, help_text: str, label: str, groups: dict) -> list:
+    """{label value: {key: number}} → ek metric per key (non-numeric keys skip)."""
+    by_key = {}
+    for label_value, stats in groups.items():
+        for key, value in stats.items():
+            if isinstance(value, (int, float)):
+                by_key.setdefault(key, []).append((label_value, int(value) if isinstance(value, bool) else value))
+    lines = []
+    for key, samples in sorted(by_key.items()):
+        name = f"{prefix}_{key}"
+        kind = "counter" if key.endswith("_total") else "gauge"
+        lines += [f"# HELP {name} {help_text} ({key}).", f"# TYPE {name} {kind}"]
+        lines += [f"{name}{_labels((label,), (label_value,))} {_number(value)}"
+                  for label_value, value in samples]
+    return lines
+
+
+def render_prometheus(pool_stats: dict = None, cache_stats: dict = None, fragment_stats: dict = None) -> str:
+    """Saare aggregates (+ pool / cache / fragment stats agar diye hon) Prometheus text exposition me."""
+    lines = []
+    for metric in REQUEST_METRICS:
+        lines += metric.render()
+    if pool_stats:
+        lines += _gauges("db_pool", "SQLAlchemy connection pool", "engine", pool_stats)
+    if cache_stats:
+        lines += _gauges("response_cache", "Response cache", "cache", {"default": cache_stats})
+    if fragment_stats:
+        lines += _gauges("fragment_cache", "HTML fragment cache", "cache", {"default": fragment_stats})
+    return "\n".join(lines) + "\n"
+
+
+# ── Stack sampler (opt-in profiling) ────────────────────────────
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    Request chalne tak har `interval` par sys._current_frames() se stacks ka sample.
+    Sirf wo threads jinke stack me request ki root coroutine frame ya endpoint function ho.
+    """
+
+    def __init__(self, scope, root_frame, interval: float = PROFILE_INTERVAL):
+        self.scope = scope
+        self.root_frame = root_frame
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _belongs(self, frame) -> bool:
+        endpoint_code = getattr(self.scope.get("endpoint"), "__code__", None)
+        while frame is not None:
+            if frame is self.root_frame or (endpoint_code is not None and frame.f_code is endpoint_code):
+                return True
+            frame = frame.f_back
+        return False
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident != me and self._belongs(frame):
+                    stack = []
+                    while frame is not None:
+                        stack.append(_frame_name(frame))
+                        frame = frame.f_back
+                    self.samples[";".join(reversed(stack))] += 1
+
+    def dump(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in self.samples.most_common():
+                fh.write(f"{stack} {count}\n")
+
+
+def _profile_path(scope) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", scope.get("path", "")).strip("_") or "root"
+    return os.path.join(PROFILE_DIR, f"{int(time.time() * 1000)}-{scope.get('method', 'GET')}-{slug}.folded")
+
+
+def _wants_profile(scope) -> bool:
+    if PROFILE_ENABLED:
+        for name, value in scope.get("headers") or ():
+            if name == b"x-profile" and value.strip() not in (b"", b"0"):
+                return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+# ── Middleware ──────────────────────────────────────────────────
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return getattr(route, "path", None) or "<unknown>"
+    # Mounts (e.g. /static) route set nahi karte; unmatched URLs ek hi label me (cardinality)
+    return scope.get("root_path") or "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (BaseHTTPMiddleware wali extra task / body buffering nahi).
+    Step by step:
+    1. RequestStats contextvar set → engine events SQL count / time isi me jodte hain
+    2. send() wrap: status code + body bytes ginte hain (profile ho to X-Profile-File header)
+    3. Request khatam → route template ke label se histograms update
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status = {"code": 500}
+        size = [0]
+        sampler = None
+        profile_path = None
+        if _wants_profile(scope):
+            profile_path = _profile_path(scope)
+            sampler = StackSampler(scope, sys._getframe())
+            sampler.start()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                if profile_path is not None:
+                    message["headers"] = list(message.get("headers", [])) + [(b"x-profile-file", profile_path.encode())]
+            elif message["type"] == "http.response.body":
+                size[0] += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current.reset(token)
+            if sampler is not None:
+                sampler.stop()
+                sampler.dump(profile_path)
+            labels = (scope.get("method", ""), _route_label(scope))
+            REQUESTS.inc(labels + (str(status["code"]),))
+            LATENCY.observe(labels, elapsed)
+            SQL_COUNT.observe(labels, stats.sql_count)
+            SQL_TIME.observe(labels, stats.sql_seconds)
+            RESPONSE_SIZE.observe(labels, size[0])
@@ -0,0 +1,32 @@
+-- migrations/0001_soft_delete_indexes.sql
+-- ────────────────────────────────────────────────────────────────
+-- PURPOSE:
+--   Soft-delete (is_deleted = 0) query patterns ke liye composite indexes.
+--   Models (models/*.py -> __table_args__) me bhi yahi indexes declare hain,
+--   is liye naya schema create_all se banaya jaye to ye file chalane ki zaroorat nahi.
+--
+-- RUN (MySQL / MariaDB):
+--   mysql -u root freelance_project_tracker < migrations/0001_soft_delete_indexes.sql
+--
+-- NOTE:
+--   MySQL partial indexes support nahi karta, is liye ix_tasks_active_due
+--   yahan normal index hai (SQLite/Postgres par model "WHERE is_deleted = 0" lagata hai).
+-- ────────────────────────────────────────────────────────────────
+
+-- clients
+CREATE INDEX ix_clients_active_id ON clients (is_deleted, id);
+
+-- projects
+CREATE INDEX ix_projects_active_id ON projects (is_deleted, id);
+CREATE INDEX ix_projects_client_active ON projects (client_id, is_deleted);
+CREATE INDEX ix_projects_active_status ON projects (is_deleted, status, id);
+
+-- tasks
+CREATE INDEX ix_tasks_active_id ON tasks (is_deleted, id);
+CREATE INDEX ix_tasks_project_active_completed ON tasks (project_id, is_deleted, completed);
+CREATE INDEX ix_tasks_active_due ON tasks (due_date);
+
+-- invoices
+CREATE INDEX ix_invoices_active_id ON invoices (is_deleted, id);
+CREATE INDEX ix_invoices_project_active ON invoices (project_id, is_deleted);
+CREATE INDEX ix_invoices_status_due ON invoices (paid_status, due_date);
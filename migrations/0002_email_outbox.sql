@@ -0,0 +1,31 @@
+-- migrations/0002_email_outbox.sql
+-- ────────────────────────────────────────────────────────────────
+-- PURPOSE:
+--   Durable email queue (models/email_outbox.py). /email/send aur /email/send-batch
+--   yahan rows likhte hain; `python email_worker.py` inhein bhejta hai.
+--
+-- RUN (MySQL / MariaDB):
+--   mysql -u root freelance_project_tracker < migrations/0002_email_outbox.sql
+--
+-- NOTE:
+--   Worker "SELECT ... FOR UPDATE SKIP LOCKED" use karta hai (MySQL 8+ / MariaDB 10.6+).
+-- ────────────────────────────────────────────────────────────────
+
+CREATE TABLE email_outbox (
+    id INT NOT NULL AUTO_INCREMENT,
+    receiver VARCHAR(255) NOT NULL,
+    subject VARCHAR(255) NOT NULL,
+    body TEXT NOT NULL,
+    dedupe_key VARCHAR(128) NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    next_attempt_at DATETIME NOT NULL,
+    claimed_by VARCHAR(128) NULL,
+    last_error TEXT NULL,
+    created_at DATETIME NOT NULL,
+    sent_at DATETIME NULL,
+    PRIMARY KEY (id),
+    UNIQUE KEY uq_email_outbox_dedupe_key (dedupe_key),
+    KEY ix_email_outbox_id (id),
+    KEY ix_email_outbox_status_next (status, next_attempt_at)
+);
@@ -0,0 +1,36 @@
+-- migrations/0003_timestamps.sql
+-- ────────────────────────────────────────────────────────────────
+-- PURPOSE:
+--   created_at / updated_at (DATETIME(6), UTC) clients, projects, tasks, invoices par,
+--   aur (updated_at, id) indexes — /changes delta feed aur ETag / Last-Modified ke liye.
+--   Models (models/timestamps.py -> TimestampMixin) me bhi yahi columns hain, is liye
+--   naya schema create_all se banaya jaye to ye file chalane ki zaroorat nahi.
+--
+-- RUN (MySQL / MariaDB):
+--   mysql -u root freelance_project_tracker < migrations/0003_timestamps.sql
+--
+-- NOTE:
+--   App dono columns khud UTC me set karti hai. DB defaults sirf purani rows (migration
+--   ke waqt "abhi") aur app ke bahar se hone wale writes ke liye hain — is liye MySQL ka
+--   time_zone UTC hona chahiye (SET GLOBAL time_zone = '+00:00'), warna order bigar sakta hai.
+-- ────────────────────────────────────────────────────────────────
+
+ALTER TABLE clients
+    ADD COLUMN created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    ADD INDEX ix_clients_updated (updated_at, id);
+
+ALTER TABLE projects
+    ADD COLUMN created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    ADD INDEX ix_projects_updated (updated_at, id);
+
+ALTER TABLE tasks
+    ADD COLUMN created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    ADD INDEX ix_tasks_updated (updated_at, id);
+
+ALTER TABLE invoices
+    ADD COLUMN created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    ADD INDEX ix_invoices_updated (updated_at, id);
@@ -0,0 +1,26 @@
+-- migrations/0004_search_fulltext.sql
+-- ────────────────────────────────────────────────────────────────
+-- PURPOSE:
+--   /search (search.py) ke liye FULLTEXT indexes: clients, projects, tasks.
+--   Naya schema create_all se bane to search.py ke after_create hooks ye khud bana dete hain,
+--   is liye sirf purane DB par chalayein.
+--
+-- RUN (MySQL / MariaDB):
+--   mysql -u root freelance_project_tracker < migrations/0004_search_fulltext.sql
+--
+-- NOTE:
+--   InnoDB default innodb_ft_min_token_size = 3 hai — "7", "qa" jaise chhote words index
+--   me nahi aate. Chhote words bhi search karne hon to my.cnf me
+--     innodb_ft_min_token_size = 1
+--   set karke server restart karein, phir ye indexes (DROP + ADD) dobara banayein.
+--   Badi tasks table par index banna kuch minute le sakta hai (ALGORITHM=INPLACE, reads chalti rehti hain).
+-- ────────────────────────────────────────────────────────────────
+
+ALTER TABLE clients
+    ADD FULLTEXT INDEX ft_clients_search (name, company_name, email);
+
+ALTER TABLE projects
+    ADD FULLTEXT INDEX ft_projects_search (title, description);
+
+ALTER TABLE tasks
+    ADD FULLTEXT INDEX ft_tasks_search (title, description, assigned_to);
@@ -0,0 +1,42 @@
+-- migrations/0005_change_seq.sql
+-- ────────────────────────────────────────────────────────────────
+-- PURPOSE:
+--   /changes delta feed ka commit-ordered sequence (models/change_seq.py):
+--   clients, projects, tasks, invoices par change_seq + (change_seq, id) index,
+--   aur change_counter (ek row) jise har likhne wali transaction commit se pehle +1 karti hai.
+--   Naya schema create_all se banaya jaye to ye file chalane ki zaroorat nahi.
+--
+-- RUN (MySQL / MariaDB):
+--   mysql -u root freelance_project_tracker < migrations/0005_change_seq.sql
+--
+-- NOTE:
+--   Purani rows change_seq = 0 paati hain (pehli sync me aa jati hain). updated_at = updated_at
+--   is liye ke backfill UPDATE se ON UPDATE CURRENT_TIMESTAMP(6) na chale (ETag / Last-Modified).
+--   Purane updated_at wale /changes cursors is ke baad 400 dete hain → clients dobara full sync.
+-- ────────────────────────────────────────────────────────────────
+
+CREATE TABLE IF NOT EXISTS change_counter (
+    id INT NOT NULL PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0
+);
+INSERT IGNORE INTO change_counter (id, value) VALUES (1, 0);
+
+ALTER TABLE clients
+    ADD COLUMN change_seq BIGINT NULL,
+    ADD INDEX ix_clients_change_seq (change_seq, id);
+UPDATE clients SET change_seq = 0, updated_at = updated_at;
+
+ALTER TABLE projects
+    ADD COLUMN change_seq BIGINT NULL,
+    ADD INDEX ix_projects_change_seq (change_seq, id);
+UPDATE projects SET change_seq = 0, updated_at = updated_at;
+
+ALTER TABLE tasks
+    ADD COLUMN change_seq BIGINT NULL,
+    ADD INDEX ix_tasks_change_seq (change_seq, id);
+UPDATE tasks SET change_seq = 0, updated_at = updated_at;
+
+ALTER TABLE invoices
+    ADD COLUMN change_seq BIGINT NULL,
+    ADD INDEX ix_invoices_change_seq (change_seq, id);
+UPDATE invoices SET change_seq = 0, updated_at = updated_at;
@@ -0,0 +1,13 @@
+-- migrations/0006_outbox_claimed_by.sql
+-- ────────────────────────────────────────────────────────────────
+-- PURPOSE:
+--   email_outbox.claimed_by VARCHAR(64) → VARCHAR(128). Claim token "<hostname>:<pid>:<12 hex>"
+--   hai; 63 characters tak ke hostnames (e.g. Kubernetes pod names) 64 se lamba token banate
+--   the aur MySQL strict mode me claim UPDATE fail hota tha (worker kuch claim nahi karta).
+--   0002 ab seedha 128 banata hai — ye file sirf un DBs ke liye jin par purani 0002 chal chuki.
+--
+-- RUN (MySQL / MariaDB):
+--   mysql -u root freelance_project_tracker < migrations/0006_outbox_claimed_by.sql
+-- ────────────────────────────────────────────────────────────────
+
+ALTER TABLE email_outbox MODIFY claimed_by VARCHAR(128) NULL;
@@ -0,0 +1,124 @@
+# models/change_seq.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /changes feed (change_feed.py) ka commit-ordered sequence.
+#   updated_at insert/update ke waqt lagta hai, commit baad me — lambi transaction ki rows
+#   purane updated_at ke sath commit hoti hain aur updated_at-cursor unke aage nikal chuka hota hai.
+#   Is liye har transaction commit se bilkul pehle change_counter (ek row) ko +1 karti hai aur
+#   apni likhi hui rows par wahi number (change_seq) lagati hai:
+#     - counter row ka lock commit tak rehta hai → agli transaction ko N+1 tabhi milta hai
+#       jab N wali commit (ya rollback) ho chuki ho → seq order = commit order
+#     - reader ko N+1 dikhe to N bhi dikh chuka hai; cursor kabhi kisi change ke aage nahi nikalta
+#   Lock sirf commit ke aakhri lamhe (2 chhote UPDATEs) tak, poori transaction tak nahi.
+#
+# KON SI ROWS:
+#   ChangeSeqMixin wale models (Client, Project, Task, Invoice):
+#     - ORM add / update / delete → after_flush se ids
+#     - bulk.py Core inserts → mark_changed(db, table, ids)
+#   App ke bahar (seedha SQL) se likhi rows ka change_seq NULL rehta hai → feed me nahi aati.
+#
+# SCHEMA:
+#   create_all par change_counter ki row khud ban jati hai (after_create).
+#   Purane MySQL DB par: migrations/0005_change_seq.sql
+#   Purani SQLite file par: database.init_db() → ensure_sqlite_change_seq()
+# ────────────────────────────────────────────────────────────────
+
+from sqlalchemy import BigInteger, Column, DDL, Integer, event, select, update
+from sqlalchemy.orm import Session
+
+from database import Base
+
+STAMP_CHUNK = 1000  # ek UPDATE ... WHERE id IN (...) me itni ids
+
+
+class ChangeCounter(Base):
+    """Ek hi row (id = 1): aakhri diya gaya change_seq."""
+    __tablename__ = "change_counter"
+
+    id = Column(Integer, primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+
+
+event.listen(ChangeCounter.__table__, "after_create", DDL("INSERT INTO change_counter (id, value) VALUES (1, 0)"))
+
+
+class ChangeSeqMixin:
+    """
+    change_seq: jis commit me row aakhri baar likhi gayi uska number (commit order me barhta hai).
+    Index (change_seq, id) har model apne __table_args__ me declare karta hai.
+    """
+
+    change_seq = Column(BigInteger, nullable=True)
+
+
+def _changed(session) -> dict:
+    return session.info.setdefault("change_seq_rows", {})
+
+
+def mark_changed(session, table: str, ids):
+    """Core writes (bulk insert) ki rows: is transaction ke commit par change_seq lagega."""
+    _changed(session).setdefault(table, set()).update(ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, ChangeSeqMixin):
+            mark_changed(session, obj.__tablename__, [obj.id])
+
+
+@event.listens_for(Session, "before_commit")
+def _stamp_on_commit(session):
+    """
+    Step by step:
+    1. Baqi pending objects flush (commit ka apna flush is event ke BAAD hota hai)
+    2. Counter +1 (row lock commit tak) aur naya number padho
+    3. Is transaction ki har likhi row par change_seq = wahi number (updated_at nahi badalta)
+    SAVEPOINT (begin_nested) release par bhi ye event chalta hai → tab kuch nahi; number sirf
+    bahar wali transaction ke commit par (counter lock bhi tabhi).
+    """
+    if session.in_nested_transaction():
+        return
+    session.flush()
+    rows = session.info.pop("change_seq_rows", None)
+    if not rows:
+        return
+    counter = ChangeCounter.__table__
+    conn = session.connection()  # ORM events (cache / fragment tracking) ke bagair seedha Core
+    conn.execute(update(counter).where(counter.c.id == 1).values(value=counter.c.value + 1))
+    seq = conn.execute(select(counter.c.value).where(counter.c.id == 1)).scalar_one()
+    for name, ids in rows.items():
+        table = Base.metadata.tables[name]
+        ids = sorted(ids)
+        for start in range(0, len(ids), STAMP_CHUNK):
+            conn.execute(
+                update(table)
+                .where(table.c.id.in_(ids[start:start + STAMP_CHUNK]))
+                .values(change_seq=seq, updated_at=table.c.updated_at)  # onupdate updated_at na chale
+            )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_on_rollback(session, transaction):
+    # Sirf outermost rollback / close par: SAVEPOINT rollback ke baad bhi pehle flush hui
+    # rows commit par stamp honi chahiye (warna /changes me kabhi nahi aatin)
+    if transaction.parent is None:
+        session.info.pop("change_seq_rows", None)
+
+
+def ensure_sqlite_change_seq(connection, tables) -> list:
+    """
+    database.init_db(): purani SQLite file (tables pehle se, change_seq column nahi) me column +
+    index jodo; purani rows change_seq = 0 (pehli sync me aa jati hain). Counter row bhi.
+    """
+    added = []
+    for name in tables:
+        columns = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({name})")}
+        if "change_seq" in columns:
+            continue
+        connection.exec_driver_sql(f"ALTER TABLE {name} ADD COLUMN change_seq BIGINT")
+        connection.exec_driver_sql(f"UPDATE {name} SET change_seq = 0")
+        connection.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS ix_{name}_change_seq ON {name} (change_seq, id)")
+        added.append(name)
+    connection.exec_driver_sql("INSERT OR IGNORE INTO change_counter (id, value) VALUES (1, 0)")
+    return added
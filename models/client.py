@@ -1,10 +1,21 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from database import Base
+from models.change_seq import ChangeSeqMixin
+from models.timestamps import TimestampMixin
 
-class Client(Base):
+class Client(TimestampMixin, ChangeSeqMixin, Base):
     __tablename__ = "clients"
 
+    # ⚡ Indexes: list endpoints "WHERE is_deleted = 0 AND id > :after ORDER BY id" chalate hain
+    #  - (updated_at, id) → ETag fingerprint (MAX(updated_at))
+    #  - (change_seq, id) → /changes feed (change_seq > :since)
+    __table_args__ = (
+        Index("ix_clients_active_id", "is_deleted", "id"),
+        Index("ix_clients_updated", "updated_at", "id"),
+        Index("ix_clients_change_seq", "change_seq", "id"),
+    )
+
     # 🆔 Unique client
     id = Column(Integer, primary_key=True, index=True)
 
@@ -18,12 +29,17 @@ class Client(Base):
     # 🚫 Soft delete
     is_deleted = Column(Integer, default=0)
 
+    # 📅 created_at / updated_at: TimestampMixin (models/timestamps.py)
+    # 🔢 change_seq: ChangeSeqMixin (models/change_seq.py)
+
     # 🔁 IMPORTANT: Project side se back_populates="client" diya hai,
     # is liye yahan opposite side MUST exist as `projects`
+    # lazy="select": default me kuch eager load nahi hota; jis endpoint ko
+    # projects chahiye wo query me selectinload(Client.projects) khud lagaye.
     projects = relationship(
         "Project",
         back_populates="client",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan"
     )
 
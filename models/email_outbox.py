@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from database import Base
+from models.timestamps import utcnow  # noqa: F401 (outbox.py yahin se import karta hai)
+
+
+class EmailOutbox(Base):
+    """
+    Durable email queue: API sirf row insert karti hai, email_worker.py bhejta hai.
+
+    status lifecycle:
+        pending → sending (worker ne claim kiya, lease = next_attempt_at tak)
+                → sent
+                → pending (fail hua, backoff ke baad dobara) → ... → failed (max attempts)
+    Worker crash ho jaye to "sending" row ki lease expire hone par koi aur worker use utha leta hai.
+    """
+    __tablename__ = "email_outbox"
+
+    # ⚡ Worker ki claim query: status IN (...) AND next_attempt_at <= now ORDER BY next_attempt_at
+    __table_args__ = (
+        Index("ix_email_outbox_status_next", "status", "next_attempt_at"),
+    )
+
+    # 🆔 Unique message
+    id = Column(Integer, primary_key=True, index=True)
+
+    # ✉️ Message
+    receiver = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+
+    # 🔑 Idempotency: same key dobara aaye to naya email nahi banta
+    dedupe_key = Column(String(128), nullable=True, unique=True)
+
+    # 🔁 Delivery state
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=utcnow)
+    claimed_by = Column(String(128), nullable=True)  # "<hostname>:<pid>:<12 hex>" (outbox.claim_batch)
+    last_error = Column(Text, nullable=True)
+
+    # 📅 Timestamps
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    sent_at = Column(DateTime, nullable=True)
@@ -1,10 +1,20 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Numeric  # ← SQLAlchemy column/data types import
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Numeric, Index  # ← SQLAlchemy column/data types + Index import
 from sqlalchemy.orm import relationship                                   # ← (Optional) agar aap relationship use karna chahein
 from database import Base                                                  # ← Aapka declarative Base (database.py se)
+from models.change_seq import ChangeSeqMixin                               # ← change_seq column (/changes feed order)
+from models.timestamps import TimestampMixin                               # ← created_at / updated_at columns
 
-class Invoice(Base):                                                       # ← SQLAlchemy model class jo ek table represent karti hai
+class Invoice(TimestampMixin, ChangeSeqMixin, Base):                       # ← SQLAlchemy model class jo ek table represent karti hai
     __tablename__ = "invoices"                                            # ← DB me table ka naam
 
+    __table_args__ = (                                                    # ← Composite indexes (soft-delete query patterns)
+        Index("ix_invoices_active_id", "is_deleted", "id"),               # ← Keyset pagination / export (is_deleted = 0, id > :after)
+        Index("ix_invoices_project_active", "project_id", "is_deleted"),  # ← Project ke invoices + projects JOIN
+        Index("ix_invoices_status_due", "paid_status", "due_date"),       # ← ?paid_status= + due-date range (aging reports)
+        Index("ix_invoices_updated", "updated_at", "id"),                 # ← ETag fingerprint (MAX(updated_at))
+        Index("ix_invoices_change_seq", "change_seq", "id"),              # ← /changes feed (change_seq > :since)
+    )
+
     id = Column(Integer, primary_key=True, index=True)                    # ← Primary key (auto-increment), fast lookups ke liye index
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)  # ← Kis project ka invoice hai (FK to projects.id), required
 
@@ -14,6 +24,8 @@ class Invoice(Base):                                                       # ←
 
     paid_status = Column(String(20), default="unpaid")                    # ← Status: e.g., "paid" / "unpaid" / "overdue" etc.; default "unpaid"
     is_deleted = Column(Integer, default=0)                               # ← Soft delete flag: 0 = active, 1 = deleted
+                                                                          # ← created_at / updated_at: TimestampMixin se
+                                                                          # ← change_seq: ChangeSeqMixin se
 
     # NOTE:
     # Agar aap Project model me `invoices = relationship("Invoice", ...)` add karna chahte hain
@@ -1,10 +1,26 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from database import Base
+from models.change_seq import ChangeSeqMixin
+from models.timestamps import TimestampMixin
 
-class Project(Base):
+class Project(TimestampMixin, ChangeSeqMixin, Base):
     __tablename__ = "projects"
 
+    # ⚡ Indexes (soft-delete query patterns ke mutabiq):
+    #  - (is_deleted, id)          → keyset pagination / /ui/projects (id DESC)
+    #  - (client_id, is_deleted)   → client ke projects, clients JOIN
+    #  - (is_deleted, status, id)  → ?status= filter + keyset
+    #  - (updated_at, id)          → ETag fingerprint
+    #  - (change_seq, id)          → /changes feed
+    __table_args__ = (
+        Index("ix_projects_active_id", "is_deleted", "id"),
+        Index("ix_projects_client_active", "client_id", "is_deleted"),
+        Index("ix_projects_active_status", "is_deleted", "status", "id"),
+        Index("ix_projects_updated", "updated_at", "id"),
+        Index("ix_projects_change_seq", "change_seq", "id"),
+    )
+
     # 🆔 Unique project
     id = Column(Integer, primary_key=True, index=True)
 
@@ -28,11 +44,16 @@ class Project(Base):
     # 🚫 Soft delete
     is_deleted = Column(Integer, default=0)
 
+    # 📅 created_at / updated_at: TimestampMixin (models/timestamps.py)
+    # 🔢 change_seq: ChangeSeqMixin (models/change_seq.py)
+
     # 🔁 Relationships
     # IMPORTANT: yahan back_populates="projects" diya hai,
     # jiska opposite Client model me `projects` MUST exist (we added above)
-    client = relationship("Client", back_populates="projects", lazy="joined")
+    # lazy="select" (lazy-by-default): loader strategy har endpoint apni query me
+    # options(...) se chunta hai (raiseload / selectinload / joinedload).
+    client = relationship("Client", back_populates="projects", lazy="select")
 
     # Tasks ke liye opposite side Task.project me back_populates="project" diya hoga,
     # to yahan `tasks` zaroori hai:
-    tasks = relationship("Task", back_populates="project", lazy="selectin", cascade="all, delete-orphan")
\ No newline at end of file
+    tasks = relationship("Task", back_populates="project", lazy="select", cascade="all, delete-orphan")
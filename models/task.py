@@ -1,10 +1,32 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from database import Base
+from models.change_seq import ChangeSeqMixin
+from models.timestamps import TimestampMixin
 
-class Task(Base):
+class Task(TimestampMixin, ChangeSeqMixin, Base):
     __tablename__ = "tasks"
 
+    # ⚡ Indexes (soft-delete query patterns ke mutabiq):
+    #  - (is_deleted, id)                    → keyset pagination / export
+    #  - (project_id, is_deleted, completed) → project ke open/completed tasks
+    #  - due_date WHERE is_deleted = 0       → due-date range filters (partial index;
+    #    MySQL partial index support nahi karta, wahan normal index banta hai;
+    #    postgresql_where nahi rakha — us se boot par postgres dialect import hota tha)
+    #  - (updated_at, id)                    → ETag fingerprint
+    #  - (change_seq, id)                    → /changes feed
+    __table_args__ = (
+        Index("ix_tasks_active_id", "is_deleted", "id"),
+        Index("ix_tasks_project_active_completed", "project_id", "is_deleted", "completed"),
+        Index(
+            "ix_tasks_active_due",
+            "due_date",
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        Index("ix_tasks_updated", "updated_at", "id"),
+        Index("ix_tasks_change_seq", "change_seq", "id"),
+    )
+
     # 🆔 Unique task
     id = Column(Integer, primary_key=True, index=True)
 
@@ -27,5 +49,10 @@ class Task(Base):
     # 🚫 Soft delete
     is_deleted = Column(Integer, default=0)
 
+    # 📅 created_at / updated_at: TimestampMixin (models/timestamps.py)
+    # 🔢 change_seq: ChangeSeqMixin (models/change_seq.py)
+
     # 🔁 Opposite of Project.tasks
-    project = relationship("Project", back_populates="tasks", lazy="joined")
\ No newline at end of file
+    # lazy="select": list endpoints project ko join nahi karte; zaroorat ho to
+    # query me joinedload(Task.project) lagayein.
+    project = relationship("Project", back_populates="tasks", lazy="select")
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects import mysql
+
+
+def utcnow() -> datetime:
+    # Naive UTC (DB DATETIME columns timezone store nahi karte)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# MySQL DATETIME default me seconds tak hota hai; change feed ko microseconds chahiye
+# (ek second me kai writes ka order). SQLite/others par normal DateTime.
+Timestamp = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
+
+class TimestampMixin:
+    """
+    created_at / updated_at (naive UTC) — Client, Project, Task, Invoice.
+
+    - Insert par dono set hote hain (ORM add aur Core bulk insert dono me, Column default)
+    - Har UPDATE par updated_at naya (onupdate) — soft delete (is_deleted = 1) bhi update hai,
+      is liye /changes feed aur ETag fingerprint deletes bhi pakar lete hain
+    Index (updated_at, id) har model apne __table_args__ me declare karta hai.
+    """
+
+    created_at = Column(Timestamp, nullable=False, default=utcnow)
+    updated_at = Column(Timestamp, nullable=False, default=utcnow, onupdate=utcnow)
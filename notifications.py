@@ -0,0 +1,124 @@
+# notifications.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   In-process notification pipeline (/background/send-notification/{email} ke liye).
+#   Pehle har request threadpool me 200k print() chalati thi — stdout par serialize
+#   hoti thi aur baqi requests seconds tak intezar karti thin. Ab:
+#   1️⃣ Request message ek dafa render karke bounded asyncio.Queue me daalti hai (O(1))
+#   2️⃣ Ek async worker queue se batches uthata hai
+#   3️⃣ Batch buffered file me ek write + ek flush se jata hai (thread me, event loop block nahi)
+#   Queue full ho to publish() False deta hai → API 503 (backpressure; memory bounded rehti hai).
+#   Kisi batch ka write fail ho (koi bhi exception) to wo batch log karke chhor diya jata hai;
+#   worker chalta rehta hai — warna queue bhar kar har notification 503 deti, bina kisi log ke.
+#
+# ENV VARS:
+#   NOTIFICATION_LOG_FILE=logs/notifications.log → sink file (default project root ke
+#                                          andar gitignored logs/ folder; deploy par /var/log/... dein)
+#   NOTIFICATION_QUEUE_SIZE=10000        → queue me max pending notifications
+#   NOTIFICATION_BATCH_SIZE=500          → ek write me max lines
+#   NOTIFICATION_FLUSH_SECONDS=0.05      → pehli line ke baad itna intezar taa-ke batch bhar sake
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+import os
+from datetime import datetime
+from pathlib import Path
+
+LOG_FILE = Path(os.getenv("NOTIFICATION_LOG_FILE", Path(__file__).resolve().parent / "logs" / "notifications.log"))
+QUEUE_SIZE = int(os.getenv("NOTIFICATION_QUEUE_SIZE", "10000"))
+BATCH_SIZE = int(os.getenv("NOTIFICATION_BATCH_SIZE", "500"))
+FLUSH_SECONDS = float(os.getenv("NOTIFICATION_FLUSH_SECONDS", "0.05"))
+
+_STOP = object()  # shutdown sentinel
+
+
+def render_notification(email: str, message: str = "") -> str:
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return f"[{ts}] Notification for {email}: {message}\n"
+
+
+class NotificationPipeline:
+    """
+    Usage (main.py startup/shutdown hooks):
+        await notifications.start()
+        notifications.publish(render_notification(email, "..."))   # False = queue full
+        await notifications.stop()   # pending lines flush hoti hain
+    """
+
+    def __init__(self, path: Path = LOG_FILE, maxsize: int = QUEUE_SIZE, batch_size: int = BATCH_SIZE,
+                 flush_seconds: float = FLUSH_SECONDS):
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._queue = None
+        self._task = None
+        self._loop = None
+        self._file = None
+        self.stats = {"published": 0, "dropped": 0, "written": 0, "batches": 0, "failed": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running and self._loop is asyncio.get_running_loop():
+            return
+        if self._file is not None:
+            self._file.close()  # pichle (band ho chuke) event loop wala sink
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, mode="a", encoding="utf-8", buffering=1 << 16)
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._task = asyncio.create_task(self._run(), name="notification-writer")
+
+    def publish(self, line: str) -> bool:
+        """Non-blocking enqueue (event loop thread se call karein). Queue full → False."""
+        try:
+            self._queue.put_nowait(line)
+        except (asyncio.QueueFull, AttributeError):
+            self.stats["dropped"] += 1
+            return False
+        self.stats["published"] += 1
+        return True
+
+    async def stop(self):
+        if not self.running:
+            return
+        await self._queue.put(_STOP)  # pehle ki saari lines likhi jayengi, phir worker band
+        await self._task
+        self._file.close()
+        self._file = None
+        self._task = None
+
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            if batch[0] is not _STOP and self.flush_seconds > 0 and self._queue.qsize() < self.batch_size:
+                await asyncio.sleep(self.flush_seconds)  # thora ruk kar bara batch (kam writes)
+            # Jo kuch abhi queue me pada hai (batch_size tak) sab ek hi write me
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            stop = any(line is _STOP for line in batch)
+            lines = [line for line in batch if line is not _STOP]
+            if lines:
+                try:
+                    await asyncio.to_thread(self._write, lines)
+                except Exception as e:  # OSError, closed file (ValueError), UnicodeEncodeError, ...
+                    self.stats["failed"] += len(lines)
+                    print(f"❌ Notification log write failed ({len(lines)} lines): {type(e).__name__}: {e}")
+            if stop:
+                return
+
+    def _write(self, lines):
+        self._file.write("".join(lines))
+        self._file.flush()
+        self.stats["written"] += len(lines)
+        self.stats["batches"] += 1
+
+
+notifications = NotificationPipeline()
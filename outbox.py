@@ -0,0 +1,201 @@
+# outbox.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Durable email queue (email_outbox table) ke helpers.
+#   - API: enqueue() → sirf INSERT, SMTP ka intezar nahi (constant time response)
+#   - Worker (email_worker.py): claim_batch() → bhejo → complete()
+#
+# GUARANTEES:
+#   - Restart par kuch nahi khota: pending rows DB me rehti hain
+#   - dedupe_key unique hai: same key dobara aaye to naya email nahi banta — do requests ek
+#     sath same key laayen to bhi: haarne wali ka INSERT unique constraint par girta hai aur
+#     use pehle wali row ki id "duplicate" ke sath milti hai (409 nahi)
+#   - Kai worker processes ek sath chal sakte hain: claim "FOR UPDATE SKIP LOCKED"
+#     (MySQL 8 / MariaDB 10.6+) + claimed_by token se hota hai, har row ek hi worker ko milti hai
+#   - Worker crash ho jaye to lease (EMAIL_LEASE_SECONDS) ke baad row dobara claim hoti hai
+#     (at-least-once delivery)
+#
+# ENV VARS:
+#   EMAIL_MAX_ATTEMPTS=5           → itni koshishon ke baad status "failed"
+#   EMAIL_RETRY_BASE_SECONDS=30    → backoff: base * 2^(attempt-1), ±20% jitter
+#   EMAIL_RETRY_MAX_SECONDS=3600   → backoff ki upper limit
+#   EMAIL_LEASE_SECONDS=300        → claim ki muddat (batch bhejne ke time se zyada rakhein)
+# ────────────────────────────────────────────────────────────────
+
+import os
+import random
+import uuid
+from datetime import timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import bindparam, func, select, update
+
+from bulk import bulk_insert
+from models.email_outbox import EmailOutbox, utcnow
+
+MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "30"))
+RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", "3600"))
+LEASE_SECONDS = float(os.getenv("EMAIL_LEASE_SECONDS", "300"))
+
+# Ye statuses worker utha sakta hai ("sending" sirf tab jab lease expire ho chuki ho)
+CLAIMABLE = ("pending", "sending")
+
+# claimed_by column (models/email_outbox.py) ki lambai; token = "<worker_id>:<12 hex>"
+CLAIM_TOKEN_LENGTH = EmailOutbox.claimed_by.type.length
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff (seconds) with jitter, taa-ke sab retries ek sath na takrayen."""
+    delay = min(RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _existing_ids(db, keys) -> dict:
+    """dedupe_key → outbox id (sirf jo keys pehle se table me hain)."""
+    if not keys:
+        return {}
+    return dict(db.execute(
+        select(EmailOutbox.dedupe_key, EmailOutbox.id).where(EmailOutbox.dedupe_key.in_(keys))
+    ).all())
+
+
+def enqueue(db, messages: list) -> list:
+    """
+    Step by step:
+    1. dedupe_key wale messages ke liye ek query me check: pehle se queue me hain?
+    2. Payload ke andar bhi same key dobara ho to sirf pehla message
+    3. Baqi sab ek bulk INSERT me (bulk.bulk_insert partial mode, ek commit)
+    4. Race: check ke baad kisi aur request ne wahi key daal di → wo row unique constraint par
+       akeli fail hoti hai (baqi insert); us key ki id dobara padh kar "duplicate"
+
+    messages: [{"receiver", "subject", "body", "dedupe_key" (optional)}]
+    Returns: har message ke liye {"id", "status": "queued" | "duplicate"}, input order me
+    """
+    keys = {m["dedupe_key"] for m in messages if m.get("dedupe_key")}
+    existing = _existing_ids(db, keys)
+
+    results = [None] * len(messages)
+    rows, first_index, dup_of = [], {}, {}
+    for index, m in enumerate(messages):
+        key = m.get("dedupe_key") or None
+        if key in existing:
+            results[index] = {"id": existing[key], "status": "duplicate"}
+            continue
+        if key is not None and key in first_index:
+            results[index] = {"id": None, "status": "duplicate"}
+            dup_of[index] = first_index[key]
+            continue
+        if key is not None:
+            first_index[key] = index
+        results[index] = {"id": None, "status": "queued"}
+        rows.append((index, {
+            "receiver": m["receiver"],
+            "subject": m["subject"],
+            "body": m["body"],
+            "dedupe_key": key,
+        }))
+
+    if rows:
+        ids, errors = bulk_insert(db, EmailOutbox, rows, partial=True)
+        for index, new_id in ids.items():
+            results[index]["id"] = new_id
+        if errors:
+            key_of = {index: data["dedupe_key"] for index, data in rows}
+            raced = _existing_ids(db, {key_of[e["index"]] for e in errors if key_of[e["index"]]})
+            unexplained = [e for e in errors if key_of[e["index"]] not in raced]
+            if unexplained:
+                raise HTTPException(status_code=409, detail={
+                    "message": "Some emails could not be queued", "errors": unexplained,
+                })
+            for e in errors:
+                results[e["index"]] = {"id": raced[key_of[e["index"]]], "status": "duplicate"}
+    for index, first in dup_of.items():
+        results[index]["id"] = results[first]["id"]
+    return results
+
+
+def claim_batch(db, worker_id: str, limit: int):
+    """
+    Due rows (pending, ya "sending" jinki lease expire ho chuki) claim karta hai.
+    Returns: (token, rows) — rows me id, receiver, subject, body, attempts.
+    """
+    now = utcnow()
+    due = (
+        EmailOutbox.status.in_(CLAIMABLE),
+        EmailOutbox.next_attempt_at <= now,
+    )
+    ids = db.execute(
+        select(EmailOutbox.id)
+        .where(*due)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)  # SQLite par ignore hota hai (wahan ek writer hota hai)
+    ).scalars().all()
+    if not ids:
+        db.rollback()
+        return None, []
+
+    # Conditional UPDATE: do workers same id select kar bhi lein to row sirf ek ke naam hogi
+    # worker_id = "<hostname>:<pid>" — lambe hostnames (e.g. Kubernetes pods) column se bahar na jayen;
+    # uniqueness uuid hissa deta hai, worker_id sirf pehchaan ke liye
+    suffix = f":{uuid.uuid4().hex[:12]}"
+    token = worker_id[:CLAIM_TOKEN_LENGTH - len(suffix)] + suffix
+    db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(ids), *due)
+        .values(
+            status="sending",
+            claimed_by=token,
+            attempts=EmailOutbox.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=LEASE_SECONDS),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    rows = db.execute(
+        select(EmailOutbox.id, EmailOutbox.receiver, EmailOutbox.subject,
+               EmailOutbox.body, EmailOutbox.attempts)
+        .where(EmailOutbox.id.in_(ids), EmailOutbox.claimed_by == token)
+        .order_by(EmailOutbox.id)
+    ).all()
+    return token, rows
+
+
+def complete(db, token: str, rows, results):
+    """
+    Send results DB me likhta hai (ek executemany UPDATE):
+    ok → "sent"; fail → backoff ke sath "pending", ya max attempts par "failed".
+    Sirf wahi rows update hoti hain jo abhi bhi is token ke naam hain.
+    """
+    now = utcnow()
+    params = []
+    for row, (ok, error) in zip(rows, results):
+        if ok:
+            params.append({"_id": row.id, "_token": token, "status": "sent", "sent_at": now,
+                           "last_error": None, "next_attempt_at": now})
+        elif row.attempts >= MAX_ATTEMPTS:
+            params.append({"_id": row.id, "_token": token, "status": "failed", "sent_at": None,
+                           "last_error": error, "next_attempt_at": now})
+        else:
+            retry_at = now + timedelta(seconds=retry_delay(row.attempts))
+            params.append({"_id": row.id, "_token": token, "status": "pending", "sent_at": None,
+                           "last_error": error, "next_attempt_at": retry_at})
+    if not params:
+        return
+
+    table = EmailOutbox.__table__
+    db.execute(
+        update(table)
+        .where(table.c.id == bindparam("_id"), table.c.claimed_by == bindparam("_token")),
+        params,  # baqi keys (status, sent_at, ...) SET clause ban jati hain
+    )
+    db.commit()
+
+
+def status_counts(db) -> dict:
+    """{status: count} — /email/health ke liye (status index se GROUP BY)."""
+    return dict(db.execute(
+        select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+    ).all())
@@ -0,0 +1,109 @@
+# pagination.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   List endpoints ke liye keyset (cursor) pagination helpers.
+#   - OFFSET ki jagah "WHERE id > last_id ORDER BY id LIMIT n" use hota hai,
+#     is liye har page ka cost table size se independent rehta hai
+#   - Cursor opaque hai (base64 JSON), client ko sirf wapas bhejna hota hai
+#
+# CONTRACT:
+#   GET /<resource>/list?limit=100&after=<next_cursor>
+#   Response me "page": {"limit", "next_cursor", "has_more"} milta hai.
+#   next_cursor None ho to aakhri page aa chuka hai.
+# ────────────────────────────────────────────────────────────────
+
+import base64
+import binascii
+import json
+from typing import Optional
+
+from fastapi import HTTPException, Query
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def encode_token(data: dict) -> str:
+    """Dict → opaque, URL-safe cursor string (base64 JSON)."""
+    raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_token(cursor: str) -> dict:
+    """encode_token ka ulta; ghalat string par ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError) as exc:
+        raise ValueError(str(exc)) from exc
+    if not isinstance(data, dict):
+        raise ValueError("cursor is not an object")
+    return data
+
+
+def encode_cursor(last_id: int) -> str:
+    """Last row ki id ko opaque, URL-safe cursor string me badalta hai."""
+    return encode_token({"id": last_id})
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Cursor se id wapas nikalta hai; ghalat cursor par 400 raise hota hai."""
+    if not cursor:
+        return None
+    try:
+        return int(decode_token(cursor)["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+class PageParams:
+    """
+    FastAPI dependency: ?limit= aur ?after= query params parse karta hai.
+    Usage: page: PageParams = Depends(PageParams)
+    """
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Rows per page"),
+        after: Optional[str] = Query(None, description="Pichle page ka next_cursor"),
+    ):
+        self.limit = limit
+        self.after_id = decode_cursor(after)
+
+
+def paginate(db, stmt, id_column, page: PageParams, descending: bool = False):
+    """
+    Step by step:
+    1. Agar cursor diya hai to sirf us id ke baad wali rows lo (id > after_id)
+    2. id ke order me limit + 1 rows lo (extra row se pata chalta hai aage data hai ya nahi)
+    3. (rows, page_info) return karo
+
+    stmt column-projected hona chahiye (select(*columns)) aur usme "id" column hona zaroori hai.
+    descending=True → latest pehle (id < after_id, ORDER BY id DESC), e.g. UI lists.
+    """
+    items = db.execute(_page_stmt(stmt, id_column, page, descending)).all()
+    return _page_result(items, page)
+
+
+async def paginate_async(db, stmt, id_column, page: PageParams, descending: bool = False):
+    """paginate() ka AsyncSession version (same contract)."""
+    items = (await db.execute(_page_stmt(stmt, id_column, page, descending))).all()
+    return _page_result(items, page)
+
+
+def _page_stmt(stmt, id_column, page: PageParams, descending: bool = False):
+    if descending:
+        if page.after_id is not None:
+            stmt = stmt.where(id_column < page.after_id)
+        return stmt.order_by(id_column.desc()).limit(page.limit + 1)
+    if page.after_id is not None:
+        stmt = stmt.where(id_column > page.after_id)
+    return stmt.order_by(id_column).limit(page.limit + 1)
+
+
+def _page_result(items, page: PageParams):
+    has_more = len(items) > page.limit
+    items = items[:page.limit]
+    next_cursor = encode_cursor(items[-1].id) if has_more else None
+
+    return items, {"limit": page.limit, "next_cursor": next_cursor, "has_more": has_more}
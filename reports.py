@@ -0,0 +1,204 @@
+# reports.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /invoices/reports ka engine (receivables analysis, spreadsheet export ki jagah).
+#   - Aging buckets (0-30 / 31-60 / 61-90 / 90+ din due date se guzre), overall + per client
+#   - Revenue per month (issued_date ke hisaab se invoiced / paid / outstanding)
+#   - Per-client totals (projects.client_id se) + DSO (days sales outstanding)
+#
+# DESIGN:
+#   Grouping SQL me hoti hai (GROUP BY client / bucket / month) — DB se sirf
+#   aggregated rows aati hain, chahe invoices 1M hon. Baqi kaam (pivot, month gaps
+#   bharna, DSO, totals) NumPy arrays par vectorized hota hai (per-row Python loop nahi).
+#   Aging bucket ka CASE sirf date comparisons hai, is liye MySQL/SQLite dono par chalta hai.
+#
+# DEFINITIONS:
+#   outstanding  = paid_status != "paid" (NULL bhi unpaid) wale invoices ka amount
+#   aging days   = as_of - COALESCE(due_date, issued_date); abhi due nahi → 0-30 bucket
+#   DSO          = receivable (as_of tak) / sales (pichle period_days) × period_days
+# ────────────────────────────────────────────────────────────────
+
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import case, extract, func, select
+
+from models.client import Client
+from models.invoice import Invoice
+from models.project import Project
+
+AGING_BUCKETS = ("0-30", "31-60", "61-90", "90+")
+_BUCKET_DAYS = (30, 60, 90)  # har bucket ki upper limit (aakhri bucket open-ended)
+
+
+def _is_outstanding():
+    return func.coalesce(Invoice.paid_status, "unpaid") != "paid"
+
+
+def _active_invoices(stmt):
+    """Invoices ⋈ active projects (client_id ke liye), soft-deleted rows bahar."""
+    return (
+        stmt.join(Project, Project.id == Invoice.project_id)
+        .where(Invoice.is_deleted == 0, Project.is_deleted == 0)
+    )
+
+
+def _columns(rows, n: int):
+    """Aggregated rows → n columns (tuples); khali result par khali tuples."""
+    return list(zip(*rows)) if rows else [()] * n
+
+
+def _amounts(values) -> np.ndarray:
+    # SUM(Numeric) Decimal/None aata hai → float64 array
+    return np.array([float(v or 0) for v in values], dtype=np.float64)
+
+
+def _round(arr) -> list:
+    return np.round(arr, 2).tolist()
+
+
+def aging_report(db, as_of: date) -> dict:
+    """
+    Step by step:
+    1. SQL: outstanding invoices ko (client_id, bucket) par GROUP BY → SUM(amount), COUNT
+    2. NumPy: client ids ko index me map karke [clients × buckets] matrix (np.add.at)
+    3. Totals = matrix ka column sum
+    """
+    ref = func.coalesce(Invoice.due_date, Invoice.issued_date)
+    bucket = case(
+        *[(ref >= as_of - timedelta(days=days), i) for i, days in enumerate(_BUCKET_DAYS)],
+        else_=len(_BUCKET_DAYS),
+    ).label("bucket")
+
+    stmt = _active_invoices(
+        select(Project.client_id, bucket, func.sum(Invoice.amount), func.count())
+        .select_from(Invoice)
+    ).where(_is_outstanding(), Invoice.issued_date <= as_of).group_by(Project.client_id, bucket)
+    client_ids, buckets, amounts, counts = _columns(db.execute(stmt).all(), 4)
+
+    clients, client_index = np.unique(np.array(client_ids, dtype=np.int64), return_inverse=True)
+    bucket_index = np.array(buckets, dtype=np.int64)
+    matrix = np.zeros((len(clients), len(AGING_BUCKETS)))
+    np.add.at(matrix, (client_index, bucket_index), _amounts(amounts))
+    count_totals = np.bincount(bucket_index, weights=np.array(counts, dtype=np.float64),
+                               minlength=len(AGING_BUCKETS))
+
+    return {
+        "buckets": dict(zip(AGING_BUCKETS, _round(matrix.sum(axis=0)))),
+        "counts": dict(zip(AGING_BUCKETS, count_totals.astype(int).tolist())),
+        "by_client": {
+            str(cid): dict(zip(AGING_BUCKETS, row))
+            for cid, row in zip(clients.tolist(), _round(matrix))
+        },
+    }
+
+
+def revenue_by_month(db, start: date, end: date) -> list:
+    """
+    SQL: issued_date ke (year, month) par GROUP BY. NumPy: start..end ke har month ka
+    slot (datetime64[M]); jis month me koi invoice nahi wahan 0.
+    """
+    year = extract("year", Invoice.issued_date).label("y")
+    month = extract("month", Invoice.issued_date).label("m")
+    paid = case((_is_outstanding(), 0), else_=Invoice.amount)
+    stmt = _active_invoices(
+        select(year, month, func.sum(Invoice.amount), func.sum(paid), func.count())
+        .select_from(Invoice)
+    ).where(Invoice.issued_date >= start, Invoice.issued_date <= end).group_by(year, month)
+    years, months, invoiced, paid_sums, counts = _columns(db.execute(stmt).all(), 5)
+
+    first = np.datetime64(start, "M")
+    slots = np.arange(first, np.datetime64(end, "M") + 1, dtype="datetime64[M]")
+    # (year, month) → slot index: months since 1970-01 minus first month
+    index = (np.array(years, dtype=np.int64) - 1970) * 12 + np.array(months, dtype=np.int64) - 1
+    index -= first.astype(np.int64)
+
+    series = np.zeros((3, len(slots)))
+    np.add.at(series[0], index, _amounts(invoiced))
+    np.add.at(series[1], index, _amounts(paid_sums))
+    np.add.at(series[2], index, np.array(counts, dtype=np.float64))
+
+    invoiced_s, paid_s = np.round(series[0], 2), np.round(series[1], 2)
+    outstanding_s = np.round(series[0] - series[1], 2)
+    return [
+        {"month": str(m), "invoiced": i, "paid": p, "outstanding": o, "count": c}
+        for m, i, p, o, c in zip(slots, invoiced_s.tolist(), paid_s.tolist(),
+                                 outstanding_s.tolist(), series[2].astype(int).tolist())
+    ]
+
+
+def _dso(receivable, sales, period_days: int):
+    """Vectorized DSO; jahan period me sales 0 ho wahan None."""
+    receivable, sales = np.asarray(receivable, dtype=np.float64), np.asarray(sales, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dso = np.where(sales > 0, receivable / sales * period_days, np.nan)
+    return [None if np.isnan(v) else round(float(v), 1) for v in np.atleast_1d(dso)]
+
+
+def client_totals(db, as_of: date, period_days: int) -> dict:
+    """
+    SQL: client par GROUP BY, conditional SUMs se ek hi pass me
+    invoiced / paid / receivable (as_of tak) / period sales.
+    NumPy: per-client aur overall DSO.
+    """
+    period_start = as_of - timedelta(days=period_days)
+    issued_by_as_of = Invoice.issued_date <= as_of
+    stmt = _active_invoices(
+        select(
+            Project.client_id,
+            Client.name,
+            func.count(),
+            func.sum(Invoice.amount),
+            func.sum(case((_is_outstanding(), 0), else_=Invoice.amount)),
+            func.sum(case((_is_outstanding() & issued_by_as_of, Invoice.amount), else_=0)),
+            func.sum(case(((Invoice.issued_date > period_start) & issued_by_as_of, Invoice.amount), else_=0)),
+        )
+        .select_from(Invoice)
+    ).join(Client, Client.id == Project.client_id).group_by(Project.client_id, Client.name)
+    client_ids, names, counts, invoiced, paid, receivable, sales = _columns(db.execute(stmt).all(), 7)
+
+    invoiced, paid = _amounts(invoiced), _amounts(paid)
+    receivable, sales = _amounts(receivable), _amounts(sales)
+    dso = _dso(receivable, sales, period_days)
+
+    clients = {
+        str(cid): {
+            "name": name, "invoices": count, "invoiced": inv, "paid": pd_, "receivable": rec,
+            "period_sales": sal, "dso": d,
+        }
+        for cid, name, count, inv, pd_, rec, sal, d in zip(
+            client_ids, names, counts, _round(invoiced), _round(paid),
+            _round(receivable), _round(sales), dso,
+        )
+    }
+    total_receivable, total_sales = receivable.sum(), sales.sum()
+    return {
+        "clients": clients,
+        "totals": {
+            "invoices": int(sum(counts)),
+            "invoiced": round(float(invoiced.sum()), 2),
+            "paid": round(float(paid.sum()), 2),
+            "receivable": round(float(total_receivable), 2),
+            "period_sales": round(float(total_sales), 2),
+            "dso": _dso([total_receivable], [total_sales], period_days)[0],
+        },
+    }
+
+
+def invoice_reports(db, as_of: date = None, months: int = 12, period_days: int = 90) -> dict:
+    """Poori report: 3 aggregate queries (aging, monthly revenue, client totals)."""
+    as_of = as_of or date.today()
+    first_month = date(as_of.year, as_of.month, 1)
+    for _ in range(months - 1):
+        first_month = (first_month - timedelta(days=1)).replace(day=1)
+
+    totals = client_totals(db, as_of, period_days)
+    return {
+        "as_of": as_of.isoformat(),
+        "period_days": period_days,
+        "dso": totals["totals"]["dso"],
+        "totals": totals["totals"],
+        "aging": aging_report(db, as_of),
+        "revenue_by_month": revenue_by_month(db, first_month, as_of),
+        "clients": totals["clients"],
+    }
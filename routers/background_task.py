@@ -1,31 +1,21 @@
-from fastapi import APIRouter, BackgroundTasks
-from datetime import datetime
-from pathlib import Path
+from fastapi import APIRouter, HTTPException
 
-router = APIRouter(prefix="/background", tags=["Background Tasks"])
-
-# LOG_FILE = Path(__file__).resolve().parent.parent / "log.txt"  # project root/log.txt
-
-# def write_notification(email: str, message: str = ""):
-#     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-#     with open(LOG_FILE, mode="a", encoding="utf-8") as f:
-#         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-#         f.write(f"[{ts}] Notification for {email}: {message}\n")
-        
-def write_notification(email: str, message=""):
-    for i in range(200_000):
-        print(f"Preparing notification {i} for {email}")
-        
-    # with open("log.txt", mode="w") as email_file:
-    #     content = f"notification for {email}: {message}"
-    #     email_file.write(content)
+from notifications import notifications, render_notification
 
+router = APIRouter(prefix="/background", tags=["Background Tasks"])
 
-# for i in range(20_000):
-#     write_notification(f"user{i}@example.com", f"test message {i}")
+# ⚡ Pehle yahan har request threadpool me 200k print() chalati thi (stdout par
+# serialize, doosri requests starve). Ab message ek dafa render hota hai aur
+# bounded queue me jata hai; async worker (notifications.py) usay batches me
+# buffered log file (NOTIFICATION_LOG_FILE, default logs/notifications.log) me
+# likhta hai. Request sirf O(1) enqueue karti hai.
 
 @router.post("/send-notification/{email}")
-async def send_notification(email: str, background_tasks: BackgroundTasks):
-    background_tasks.add_task(write_notification, email, message="some notification")
+async def send_notification(email: str):
+    await notifications.start()  # no-op jab main.py startup hook pehle hi start kar chuka ho
+
+    if not notifications.publish(render_notification(email, "some notification")):
+        # Queue full: memory bounded rakhne ke liye reject, client thori der baad retry kare
+        raise HTTPException(status_code=503, detail="Notification queue is full, retry later",
+                            headers={"Retry-After": "1"})
     return {"message": f"Notification scheduled for {email}"}
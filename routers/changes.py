@@ -0,0 +1,59 @@
+# routers/changes.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Delta sync API (engine: change_feed.py).
+#   GET /changes                       → shuru se (pehli sync: poora data pages me)
+#   GET /changes?since=<next_cursor>   → sirf wo rows jo pichli sync ke baad bani/badli/delete huin
+#   GET /changes?entities=projects,tasks&limit=200
+#
+# CLIENT LOOP:
+#   cursor = saved_cursor
+#   repeat: GET /changes?since=cursor → changes apply karo (upsert / delete) → cursor = page.next_cursor
+#   until page.has_more == false; cursor save karo, agli poll usi se.
+# ────────────────────────────────────────────────────────────────
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from change_feed import ENTITIES, changes_since
+from database import get_db
+from serialization import FastJSONResponse
+
+router = APIRouter(prefix="/changes", tags=["Changes"])
+
+
+def ok(message, data=None, page=None):
+    body = {"status": "success", "message": message, "data": data}
+    if page is not None:
+        body["page"] = page
+    return body
+
+
+@router.get("")
+def list_changes(
+    since: Optional[str] = Query(None, description="Pichle response ka page.next_cursor"),
+    limit: int = Query(500, ge=1, le=1000),
+    entities: Optional[str] = Query(None, description="Comma-separated: " + ",".join(ENTITIES)),
+    db: Session = Depends(get_db),
+):
+    """
+    Step by step:
+    1. entities validate (default: saari 4 tables)
+    2. Cursor ke baad ke changes (change_seq = commit order, entity, id) order me, ek feed query
+    3. Upsert rows ka data per entity ek query; soft-deleted rows "op": "delete" (data null)
+    """
+    names = None
+    if entities:
+        names = [name.strip() for name in entities.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(ENTITIES))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown entities: {', '.join(unknown)}")
+
+    try:
+        changes, page = changes_since(db, since, limit, names)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid since cursor")
+
+    return FastJSONResponse(ok(f"{len(changes)} changes", changes, page))
@@ -1,8 +1,11 @@
 # routers/client.py (or routers/clients.py)
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from database import get_db
 from models.client import Client
+from summary import client_summaries
+from cache import response_cache
+from conditional import conditional_get
 
 router = APIRouter(prefix="/clients", tags=["Clients"])
 
@@ -11,11 +14,30 @@ def view_client_page(client_id: int, request: Request, db: Session = Depends(get
     """
     HTML page: show a single client's full details.
     URL: /clients/view/<id>
+    Cache: page clients/projects/tasks/invoices me se kisi par bhi write hone tak cache se.
+    ETag: If-None-Match same ho to 304.
     """
-    obj = db.query(Client).filter(Client.id == client_id, Client.is_deleted == 0).first()
+    tables = ("clients", "projects", "tasks", "invoices")
+    return conditional_get(
+        request, db, tables,
+        lambda: response_cache.cached(request, tables, lambda: _render_client_page(client_id, request, db)),
+    )
+
+
+def _render_client_page(client_id: int, request: Request, db: Session):
+    # raiseload("*"): page sirf client ke apne columns dikhata hai, projects graph load na ho
+    obj = (
+        db.query(Client)
+        .options(raiseload("*"))
+        .filter(Client.id == client_id, Client.is_deleted == 0)
+        .first()
+    )
     if not obj:
         raise HTTPException(status_code=404, detail="Client not found")
 
+    # Mini stats: ek grouped query (projects/tasks load nahi hote)
+    summary = client_summaries(db, [obj.id]).get(obj.id, {})
+
     # Render the new template
     return request.app.state.templates.TemplateResponse(
         "client_detail.html",
@@ -28,6 +50,10 @@ def view_client_page(client_id: int, request: Request, db: Session = Depends(get
                 "phone": obj.phone,
                 "company_name": obj.company_name,
                 "address": obj.address,
+                "projects_count": summary.get("projects_count", 0),
+                "open_tasks": summary.get("open_tasks", 0),
+                "outstanding": float(summary.get("outstanding", 0)),
+                "version": obj.updated_at,  # header fragment (templating.py) isi version tak cached
             },
         }
     )
@@ -1,6 +1,13 @@
-from fastapi import APIRouter, Depends
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from database import get_db
+from cache import response_cache
+from conditional import conditional_get
+from bulk import MAX_BULK_ROWS, BulkParams, check_unique, run_bulk
+from pagination import PageParams, paginate
+from serialization import FastJSONResponse, rows_to_dicts, schema_columns
 from models.client import Client
 from schemas.client import ClientCreate, ClientOut
 
@@ -8,12 +15,34 @@ from schemas.client import ClientCreate, ClientOut
 router = APIRouter(prefix="/clients", tags=["Clients"])
 
 # ✅ Common function: har response same format me bhejna
-def make_response(message, data=None):
-    return {
+def make_response(message, data=None, page=None):
+    body = {
         "status": "success",
         "message": message,
         "data": data
     }
+    # List endpoints pagination info bhi bhejte hain (next_cursor waghera)
+    if page is not None:
+        body["page"] = page
+    return body
+
+
+# ✅ Shared query builder (sync aur async routers dono isay use karte hain)
+def active_clients_query(company_name=None):
+    """Active clients ka column-projected SELECT; filter SQL me hi lagta hai."""
+    stmt = select(*schema_columns(ClientOut, Client)).where(Client.is_deleted == 0)
+    if company_name is not None:
+        stmt = stmt.where(Client.company_name == company_name)
+    return stmt
+
+
+# ✅ Shared bulk flow (sync aur async routers dono isay use karte hain)
+def bulk_create_clients_in(db, payload, params):
+    """Clients validate + email uniqueness check (ek query) + chunked insert; result dict return karta hai."""
+    return run_bulk(
+        db, Client, ClientCreate, payload, params,
+        checks=[lambda db, rows: check_unique(db, rows, Client.email)],
+    )
 
 
 # 🟢 ROUTE 1: Create (naya client add karna)
@@ -44,24 +73,58 @@ def create_client(request: ClientCreate, db: Session = Depends(get_db)):
     )
 
 
-# 🔵 ROUTE 2: List (sab clients dikhana)
+# 🔵 ROUTE 2: List clients (keyset paginated)
 @router.get("/list")
-def list_clients(db: Session = Depends(get_db)):
+def list_clients(
+    request: Request,
+    page: PageParams = Depends(PageParams),
+    company_name: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
     """
     Step by step:
-    1. Database se sab clients laao jinka 'is_deleted = 0' hai
-    2. Unko readable format (dict) me convert karo
-    3. Return karo ek success message aur list of clients
+    1. Sirf active clients ('is_deleted = 0') ki query banao
+    2. Filter (company_name) SQL me hi laga do
+    3. Ek page (limit rows, id > after) laao aur dict me convert karo
+    4. Return karo success message + next_cursor ke sath
+
+    Cache: same path + query ka response cache se aata hai (clients par write hote hi invalid).
+    Fast path: sirf ClientOut ke columns SELECT hote hain (projects/tasks graph
+    ya per-row Pydantic validation nahi) aur response orjson se encode hota hai.
     """
 
-    # 1️⃣ Database se clients lo (jo delete nahi hue)
-    clients = db.query(Client).filter(Client.is_deleted == 0).all()
+    def build():
+        # 1️⃣ Base query + 2️⃣ filter
+        stmt = active_clients_query(company_name)
 
-    # 2️⃣ Har client ko schema (ClientOut) ke through dict me badlo
-    client_list = [ClientOut.from_orm(c).dict() for c in clients]
+        # 3️⃣ Sirf ek page DB se aata hai, poori table nahi
+        rows, page_info = paginate(db, stmt, Client.id, page)
 
-    # 3️⃣ Return response
-    return make_response(
-        "All active clients fetched successfully!",
-        client_list
-    )
+        # 4️⃣ Return response
+        return FastJSONResponse(make_response(
+            "Active clients fetched successfully!",
+            rows_to_dicts(rows),
+            page_info
+        ))
+
+    # If-None-Match match ho to 304 (build/cache tak baat hi nahi pohanchti)
+    return conditional_get(request, db, ("clients",),
+                           lambda: response_cache.cached(request, ("clients",), build))
+
+
+# 🟠 ROUTE 3: Bulk create clients (ek request, ek transaction)
+@router.post("/bulk")
+def bulk_create_clients(
+    payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ROWS),
+    params: BulkParams = Depends(BulkParams),
+    db: Session = Depends(get_db),
+):
+    """
+    Step by step:
+    1. ClientCreate jaisi rows ki list aati hai
+    2. Sab rows ek pass me validate hoti hain; duplicate emails ek query me pakri jati hain
+    3. Rows chunk_size ke chunks me multi-row INSERT se ek transaction me save hoti hain
+    4. Generated ids input order me return hoti hain (partial=true par per-row errors bhi)
+    """
+    result = bulk_create_clients_in(db, payload, params)
+    return make_response(f"{result['inserted']} clients created", result)
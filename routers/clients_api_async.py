@@ -0,0 +1,73 @@
+# routers/clients_api_async.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   routers/clients_api.py ka async version (USE_ASYNC_DB=1 par main.py isay mount karta hai).
+#   Same URLs, same response shape; sirf DB access AsyncSession se hota hai.
+# ────────────────────────────────────────────────────────────────
+
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
+from cache import response_cache
+from conditional import conditional_get_async
+from bulk import MAX_BULK_ROWS, BulkParams
+from pagination import PageParams, paginate_async
+from serialization import FastJSONResponse, rows_to_dicts
+from models.client import Client
+from schemas.client import ClientCreate, ClientOut
+from routers.clients_api import active_clients_query, bulk_create_clients_in, make_response
+
+router = APIRouter(prefix="/clients", tags=["Clients"])
+
+
+# 🟢 ROUTE 1: Create (naya client add karna)
+@router.post("/create")
+async def create_client(request: ClientCreate, db: AsyncSession = Depends(get_async_db)):
+    """Naya client save karo aur saved data return karo (async)."""
+    new_client = Client(**request.model_dump())
+    db.add(new_client)
+    await db.commit()
+    await db.refresh(new_client)
+
+    return make_response(
+        "New client created successfully!",
+        ClientOut.model_validate(new_client).model_dump()
+    )
+
+
+# 🔵 ROUTE 2: List clients (keyset paginated)
+@router.get("/list")
+async def list_clients(
+    request: Request,
+    page: PageParams = Depends(PageParams),
+    company_name: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sync /clients/list jaisa hi contract (filter + limit/after cursor)."""
+    async def build():
+        stmt = active_clients_query(company_name)
+        rows, page_info = await paginate_async(db, stmt, Client.id, page)
+
+        return FastJSONResponse(make_response(
+            "Active clients fetched successfully!",
+            rows_to_dicts(rows),
+            page_info
+        ))
+
+    return await conditional_get_async(
+        request, db, ("clients",),
+        lambda: response_cache.cached_async(request, ("clients",), build),
+    )
+
+
+# 🟠 Bulk create clients (sync bulk flow AsyncSession.run_sync ke andar, ek transaction)
+@router.post("/bulk")
+async def bulk_create_clients(
+    payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ROWS),
+    params: BulkParams = Depends(BulkParams),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sync /clients/bulk jaisa hi contract (chunk_size, partial, ids input order me)."""
+    result = await db.run_sync(lambda session: bulk_create_clients_in(session, payload, params))
+    return make_response(f"{result['inserted']} clients created", result)
@@ -0,0 +1,74 @@
+# routers/dashboard.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Dashboard JSON (counters summary.py ki grouped SQL queries se aate hain).
+#   GET /dashboard                      → har active client ke counters + totals
+#   GET /dashboard/clients/{client_id}  → ek client ke counters + per-project breakdown
+#
+#   "clients" / "projects" JSON objects hain jinki keys ids hain, taa-ke frontend
+#   kisi bhi client ka data O(1) me utha sake (list me dhoondna na pare).
+#
+#   Dono endpoints response_cache (cache.py) + conditional_get (conditional.py) ke peeche:
+#   grouped aggregation sirf tab chalti hai jab DASHBOARD_TABLES me se koi table badle;
+#   client ka ETag same ho to 304.
+# ────────────────────────────────────────────────────────────────
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from cache import response_cache
+from conditional import conditional_get
+from database import get_db
+from serialization import FastJSONResponse
+from summary import client_summaries, project_summaries, totals
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+# Counters in chaaron tables se bante hain (summary.py)
+DASHBOARD_TABLES = ("clients", "projects", "tasks", "invoices")
+
+
+def ok(message, data=None):
+    return {"status": "success", "message": message, "data": data}
+
+
+def _keyed(summaries: dict) -> dict:
+    # JSON object keys string hoti hain
+    return {str(key): value for key, value in summaries.items()}
+
+
+@router.get("")
+def dashboard(request: Request, db: Session = Depends(get_db)):
+    """
+    Step by step:
+    1. Tables na badli hon → 304 (If-None-Match) ya cached bytes, koi aggregation nahi
+    2. Warna ek query: har client ke projects/tasks/invoices counters
+    3. Totals Python me (clients ki tadaad jitna kaam, rows jitna nahi)
+    """
+
+    def build():
+        summaries = client_summaries(db)
+        return FastJSONResponse(ok("Dashboard summary", {
+            "totals": totals(summaries),
+            "clients": _keyed(summaries),
+        }))
+
+    return conditional_get(request, db, DASHBOARD_TABLES,
+                           lambda: response_cache.cached(request, DASHBOARD_TABLES, build))
+
+
+@router.get("/clients/{client_id}")
+def client_dashboard(client_id: int, request: Request, db: Session = Depends(get_db)):
+
+    def build():
+        summary = client_summaries(db, [client_id]).get(client_id)
+        if summary is None:
+            raise HTTPException(status_code=404, detail="Client not found")
+        return FastJSONResponse(ok("Client summary", {
+            "client_id": client_id,
+            **summary,
+            "projects": _keyed(project_summaries(db, client_id)),
+        }))
+
+    return conditional_get(request, db, DASHBOARD_TABLES,
+                           lambda: response_cache.cached(request, DASHBOARD_TABLES, build))
@@ -1,61 +1,85 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException
-from pydantic import BaseModel, EmailStr
-import smtplib, ssl
-from email.message import EmailMessage
-import os
+from fastapi import APIRouter, Depends, Header, HTTPException
+from pydantic import BaseModel, EmailStr, Field
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from database import get_db
+from models.email_outbox import EmailOutbox
+from outbox import enqueue, status_counts
+from smtp_pool import SMTP_PORT, SMTP_SERVER, SENDER_EMAIL as SENDER, get_smtp_pool
 
 router = APIRouter(prefix="/email", tags=["Email"])
 
-# ---- Config (env vars recommended) ----
-SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.zoho.com")      # or "smtppro.zoho.com"
-SMTP_PORT   = int(os.getenv("SMTP_PORT", "465"))             # 465=SSL, 587=STARTTLS
-USERNAME    = os.getenv("SMTP_USERNAME", "you@yourdomain.com")
-PASSWORD    = os.getenv("SMTP_PASSWORD", "your_app_password")
-SENDER      = os.getenv("SENDER_EMAIL", USERNAME)
+# ---- Config: env vars smtp_pool.py me parhe jate hain ----
+# SMTP_SERVER / SMTP_PORT (465=SSL, 587=STARTTLS) / SMTP_USERNAME / SMTP_PASSWORD / SENDER_EMAIL
+# SMTP_SECURITY, SMTP_POOL_SIZE, SMTP_MAX_MESSAGES_PER_CONN, SMTP_IDLE_TIMEOUT
+#
+# ⚡ Emails ab web process me nahi bheje jate: /send aur /send-batch sirf email_outbox
+# table me row likhte hain (constant time), aur `python email_worker.py` unhein
+# retries/backoff ke sath bhejta hai. Restart par bhi queue me pade emails nahi khote.
+
+MAX_BATCH_EMAILS = 1000
 
 class EmailRequest(BaseModel):
     receiver: EmailStr
     subject: str = "Hello"
     body: str = "Test"
+    # Same key dobara bheji jaye to naya email queue nahi hota (client retries ke liye)
+    dedupe_key: Optional[str] = Field(None, max_length=128)
 
-def send_email_now(receiver: str, subject: str, body: str):
-    msg = EmailMessage()
-    msg["From"] = SENDER
-    msg["To"] = receiver
-    msg["Subject"] = subject
-    msg.set_content(body)
-
-    ctx = ssl.create_default_context()
-
-    # Choose SSL (465) or STARTTLS (587) automatically based on port
-    if SMTP_PORT == 465:
-        with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=ctx) as s:
-            s.login(USERNAME, PASSWORD)
-            s.send_message(msg)
-    else:
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=30) as s:
-            s.ehlo()
-            s.starttls(context=ctx)
-            s.ehlo()
-            s.login(USERNAME, PASSWORD)
-            s.send_message(msg)
+class EmailBatchRequest(BaseModel):
+    messages: List[EmailRequest] = Field(..., min_length=1, max_length=MAX_BATCH_EMAILS)
 
 @router.post("/send")
-async def send_email_api(payload: EmailRequest, background_tasks: BackgroundTasks):
-    try:
-        # Run in background so API responds immediately
-        background_tasks.add_task(
-            send_email_now, payload.receiver, payload.subject, payload.body
-        )
-        return {
-            "status": "scheduled",
-            "to": payload.receiver,
-            "via": f"{SMTP_SERVER}:{SMTP_PORT}",
-        }
-    except Exception as e:
-        # If scheduling itself fails
-        raise HTTPException(status_code=500, detail=f"Failed to schedule email: {e}")
+def send_email_api(
+    payload: EmailRequest,
+    idempotency_key: Optional[str] = Header(None, max_length=128),
+    db: Session = Depends(get_db),
+):
+    # Idempotency-Key header bhi dedupe key ka kaam karta hai
+    message = payload.model_dump()
+    message["dedupe_key"] = payload.dedupe_key or idempotency_key
+    result = enqueue(db, [message])[0]
+    return {
+        "status": result["status"],   # "queued" | "duplicate"
+        "id": result["id"],
+        "to": payload.receiver,
+        "via": f"{SMTP_SERVER}:{SMTP_PORT}",
+    }
+
+@router.post("/send-batch")
+def send_email_batch_api(payload: EmailBatchRequest, db: Session = Depends(get_db)):
+    # Saare messages ek bulk INSERT me queue; worker pool ki connections par bhejta hai
+    results = enqueue(db, [m.model_dump() for m in payload.messages])
+    return {
+        "status": "queued",
+        "count": len(results),
+        "queued": sum(r["status"] == "queued" for r in results),
+        "duplicates": sum(r["status"] == "duplicate" for r in results),
+        "ids": [r["id"] for r in results],
+    }
+
+@router.get("/outbox/{email_id}")
+def email_status(email_id: int, db: Session = Depends(get_db)):
+    row = db.get(EmailOutbox, email_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Email not found")
+    return {
+        "id": row.id,
+        "to": row.receiver,
+        "status": row.status,
+        "attempts": row.attempts,
+        "next_attempt_at": row.next_attempt_at,
+        "last_error": row.last_error,
+        "sent_at": row.sent_at,
+    }
 
 @router.get("/health")
-async def email_health():
-    return {"smtp_server": SMTP_SERVER, "port": SMTP_PORT, "sender": SENDER}
+def email_health(db: Session = Depends(get_db)):
+    return {
+        "smtp_server": SMTP_SERVER,
+        "port": SMTP_PORT,
+        "sender": SENDER,
+        "security": get_smtp_pool().security,
+        "outbox": status_counts(db),
+    }
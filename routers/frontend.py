@@ -6,9 +6,18 @@
 #
 # HIGH-LEVEL FLOW:
 #   1) Database se Project + Client ko ek hi query me JOIN karke fetch karte hain
+#      (filters: status, client_id, start date range — sab SQL me)
 #   2) Raw DB rows ko simple Python dicts me map karte hain (template-friendly)
 #   3) Jinja template 'projects_list.html' ko data ke sath render kar dete hain
 #
+# MODES:
+#   GET /ui/projects?status=&client_id=&start_from=&start_to=&limit=&after=
+#     → paginated (keyset, latest pehle): ek page render + cache + ETag, "Next" link cursor ke sath
+#   GET /ui/projects?stream=1&<filters>
+#     → saare matching projects, magar streamed: page shell foran flush, rows DB se
+#       batches me aa kar Jinja generate() se chunks me bhejte hain
+#       (TTFB aur server memory project count se independent)
+#
 # REQUIREMENTS:
 #   - main.py me Jinja2Templates configured ho aur app.state.templates set ho
 #   - templates/ folder me 'projects_list.html' file maujood ho
@@ -16,39 +25,82 @@
 #   - database.py me get_db (Session dependency) defined ho
 # ─────────────────────────────────────────────────────────────────────────────
 
-from fastapi import APIRouter, Depends, Request   # APIRouter: routes group karne ke liye
+from datetime import date                         # start date range filters
+from typing import Optional
+from urllib.parse import urlencode                # "Next page" link ka query string
+
+from fastapi import APIRouter, Depends, Query, Request   # APIRouter: routes group karne ke liye
                                                   # Depends: DB session inject karne ke liye
                                                   # Request: template render ke liye required
+from fastapi.responses import StreamingResponse   # stream mode: chunks bante hi bhejo
+from markupsafe import Markup                     # flush marker autoescape na ho
 
 from sqlalchemy.orm import Session                # SQLAlchemy Session type (type hints + clarity)
 from database import get_db                       # get_db: per-request DB session provide karta hai
 from models.project import Project                # ORM model: projects table
 from models.client import Client                  # ORM model: clients table
 from sqlalchemy import select, join               # select: Pythonic SELECT; join: SQL JOIN build karne ke liye
+from cache import response_cache                  # rendered HTML ka read-through cache (writes par invalid)
+from conditional import conditional_get           # ETag / If-None-Match → 304
+from pagination import PageParams, paginate       # keyset pagination (?limit= & ?after=)
+from streaming import iter_batches                # server-side cursor, batch by batch rows
 
 # Router instance:
 #  - prefix="/ui" ka matlab: is file ke sare endpoints /ui se start honge
 #  - tags=["Frontend"] sirf Swagger docs me grouping/labeling ke liye
 router = APIRouter(prefix="/ui", tags=["Frontend"])
 
+STATUSES = ["planned", "ongoing", "on_hold", "completed"]   # filter dropdown ke options
+STREAM_BATCH_SIZE = 500          # stream mode: ek DB batch me itni rows (memory ≈ itni rows)
+STREAM_CHUNK_BYTES = 16 * 1024   # rendered HTML itna jama ho to network par bhej do
+FLUSH = Markup("<!-- flush -->")  # template me is jagah tak ka HTML foran bhejo (shell)
+
 
 @router.get("/projects")
 def projects_page(
     request: Request,               # Jinja templates ko FastAPI me render karne ke liye 'request' pass karna zaroori hota hai
+    status: Optional[str] = None,           # e.g. ?status=ongoing
+    client_id: Optional[int] = None,        # sirf ek client ke projects
+    start_from: Optional[date] = None,      # start_date >= start_from
+    start_to: Optional[date] = None,        # start_date <= start_to
+    stream: bool = Query(False, description="Saare matching projects ek streamed page me (limit/after ignore)"),
+    page: PageParams = Depends(PageParams), # ?limit= & ?after= (keyset cursor)
+    start: int = Query(0, ge=0, description="Pichle pages ki rows (# column ki numbering; Next link khud bhejta hai)"),
     db: Session = Depends(get_db),  # DB session auto-injected; with/close handling automatically hota hai dependency se
 ):
     """
     Endpoint: GET /ui/projects
 
     Step-by-step summary (quick):
-      1) Project + Client ko explicit JOIN ke zariye ek hi query me load karna
+      1) Project + Client ko explicit JOIN ke zariye ek hi query me load karna (filters SQL me)
       2) Result rows ko clean dicts me map karna (None handling, status normalize)
       3) TemplateResponse se 'projects_list.html' render karna (data pass karke)
 
     Kyun JOIN?
       - Taa-ke N+1 (lazy loading) issue na aaye aur single query me dono tables se data mil jaye
       - Performance aur clarity dono improve hoti hai
+
+    Pagination: default ek page (limit rows, latest pehle); "Next" link agla cursor le jata hai,
+                sath ?start= (ab tak ki rows) taa-ke # column har page par 1 se dobara shuru na ho.
+    Stream (?stream=1): poori list, magar rows batches me render + flush hoti hain (memory constant).
+    Cache: rendered page (bytes) cache me rehta hai; projects ya clients par write hote hi invalid.
+           Stream mode cache nahi hota (poora page memory me rakhna hi to bachana hai).
+    ETag: browser ka If-None-Match same ho to 304 (page dobara render/download nahi hota) — dono modes.
     """
+    tables = ("projects", "clients")
+    filters = {"status": status, "client_id": client_id, "start_from": start_from, "start_to": start_to}
+    stmt = _projects_query(**filters)
+    if stream:
+        return conditional_get(request, db, tables, lambda: _stream_projects_page(request, db, stmt, filters))
+    return conditional_get(
+        request, db, tables,
+        lambda: response_cache.cached(request, tables,
+                                      lambda: _render_projects_page(request, db, stmt, page, filters, start)),
+    )
+
+
+def _projects_query(status=None, client_id=None, start_from=None, start_to=None):
+    """Page ka base SELECT (JOIN + filters); ORDER BY / LIMIT mode ke hisaab se baad me lagta hai."""
 
     # ─────────────────────────────────────────────────────────────────────────
     # 1) Explicit JOIN: Project ⟶ Client
@@ -60,7 +112,8 @@ def projects_page(
     # SELECT list me wahi columns pick karo jo page par chahiye:
     #  - Project ke basic fields (id, title, description, start/end/status/budget, client_id)
     #  - Client ka name as "client_name" label (template me readable key name)
-    rows = db.execute(
+    #  - Dono ke updated_at: cached row fragment tabhi reuse ho jab row (ya client) na badli ho
+    stmt = (
         select(
             Project.id,
             Project.title,
@@ -71,57 +124,123 @@ def projects_page(
             Project.status,
             Project.budget,
             Client.name.label("client_name"),
+            Project.updated_at,                            # row fragment ka version (templating.py)
+            Client.updated_at.label("client_updated_at"),  # client rename → row ka version bhi badle
         )
         .select_from(j)                                    # FROM projects JOIN clients ...
         .where(Project.is_deleted == 0,                    # sirf active projects
                Client.is_deleted == 0)                     # sirf active clients
-        .order_by(Project.id.desc())                       # latest projects pehle
-    ).all()                                                # query execute + tamam rows lao
+    )
+    # Filters SQL me hi — Python me rows filter karna = poori table padhna
+    if status:
+        stmt = stmt.where(Project.status == status)
+    if client_id is not None:
+        stmt = stmt.where(Project.client_id == client_id)
+    if start_from is not None:
+        stmt = stmt.where(Project.start_date >= start_from)
+    if start_to is not None:
+        stmt = stmt.where(Project.start_date <= start_to)
+    return stmt
+
+
+def _project_dict(r):
+    """
+    2) Row (mapping) ko template-friendly dict me map karo
+       Why dicts? Jinja me dictionaries aur lists handle karna straight-forward hota hai
+       Normalize:
+         - description None ho to "", taa-ke template me "None" print na ho
+         - status lower-case me aur default "planned" rakho agar NULL ho
+       version: row ka rendered HTML (partials/project_row.html) isi ke sath cache hota hai
+    """
+    return {
+        "id": r["id"],                                             # project primary key
+        "title": r["title"],                                       # project title
+        "description": r["description"] or "",                     # None ko empty string
+        "client_id": r["client_id"],                               # foreign key to client
+        "client_name": r["client_name"],                           # joined client ka naam (label ki wajah se)
+        "start_date": r["start_date"],                             # project start date (ya None)
+        "end_date": r["end_date"],                                 # project end date (ya None)
+        "status": (r["status"] or "planned").lower(),              # normalize to lower; None -> "planned"
+        "budget": r["budget"],                                     # numeric amount (ya None)
+        "version": (r["updated_at"], r["client_updated_at"]),     # fragment cache version
+    }
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # 2) Rows ko template-friendly dicts me map karo
-    #    Why dicts? Jinja me dictionaries aur lists handle karna straight-forward hota hai
-    #    Normalize:
-    #      - description None ho to "", taa-ke template me "None" print na ho
-    #      - status lower-case me aur default "planned" rakho agar NULL ho
-    # ─────────────────────────────────────────────────────────────────────────
-    projects = []  # final list jo template ko jayegi
-    for r in rows:
-        projects.append({
-            "id": r.id,                                            # project primary key
-            "title": r.title,                                      # project title
-            "description": r.description or "",                    # None ko empty string
-            "client_id": r.client_id,                              # foreign key to client
-            "client_name": r.client_name,                          # joined client ka naam (label ki wajah se)
-            "start_date": r.start_date,                            # project start date (ya None)
-            "end_date": r.end_date,                                # project end date (ya None)
-            "status": (r.status or "planned").lower(),             # normalize to lower; None -> "planned"
-            "budget": r.budget,                                    # numeric amount (ya None)
-        })
 
+def _context(request: Request, projects, filters: dict, start: int = 0, **extra):
     # ─────────────────────────────────────────────────────────────────────────
-    # 3) Template render karna:
-    #    - "projects_list.html" templates/ folder me hona chahiye
+    # 3) Template context:
     #    - "request" key Jinja2Templates ke liye mandatory hai
-    #    - projects list pass karein
-    #    - status_steps list pass karein (UI me teen dots/steps show karne ke liye)
+    #    - projects: list (paged) ya generator (stream) — template dono par same loop chalata hai
+    #    - status_steps list (UI me teen dots/steps show karne ke liye)
+    #    - filters: form me current values wapas dikhane ke liye
+    #    - start: is page se pehle ki rows (# column = start + loop.index)
     # ─────────────────────────────────────────────────────────────────────────
+    return {
+        "request": request,              # required by Jinja2 in FastAPI
+        "projects": projects,            # table/list ke liye main data
+        # Legend / UI ke liye status steps order (template me helpful)
+        "status_steps": ["ongoing", "on_hold", "completed"],
+        "statuses": STATUSES,
+        "filters": {k: ("" if v is None else v) for k, v in filters.items()},
+        "start": start,
+        **extra,
+    }
+
+
+def _render_projects_page(request: Request, db: Session, stmt, page: PageParams, filters: dict, start: int = 0):
+    """Cache miss par: ek page (limit + 1 rows, id DESC keyset) query + render."""
+    rows, page_info = paginate(db, stmt, Project.id, page, descending=True)
+    projects = [_project_dict(r._mapping) for r in rows]
+
+    # Pager links: same filters, sirf cursor (aur numbering ka start) badalta hai
+    params = {k: v for k, v in request.query_params.items() if k not in ("after", "start")}
+    next_url = first_url = None
+    if page_info["has_more"]:
+        next_start = start + len(projects)
+        next_url = f"{request.url.path}?{urlencode({**params, 'after': page_info['next_cursor'], 'start': next_start})}"
+    if page.after_id is not None:
+        first_url = f"{request.url.path}?{urlencode(params)}"
+
     return request.app.state.templates.TemplateResponse(
         "projects_list.html",            # Jinja template filename
-        {
-            "request": request,          # required by Jinja2 in FastAPI
-            "projects": projects,        # table/list ke liye main data
-            # Legend / UI ke liye status steps order (template me helpful)
-            "status_steps": ["ongoing", "on_hold", "completed"],
-        }
+        _context(request, projects, filters, start, page=page_info, next_url=next_url, first_url=first_url),
     )
 
+
+def _stream_projects_page(request: Request, db: Session, stmt, filters: dict):
+    """
+    Stream mode:
+      1) Template ka generate() — output pieces lazily banta hai (poora string kabhi nahi)
+      2) projects = generator: DB se server-side cursor ke zariye STREAM_BATCH_SIZE rows ek waqt
+      3) Pieces jama karke STREAM_CHUNK_BYTES ke chunks; FLUSH marker (rows se pehle) par
+         shell foran chala jata hai — browser CSS/header render kar leta hai jab tak rows aati hain
+    """
+    stmt = stmt.order_by(Project.id.desc())                # latest projects pehle
+    projects = (_project_dict(r) for batch in iter_batches(db, stmt, STREAM_BATCH_SIZE) for r in batch)
+    template = request.app.state.templates.get_template("projects_list.html")
+    pieces = template.generate(_context(request, projects, filters, streaming=True, flush=FLUSH))
+    return StreamingResponse(_html_chunks(pieces), media_type="text/html; charset=utf-8")
+
+
+def _html_chunks(pieces, size: int = STREAM_CHUNK_BYTES):
+    """Jinja ke chhote pieces ko bade chunks me jorta hai (har piece alag write = bohat syscalls)."""
+    buf, pending = [], 0
+    for piece in pieces:
+        buf.append(piece)
+        pending += len(piece)
+        if pending >= size or FLUSH in piece:
+            yield "".join(buf).encode("utf-8")
+            buf, pending = [], 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # NOTES:
-#  - Agar aapko serial number chahiye (1,2,3...) to template me Jinja ka loop.index use kar sakte hain.
+#  - # column = start + loop.index: paged mode me start Next link se aata hai (keyset cursor me
+#    offset nahi hota); stream mode ek hi loop hai (batches flatten), start = 0.
+#    (loop.length / projects|length mat use karein — stream mode me projects generator hai)
 #  - Client name ko hyperlink bana ke modal/drawer me client detail dikhani ho:
 #       * Frontend JS me fetch('/clients/get/{client_id}') call karein
 #       * routers/clients.py me ek GET detail endpoint hona chahiye jo JSON return kare
-#  - Pagination/Search chahiye ho to is router ka advanced version bana ke query params handle karein
-#    (e.g., q=, status=, page=, size=) — ya ek nayi router file (e.g., /dashboard) me implement karein.
+#  - Full-text search ke liye /search (search.py) maujood hai; yahan sirf exact filters hain.
 # ─────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,51 @@
+# routers/health.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Operational endpoints (monitoring / pool sizing ke liye).
+#   GET /health/db-pool → connection pool ki current halat + cumulative metrics
+#   GET /health/cache   → response cache ke hit/miss/eviction counters + size
+#   GET /health/fragments → HTML fragment cache (templating.py) ka hit rate + size
+# ────────────────────────────────────────────────────────────────
+
+from fastapi import APIRouter
+from database import get_pool_stats
+from cache import response_cache
+from templating import fragment_cache
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/db-pool")
+def db_pool_stats():
+    """
+    Pool sizing ke liye numbers:
+      - checked_out / overflow_in_use: abhi kitni connections use me hain
+      - checkout_wait_seconds_*: requests ne connection ka kitna intezar kiya
+      - checkout_timeouts_total: pool_timeout tak connection na mili
+      - invalidations_total: toot chuki connections (pre-ping / errors)
+    """
+    return {"status": "success", "message": "DB pool stats", "data": get_pool_stats()}
+
+
+@router.get("/cache")
+def cache_stats():
+    """
+    Response cache ki halat:
+      - hits / misses: hit ratio (polling endpoints par zyada hona chahiye)
+      - evictions: size bound (CACHE_MAX_BYTES) ki wajah se nikli entries
+      - expirations / invalidations: TTL ya writes ki wajah se
+      - bytes / entries: abhi kitna cache bhara hai
+    """
+    return {"status": "success", "message": "Response cache stats", "data": response_cache.snapshot()}
+
+
+@router.get("/fragments")
+def fragment_stats():
+    """
+    Fragment cache (per-row / per-client partials) ki halat:
+      - hits / misses / stale: stale = row ka version badal chuka tha (dobara render)
+      - hit_rate: hits / (hits + misses + stale)
+      - invalidations: writes ke commit par nikle fragments
+      - evictions / entries: FRAGMENT_CACHE_MAX_ENTRIES bound
+    """
+    return {"status": "success", "message": "Fragment cache stats", "data": fragment_cache.snapshot()}
@@ -1,13 +1,49 @@
-from fastapi import APIRouter, Depends                              # ← FastAPI router & dependency system import
+from datetime import date                                            # ← Due-date range filters ke liye
+from typing import Any, Dict, List, Optional                         # ← Optional query params + bulk payload types
+from fastapi import APIRouter, Body, Depends, Query, Request         # ← FastAPI router, dependency system & query/body validation
+from sqlalchemy import select                                        # ← 2.0-style SELECT builder
 from sqlalchemy.orm import Session                                   # ← SQLAlchemy session type (for type hints)
 from database import get_db                                          # ← DB session dependency factory (database.py se)
+from bulk import MAX_BULK_ROWS, BulkParams, check_parents, run_bulk  # ← Bulk insert helpers (validate + chunked INSERT)
+from pagination import PageParams, paginate                          # ← Keyset (cursor) pagination helpers
+from serialization import FastJSONResponse, rows_to_dicts, schema_columns # ← Column-projected fast JSON path
+from streaming import DEFAULT_BATCH_SIZE, MAX_BATCH_SIZE, stream_export # ← Server-side cursor streaming helpers
+from conditional import conditional_get                              # ← ETag / If-None-Match → 304 (rows load hi nahi hoti)
 from models.invoice import Invoice                                   # ← Our Invoice SQLAlchemy model
-from schemas.invoice import InvoiceCreate, InvoiceOut                 # ← Pydantic schemas (input + output)
+from models.project import Project                                   # ← Bulk FK check (project_id) ke liye
+from schemas.invoice import InvoiceCreate, InvoiceOut                # ← Pydantic schemas (input + output)
 
 router = APIRouter(prefix="/invoices", tags=["Invoices"])             # ← Is file ke saare endpoints ka URL prefix & docs grouping
 
-def ok(message: str, data=None):                                      # ← Helper function: responses uniform banane ke liye
-    return {"status": "success", "message": message, "data": data}    # ← Consistent JSON response shape
+REPORT_TABLES = ("invoices", "projects", "clients")                  # ← /reports in tables se banti hai (ETag fingerprint)
+
+def ok(message: str, data=None, page=None):                           # ← Helper function: responses uniform banane ke liye
+    body = {"status": "success", "message": message, "data": data}    # ← Consistent JSON response shape
+    if page is not None:                                              # ← List endpoints ke liye pagination info
+        body["page"] = page                                           # ← {"limit", "next_cursor", "has_more"}
+    return body
+
+def active_invoices_query(project_id=None, paid_status=None,          # ← Shared query builder (sync + async routers)
+                          due_from=None, due_to=None):
+    """Active invoices ka column-projected SELECT; filters SQL me hi lagte hain."""
+    stmt = (select(*schema_columns(InvoiceOut, Invoice))              # ← SELECT sirf InvoiceOut ke columns
+            .where(Invoice.is_deleted == 0))                          # ← WHERE is_deleted = 0
+    if project_id is not None:
+        stmt = stmt.where(Invoice.project_id == project_id)
+    if paid_status is not None:
+        stmt = stmt.where(Invoice.paid_status == paid_status)
+    if due_from is not None:
+        stmt = stmt.where(Invoice.due_date >= due_from)
+    if due_to is not None:
+        stmt = stmt.where(Invoice.due_date <= due_to)
+    return stmt
+
+def bulk_create_invoices_in(db, payload, params):                     # ← Shared bulk flow (sync + async routers)
+    """Invoices validate + project_id check (ek query) + chunked insert; result dict return karta hai."""
+    return run_bulk(
+        db, Invoice, InvoiceCreate, payload, params,
+        checks=[lambda db, rows: check_parents(db, rows, "project_id", Project)],
+    )
 
 @router.post("/create")                                               # ← HTTP POST route: /invoices/create
 def create_invoice(payload: InvoiceCreate,                            # ← Request body validate hoga against InvoiceCreate schema
@@ -34,18 +70,85 @@ def create_invoice(payload: InvoiceCreate,                            # ← Requ
     return ok("Invoice created successfully", out)                    # ← Uniform success response with data
 
 @router.get("/list")                                                  # ← HTTP GET route: /invoices/list
-def list_invoices(db: Session = Depends(get_db)):                     # ← DB session injection
+def list_invoices(request: Request,                                   # ← If-None-Match header (conditional GET)
+                  page: PageParams = Depends(PageParams),             # ← ?limit= & ?after= (keyset cursor)
+                  project_id: Optional[int] = None,                   # ← Optional filter: sirf is project ke invoices
+                  paid_status: Optional[str] = None,                  # ← Optional filter: paid / unpaid / overdue
+                  due_from: Optional[date] = None,                    # ← Optional filter: due_date >= due_from
+                  due_to: Optional[date] = None,                      # ← Optional filter: due_date <= due_to
+                  db: Session = Depends(get_db)):                     # ← DB session injection
+    """
+    Step-by-step:
+    1) Non-deleted invoices (is_deleted = 0) ki query banao, filters SQL me lagao
+    2) Sirf ek page (id > after, limit rows) load karo
+    3) Rows ko seedha plain dicts me map karo (ORM objects / per-row Pydantic nahi)
+    4) List + next_cursor ko ek uniform response me orjson se encode karke return karo
+    5) Client ka If-None-Match ETag se match kare to 304 (1-4 skip)
+    """
+
+    def build():
+        stmt = active_invoices_query(project_id, paid_status,         # ← Filters SQL me (WHERE ... AND ...)
+                                     due_from, due_to)
+        rows, page_info = paginate(db, stmt, Invoice.id, page)        # ← ... AND id > :after ORDER BY id LIMIT :limit + 1
+        return FastJSONResponse(                                      # ← Custom response class (orjson; Decimal → float)
+            ok("Invoices fetched successfully", rows_to_dicts(rows), page_info)
+        )
+
+    return conditional_get(request, db, ("invoices",), build)         # ← ETag = invoices fingerprint + path/query
+
+@router.get("/export")                                                # ← HTTP GET route: /invoices/export
+def export_invoices(request: Request,                                 # ← If-None-Match header (conditional GET)
+                    fmt: str = Query("ndjson", alias="format",        # ← ?format=ndjson (default) ya ?format=json
+                                     pattern="^(ndjson|json)$"),
+                    batch_size: int = Query(DEFAULT_BATCH_SIZE,       # ← Ek DB fetch me kitni rows aayengi
+                                            ge=1, le=MAX_BATCH_SIZE),
+                    db: Session = Depends(get_db)):                   # ← DB session injection
     """
     Step-by-step:
-    1) Sare non-deleted invoices load karo (is_deleted = 0)
-    2) Har SQLAlchemy object ko Pydantic v2 ke through safe dict me map karo
-    3) List ko ek uniform response me return karo
+    1) Sare non-deleted invoices ki query id ke order me banao
+    2) Server-side cursor se batch by batch rows lao (memory ≈ batch_size)
+    3) Har row ko JSON me badal kar foran stream kar do (full list kabhi nahi banti)
     """
 
-    items = db.query(Invoice).filter(Invoice.is_deleted == 0).all()   # ← Simple SELECT * FROM invoices WHERE is_deleted = 0
-    data = [                                                          # ← Python list comprehension for serialization
-        InvoiceOut.model_validate(i, from_attributes=True).model_dump()  # ← v2-safe serialization per item
-        for i in items                                                # ← Iterate all loaded Invoice rows
-    ]
+    stmt = active_invoices_query().order_by(Invoice.id)               # ← Stable order (sync clients ke liye)
+    return conditional_get(request, db, ("invoices",),                # ← Data same → 304, export dobara nahi
+                           lambda: stream_export(db, stmt, fmt, batch_size)) # ← StreamingResponse (NDJSON / chunked JSON array)
+
+@router.get("/reports")                                              # ← HTTP GET route: /invoices/reports
+def invoice_reports_api(request: Request,                            # ← If-None-Match header (conditional GET)
+                        as_of: Optional[date] = None,                # ← Report kis din ke hisaab se (default: aaj)
+                        months: int = Query(12, ge=1, le=120),       # ← Revenue per month: pichle kitne months
+                        period_days: int = Query(90, ge=1, le=3650), # ← DSO ka sales window (din)
+                        db: Session = Depends(get_db)):              # ← DB session injection
+    """
+    Step-by-step:
+    1) Aging buckets (0-30/31-60/61-90/90+): outstanding invoices SQL me (client, bucket) par GROUP BY
+    2) Revenue per month: issued_date ke (year, month) par GROUP BY, khali months NumPy se 0
+    3) Per-client totals + DSO: client par GROUP BY (conditional SUMs), DSO NumPy se vectorized
+    4) Invoice rows kabhi Python me load nahi hoti — sirf aggregated rows aati hain
+    5) Tables na badlen (aur din wahi ho) to If-None-Match par 304 — queries hi nahi chalti
+    """
+
+    def build():
+        from reports import invoice_reports                          # ← Lazy: NumPy sirf is endpoint par load (boot par nahi)
+        report = invoice_reports(db, as_of, months, period_days)     # ← 3 aggregate queries + vectorized post-processing
+        return FastJSONResponse(ok("Invoice reports generated", report)) # ← Uniform response (orjson)
+
+    return conditional_get(request, db, REPORT_TABLES, build,        # ← Report in teeno tables se banti hai
+                           extra="" if as_of else date.today().isoformat()) # ← Default as_of = aaj → din badle to ETag bhi
+
+@router.post("/bulk")                                                 # ← HTTP POST route: /invoices/bulk
+def bulk_create_invoices(payload: List[Dict[str, Any]] = Body(...,    # ← InvoiceCreate jaisi rows ki list
+                                                  max_length=MAX_BULK_ROWS),
+                         params: BulkParams = Depends(BulkParams),    # ← ?chunk_size= & ?partial=
+                         db: Session = Depends(get_db)):              # ← DB session injection
+    """
+    Step-by-step:
+    1) Sab rows ek pass me InvoiceCreate se validate karo
+    2) project_id ek hi query me check karo (missing / deleted projects)
+    3) Chunks me multi-row INSERT, sab ek transaction me, phir ek commit
+    4) Generated ids input order me (partial=true par per-row errors bhi) return karo
+    """
 
-    return ok("Invoices fetched successfully", data)                   # ← Uniform success response with list payload
+    result = bulk_create_invoices_in(db, payload, params)             # ← validate → check → insert
+    return ok(f"{result['inserted']} invoices created", result)       # ← Uniform success response
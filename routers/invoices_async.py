@@ -0,0 +1,96 @@
+# routers/invoices_async.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   routers/invoices.py ka async version (USE_ASYNC_DB=1 par main.py isay mount karta hai).
+#   Same URLs, same response shape; sirf DB access AsyncSession se hota hai.
+# ────────────────────────────────────────────────────────────────
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
+from bulk import MAX_BULK_ROWS, BulkParams
+from pagination import PageParams, paginate_async
+from serialization import FastJSONResponse, rows_to_dicts
+from streaming import DEFAULT_BATCH_SIZE, MAX_BATCH_SIZE, stream_export_async
+from conditional import conditional_get_async
+from models.invoice import Invoice
+from schemas.invoice import InvoiceCreate, InvoiceOut
+from routers.invoices import REPORT_TABLES, active_invoices_query, bulk_create_invoices_in, ok
+
+router = APIRouter(prefix="/invoices", tags=["Invoices"])
+
+
+@router.post("/create")
+async def create_invoice(payload: InvoiceCreate, db: AsyncSession = Depends(get_async_db)):
+    """Naya invoice save karo aur saved data return karo (async)."""
+    invoice = Invoice(**payload.model_dump())
+    db.add(invoice)
+    await db.commit()
+    await db.refresh(invoice)
+
+    out = InvoiceOut.model_validate(invoice, from_attributes=True).model_dump()
+    return ok("Invoice created successfully", out)
+
+
+@router.get("/list")
+async def list_invoices(request: Request,
+                        page: PageParams = Depends(PageParams),
+                        project_id: Optional[int] = None,
+                        paid_status: Optional[str] = None,
+                        due_from: Optional[date] = None,
+                        due_to: Optional[date] = None,
+                        db: AsyncSession = Depends(get_async_db)):
+    """Sync /invoices/list jaisa hi contract (filters + limit/after cursor)."""
+    async def build():
+        stmt = active_invoices_query(project_id, paid_status, due_from, due_to)
+        rows, page_info = await paginate_async(db, stmt, Invoice.id, page)
+
+        return FastJSONResponse(
+            ok("Invoices fetched successfully", rows_to_dicts(rows), page_info)
+        )
+
+    return await conditional_get_async(request, db, ("invoices",), build)
+
+
+@router.get("/export")
+async def export_invoices(request: Request,
+                          fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|json)$"),
+                          batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=MAX_BATCH_SIZE),
+                          db: AsyncSession = Depends(get_async_db)):
+    """Sab active invoices ko server-side cursor se batch by batch stream karo."""
+    stmt = active_invoices_query().order_by(Invoice.id)
+
+    async def build():
+        return stream_export_async(db, stmt, fmt, batch_size)
+
+    return await conditional_get_async(request, db, ("invoices",), build)
+
+
+@router.get("/reports")
+async def invoice_reports_api(request: Request,
+                              as_of: Optional[date] = None,
+                              months: int = Query(12, ge=1, le=120),
+                              period_days: int = Query(90, ge=1, le=3650),
+                              db: AsyncSession = Depends(get_async_db)):
+    """Sync /invoices/reports jaisa hi report (aggregate queries run_sync ke through)."""
+    async def build():
+        from reports import invoice_reports  # lazy: NumPy sirf is endpoint par load (boot par nahi)
+        report = await db.run_sync(lambda session: invoice_reports(session, as_of, months, period_days))
+        return FastJSONResponse(ok("Invoice reports generated", report))
+
+    return await conditional_get_async(request, db, REPORT_TABLES, build,
+                                       extra="" if as_of else date.today().isoformat())
+
+
+# 🟠 Bulk create invoices (sync bulk flow AsyncSession.run_sync ke andar, ek transaction)
+@router.post("/bulk")
+async def bulk_create_invoices(
+    payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ROWS),
+    params: BulkParams = Depends(BulkParams),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sync /invoices/bulk jaisa hi contract (chunk_size, partial, ids input order me)."""
+    result = await db.run_sync(lambda session: bulk_create_invoices_in(session, payload, params))
+    return ok(f"{result['inserted']} invoices created", result)
@@ -0,0 +1,26 @@
+# routers/metrics.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   GET /metrics → Prometheus text format (scrape config: metrics_path: /metrics)
+#     - http_requests_total, http_request_duration_seconds (per route histogram)
+#     - http_request_sql_statements / http_request_sql_seconds (per request)
+#     - http_response_size_bytes
+#     - db_pool_* (sync / async pool), response_cache_* aur fragment_cache_* counters
+#   Data MetricsMiddleware (metrics.py) jama karta hai.
+# ────────────────────────────────────────────────────────────────
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from cache import response_cache
+from database import get_pool_stats
+from metrics import render_prometheus
+from templating import fragment_cache
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    body = render_prometheus(get_pool_stats(), response_cache.snapshot(), fragment_cache.snapshot())
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,19 +1,51 @@
-from fastapi import APIRouter, Depends
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from database import get_db
+from cache import response_cache
+from conditional import conditional_get
+from bulk import MAX_BULK_ROWS, BulkParams, check_parents, run_bulk
+from pagination import PageParams, paginate
+from serialization import FastJSONResponse, rows_to_dicts, schema_columns
 from models.project import Project
+from models.client import Client
 from schemas.project import ProjectCreate, ProjectOut
 
 # Yeh route group "Projects" ke sab endpoints rakhta hai
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 # ✅ Common function: har response same format me bhejna
-def ok(message, data=None):
-    return {
+def ok(message, data=None, page=None):
+    body = {
         "status": "success",
         "message": message,
         "data": data
     }
+    # List endpoints pagination info bhi bhejte hain (next_cursor waghera)
+    if page is not None:
+        body["page"] = page
+    return body
+
+
+# ✅ Shared query builder (sync aur async routers dono isay use karte hain)
+def active_projects_query(status=None, client_id=None):
+    """Active projects ka column-projected SELECT; filters SQL me hi lagte hain."""
+    stmt = select(*schema_columns(ProjectOut, Project)).where(Project.is_deleted == 0)
+    if status is not None:
+        stmt = stmt.where(Project.status == status)
+    if client_id is not None:
+        stmt = stmt.where(Project.client_id == client_id)
+    return stmt
+
+
+# ✅ Shared bulk flow (sync aur async routers dono isay use karte hain)
+def bulk_create_projects_in(db, payload, params):
+    """Projects validate + client_id check (ek query) + chunked insert; result dict return karta hai."""
+    return run_bulk(
+        db, Project, ProjectCreate, payload, params,
+        checks=[lambda db, rows: check_parents(db, rows, "client_id", Client)],
+    )
 
 
 # 🟢 ROUTE 1: Create a new project
@@ -42,24 +74,59 @@ def create_project(payload: ProjectCreate, db: Session = Depends(get_db)):
     return ok("Project created", out)
     
 
-# 🔵 ROUTE 2: List all projects
+# 🔵 ROUTE 2: List projects (keyset paginated)
 @router.get("/list")
-def list_projects(db: Session = Depends(get_db)):
+def list_projects(
+    request: Request,
+    page: PageParams = Depends(PageParams),
+    status: Optional[str] = None,
+    client_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
     """
     Step by step:
-    1. Database se sab projects laao jinka 'is_deleted = 0' hai
-    2. Unko readable format me convert karo (dict)
-    3. Return karo success message ke sath
+    1. Sirf active projects ('is_deleted = 0') ki query banao
+    2. Filters (status, client_id) SQL me hi laga do
+    3. Ek page (limit rows, id > after) laao aur dict me convert karo
+    4. Return karo success message + next_cursor ke sath
+
+    Cache: same path + query ka response cache se aata hai (projects par write hote hi invalid).
+    Fast path: sirf ProjectOut ke columns SELECT hote hain (ORM objects / per-row
+    Pydantic validation nahi) aur response orjson se encode hota hai.
     """
 
-    # 1️⃣ Database se active projects laao
-    projects = db.query(Project).filter(Project.is_deleted == 0).all()
+    def build():
+        # 1️⃣ Base query + 2️⃣ filters
+        stmt = active_projects_query(status, client_id)
 
-    # 2️⃣ Har project ko simple dict me convert karo
-    project_list = [ProjectOut.from_orm(p).dict() for p in projects]
+        # 3️⃣ Sirf ek page DB se aata hai, poori table nahi
+        rows, page_info = paginate(db, stmt, Project.id, page)
 
-    # 3️⃣ Return response
-    return ok(
-        "All active projects fetched successfully!",
-        project_list
-    )
+        # 4️⃣ Return response
+        return FastJSONResponse(ok(
+            "Active projects fetched successfully!",
+            rows_to_dicts(rows),
+            page_info
+        ))
+
+    # If-None-Match match ho to 304 (build/cache tak baat hi nahi pohanchti)
+    return conditional_get(request, db, ("projects",),
+                           lambda: response_cache.cached(request, ("projects",), build))
+
+
+# 🟠 ROUTE 3: Bulk create projects (ek request, ek transaction)
+@router.post("/bulk")
+def bulk_create_projects(
+    payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ROWS),
+    params: BulkParams = Depends(BulkParams),
+    db: Session = Depends(get_db),
+):
+    """
+    Step by step:
+    1. ProjectCreate jaisi rows ki list aati hai
+    2. Sab rows ek pass me validate hoti hain; client_id ek query me check hota hai
+    3. Rows chunk_size ke chunks me multi-row INSERT se ek transaction me save hoti hain
+    4. Generated ids input order me return hoti hain (partial=true par per-row errors bhi)
+    """
+    result = bulk_create_projects_in(db, payload, params)
+    return ok(f"{result['inserted']} projects created", result)
@@ -0,0 +1,72 @@
+# routers/projects_async.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   routers/projects.py ka async version (USE_ASYNC_DB=1 par main.py isay mount karta hai).
+#   Same URLs, same response shape; sirf DB access AsyncSession se hota hai.
+# ────────────────────────────────────────────────────────────────
+
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
+from cache import response_cache
+from conditional import conditional_get_async
+from bulk import MAX_BULK_ROWS, BulkParams
+from pagination import PageParams, paginate_async
+from serialization import FastJSONResponse, rows_to_dicts
+from models.project import Project
+from schemas.project import ProjectCreate, ProjectOut
+from routers.projects import active_projects_query, bulk_create_projects_in, ok
+
+router = APIRouter(prefix="/projects", tags=["Projects"])
+
+
+# 🟢 ROUTE 1: Create a new project
+@router.post("/create")
+async def create_project(payload: ProjectCreate, db: AsyncSession = Depends(get_async_db)):
+    """Naya project save karo aur saved data return karo (async)."""
+    project = Project(**payload.model_dump())
+    db.add(project)
+    await db.commit()
+    await db.refresh(project)
+
+    out = ProjectOut.model_validate(project, from_attributes=True).model_dump()
+    return ok("Project created", out)
+
+
+# 🔵 ROUTE 2: List projects (keyset paginated)
+@router.get("/list")
+async def list_projects(
+    request: Request,
+    page: PageParams = Depends(PageParams),
+    status: Optional[str] = None,
+    client_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sync /projects/list jaisa hi contract (filters + limit/after cursor)."""
+    async def build():
+        stmt = active_projects_query(status, client_id)
+        rows, page_info = await paginate_async(db, stmt, Project.id, page)
+
+        return FastJSONResponse(ok(
+            "Active projects fetched successfully!",
+            rows_to_dicts(rows),
+            page_info
+        ))
+
+    return await conditional_get_async(
+        request, db, ("projects",),
+        lambda: response_cache.cached_async(request, ("projects",), build),
+    )
+
+
+# 🟠 Bulk create projects (sync bulk flow AsyncSession.run_sync ke andar, ek transaction)
+@router.post("/bulk")
+async def bulk_create_projects(
+    payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ROWS),
+    params: BulkParams = Depends(BulkParams),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sync /projects/bulk jaisa hi contract (chunk_size, partial, ids input order me)."""
+    result = await db.run_sync(lambda session: bulk_create_projects_in(session, payload, params))
+    return ok(f"{result['inserted']} projects created", result)
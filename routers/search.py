@@ -0,0 +1,72 @@
+# routers/search.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Server-side keyword search (engine: search.py) — browser ko poori /tasks/list
+#   download karke filter nahi karna parta.
+#   GET /search?q=invoice backend                     → projects + tasks + clients, relevance order
+#   GET /search?q=dev3&entities=tasks&limit=50
+#   GET /search?q=...&after=<next_cursor>             → agla page
+# ────────────────────────────────────────────────────────────────
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from database import get_db
+from pagination import decode_token, encode_token
+from search import ENTITIES, MAX_OFFSET, search
+from serialization import FastJSONResponse
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+def ok(message, data=None, page=None):
+    body = {"status": "success", "message": message, "data": data}
+    if page is not None:
+        body["page"] = page
+    return body
+
+
+def _offset(after: Optional[str]) -> int:
+    # Ranked results ka cursor = ab tak kitne hits aa chuke (relevance order id order nahi)
+    if not after:
+        return 0
+    try:
+        offset = int(decode_token(after)["o"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    if not 0 <= offset <= MAX_OFFSET:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    return offset
+
+
+@router.get("")
+def search_api(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text (har word zaroori, prefix match)"),
+    entities: Optional[str] = Query(None, description="Comma-separated: " + ",".join(ENTITIES)),
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None, description="Pichle page ka next_cursor"),
+    db: Session = Depends(get_db),
+):
+    """
+    Step by step:
+    1. entities + cursor validate
+    2. Full-text index se ranked hits (ek query), phir un hits ka data (har entity ki ek query)
+    3. Response: hits (score DESC) + page info (limit, next_cursor, has_more)
+    """
+    names = None
+    if entities:
+        names = [name.strip() for name in entities.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(ENTITIES))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown entities: {', '.join(unknown)}")
+
+    offset = _offset(after)
+    hits, has_more = search(db, q, names, limit, offset)
+    has_more = has_more and offset + limit <= MAX_OFFSET
+    next_cursor = encode_token({"o": offset + limit}) if has_more else None
+
+    return FastJSONResponse(ok(f"{len(hits)} results", hits, {
+        "limit": limit, "next_cursor": next_cursor, "has_more": has_more,
+    }))
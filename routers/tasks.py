@@ -1,19 +1,54 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Query, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from database import get_db
+from conditional import conditional_get
+from bulk import MAX_BULK_ROWS, BulkParams, check_parents, run_bulk
+from pagination import PageParams, paginate
+from serialization import FastJSONResponse, rows_to_dicts, schema_columns
+from streaming import DEFAULT_BATCH_SIZE, MAX_BATCH_SIZE, stream_export
 from models.task import Task
+from models.project import Project
 from schemas.task import TaskCreate, TaskOut
 
 # Yeh router "Tasks" ke liye saare endpoints handle karega
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 # ✅ Common helper function for same response structure
-def make_response(message, data=None):
-    return {
+def make_response(message, data=None, page=None):
+    body = {
         "status": "success",
         "message": message,
         "data": data
     }
+    # List endpoints pagination info bhi bhejte hain (next_cursor waghera)
+    if page is not None:
+        body["page"] = page
+    return body
+
+# ✅ Shared query builder (sync aur async routers dono isay use karte hain)
+def active_tasks_query(project_id=None, completed=None, due_from=None, due_to=None):
+    """Active tasks ka column-projected SELECT; filters SQL me hi lagte hain."""
+    stmt = select(*schema_columns(TaskOut, Task)).where(Task.is_deleted == 0)
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+    if completed is not None:
+        stmt = stmt.where(Task.completed == completed)
+    if due_from is not None:
+        stmt = stmt.where(Task.due_date >= due_from)
+    if due_to is not None:
+        stmt = stmt.where(Task.due_date <= due_to)
+    return stmt
+
+# ✅ Shared bulk flow (sync aur async routers dono isay use karte hain)
+def bulk_create_tasks_in(db, payload, params):
+    """Tasks validate + project_id check (ek query) + chunked insert; result dict return karta hai."""
+    return run_bulk(
+        db, Task, TaskCreate, payload, params,
+        checks=[lambda db, rows: check_parents(db, rows, "project_id", Project)],
+    )
 
 # 🟢 Route 1: Create a new task
 @router.post("/create")
@@ -43,24 +78,78 @@ def create_task(request: TaskCreate, db: Session = Depends(get_db)):
     )
 
 
-# 🔵 Route 2: List all active tasks
+# 🔵 Route 2: List active tasks (keyset paginated)
 @router.get("/list")
-def list_tasks(db: Session = Depends(get_db)):
+def list_tasks(
+    request: Request,
+    page: PageParams = Depends(PageParams),
+    project_id: Optional[int] = None,
+    completed: Optional[bool] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    db: Session = Depends(get_db),
+):
     """
     Step by step:
-    1. Database se sab tasks laao jinka 'is_deleted = 0' hai
-    2. Unko readable dict me convert karo
-    3. Return karo success message ke sath
+    1. Sirf active tasks ('is_deleted = 0') ki query banao
+    2. Filters (project_id, completed, due date range) SQL me hi laga do
+    3. Ek page (limit rows, id > after) laao aur dict me convert karo
+    4. Return karo success message + next_cursor ke sath
+
+    ETag: If-None-Match same ho to 304 (query + serialization skip).
+    Fast path: sirf TaskOut ke columns SELECT hote hain (ORM objects / per-row
+    Pydantic validation nahi) aur response orjson se encode hota hai.
     """
 
-    # 1️⃣ Active tasks laao
-    tasks = db.query(Task).filter(Task.is_deleted == 0).all()
+    def build():
+        # 1️⃣ Base query + 2️⃣ filters
+        stmt = active_tasks_query(project_id, completed, due_from, due_to)
 
-    # 2️⃣ Har task ko dict me convert karo
-    task_list = [TaskOut.from_orm(t).dict() for t in tasks]
+        # 3️⃣ Sirf ek page DB se aata hai, poori table nahi
+        rows, page_info = paginate(db, stmt, Task.id, page)
 
-    # 3️⃣ Return success response
-    return make_response(
-        "All active tasks fetched successfully!",
-        task_list
-    )
+        # 4️⃣ Return success response
+        return FastJSONResponse(make_response(
+            "Active tasks fetched successfully!",
+            rows_to_dicts(rows),
+            page_info
+        ))
+
+    return conditional_get(request, db, ("tasks",), build)
+
+
+# 🟣 Route 3: Export all active tasks (streaming, nightly sync ke liye)
+@router.get("/export")
+def export_tasks(
+    request: Request,
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|json)$"),
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=MAX_BATCH_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Step by step:
+    1. Sab active tasks ki query id ke order me banao
+    2. Rows ko batches me DB se stream karo (poori list memory me nahi banti)
+    3. Har row NDJSON line ya JSON array element ban kar foran bhej di jati hai
+    (If-None-Match same ho to 304 — poora export dobara nahi aata)
+    """
+    stmt = active_tasks_query().order_by(Task.id)
+    return conditional_get(request, db, ("tasks",), lambda: stream_export(db, stmt, fmt, batch_size))
+
+
+# 🟠 Route 4: Bulk create tasks (ek request, ek transaction)
+@router.post("/bulk")
+def bulk_create_tasks(
+    payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ROWS),
+    params: BulkParams = Depends(BulkParams),
+    db: Session = Depends(get_db),
+):
+    """
+    Step by step:
+    1. TaskCreate jaisi rows ki list aati hai (e.g. client ka poora backlog)
+    2. Sab rows ek pass me validate hoti hain; project_id ek query me check hota hai
+    3. Rows chunk_size ke chunks me multi-row INSERT se ek transaction me save hoti hain
+    4. Generated ids input order me return hoti hain (partial=true par per-row errors bhi)
+    """
+    result = bulk_create_tasks_in(db, payload, params)
+    return make_response(f"{result['inserted']} tasks created", result)
@@ -0,0 +1,92 @@
+# routers/tasks_async.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   routers/tasks.py ka async version (USE_ASYNC_DB=1 par main.py isay mount karta hai).
+#   Same URLs, same response shape; sirf DB access AsyncSession se hota hai,
+#   is liye request DB ka intezar karte hue threadpool thread pin nahi karti.
+# ────────────────────────────────────────────────────────────────
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
+from conditional import conditional_get_async
+from bulk import MAX_BULK_ROWS, BulkParams
+from pagination import PageParams, paginate_async
+from serialization import FastJSONResponse, rows_to_dicts
+from streaming import DEFAULT_BATCH_SIZE, MAX_BATCH_SIZE, stream_export_async
+from models.task import Task
+from schemas.task import TaskCreate, TaskOut
+from routers.tasks import active_tasks_query, bulk_create_tasks_in, make_response
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+# 🟢 Route 1: Create a new task
+@router.post("/create")
+async def create_task(request: TaskCreate, db: AsyncSession = Depends(get_async_db)):
+    """Naya task save karo aur saved data return karo (async)."""
+    new_task = Task(**request.model_dump())
+    db.add(new_task)
+    await db.commit()
+    await db.refresh(new_task)
+
+    return make_response(
+        "New task created successfully!",
+        TaskOut.model_validate(new_task).model_dump()
+    )
+
+
+# 🔵 Route 2: List active tasks (keyset paginated)
+@router.get("/list")
+async def list_tasks(
+    request: Request,
+    page: PageParams = Depends(PageParams),
+    project_id: Optional[int] = None,
+    completed: Optional[bool] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sync /tasks/list jaisa hi contract (filters + limit/after cursor)."""
+    async def build():
+        stmt = active_tasks_query(project_id, completed, due_from, due_to)
+        rows, page_info = await paginate_async(db, stmt, Task.id, page)
+
+        return FastJSONResponse(make_response(
+            "Active tasks fetched successfully!",
+            rows_to_dicts(rows),
+            page_info
+        ))
+
+    return await conditional_get_async(request, db, ("tasks",), build)
+
+
+# 🟣 Route 3: Export all active tasks (streaming)
+@router.get("/export")
+async def export_tasks(
+    request: Request,
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|json)$"),
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=MAX_BATCH_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sab active tasks ko server-side cursor se batch by batch stream karo."""
+    stmt = active_tasks_query().order_by(Task.id)
+
+    async def build():
+        return stream_export_async(db, stmt, fmt, batch_size)
+
+    return await conditional_get_async(request, db, ("tasks",), build)
+
+
+# 🟠 Bulk create tasks (sync bulk flow AsyncSession.run_sync ke andar, ek transaction)
+@router.post("/bulk")
+async def bulk_create_tasks(
+    payload: List[Dict[str, Any]] = Body(..., max_length=MAX_BULK_ROWS),
+    params: BulkParams = Depends(BulkParams),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Sync /tasks/bulk jaisa hi contract (chunk_size, partial, ids input order me)."""
+    result = await db.run_sync(lambda session: bulk_create_tasks_in(session, payload, params))
+    return make_response(f"{result['inserted']} tasks created", result)
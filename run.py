@@ -0,0 +1,155 @@
+# run.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Production entry point: FastAPI app (main:app) kai worker processes me.
+#   - gunicorn install ho (Linux/macOS) → gunicorn master + UvicornWorker:
+#       graceful reload: kill -HUP <master pid> (naye workers, purane requests khatam karke band)
+#       WEB_MAX_REQUESTS: itni requests ke baad worker recycle (memory growth se bachao)
+#       WEB_PRELOAD=1: app (FastAPI, SQLAlchemy, routers, templates) master me ek baar import,
+#       workers fork se bante hain → worker boot = sirf startup hooks (DB pool warm-up), import
+#       dobara nahi (scripts/startup_report.py --preload). DB pools / cache ki sqlite
+#       connection fork ke baad har worker me nayi bante hain (database.py, cache.py)
+#   - warna (Windows / gunicorn nahi) → uvicorn ka multiprocess supervisor:
+#       kill -HUP <pid> = saare workers restart, TTIN / TTOU = ek worker zyada / kam
+#   - uvloop + httptools install hon to wahi (warna asyncio + h11)
+#   - DB pool per worker: DB_MAX_CONNECTIONS (poori app ka budget, e.g. MySQL max_connections
+#     minus headroom) workers me baant kar DB_POOL_SIZE / DB_MAX_OVERFLOW set hote hain —
+#     workers import se pehle env padhte hain (db_pool.py)
+#
+# USAGE:
+#   python run.py
+#   python run.py --workers 4 --port 8000
+#   WEB_WORKERS=8 DB_MAX_CONNECTIONS=120 python run.py
+#
+# NOTE:
+#   Deploy se pehle: python scripts/build_static.py (hashed + precompressed static assets).
+#   Har worker ka apna response cache / notification queue / metrics hote hain —
+#   workers ke beech cache share karna ho to CACHE_SHARED_PATH set karein (cache.py).
+#
+# ENV VARS:
+#   WEB_HOST=0.0.0.0  WEB_PORT=8000
+#   WEB_WORKERS=<CPU count>       → worker processes
+#   WEB_SERVER=auto               → auto | gunicorn | uvicorn
+#   WEB_TIMEOUT=60                → gunicorn: itni der chup worker restart
+#   WEB_GRACEFUL_TIMEOUT=30       → shutdown / reload par in-flight requests ka waqt
+#   WEB_KEEPALIVE=5               → idle keep-alive connection (seconds)
+#   WEB_MAX_REQUESTS=0            → gunicorn worker recycle (0 = off; jitter 10%)
+#   WEB_PRELOAD=1                 → gunicorn: app master me import karke workers fork (0 = har worker khud import)
+#   DB_MAX_CONNECTIONS=           → saare workers ka DB connection budget (khali = db_pool defaults)
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import importlib.util
+import os
+import sys
+
+APP = "main:app"
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def server_options() -> dict:
+    """Event loop / HTTP parser: C implementations mile to wahi (2-3x kam CPU per request)."""
+    return {
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+    }
+
+
+def size_db_pools(workers: int, budget: int):
+    """
+    DB_MAX_CONNECTIONS ko workers me baant kar DB_POOL_SIZE / DB_MAX_OVERFLOW env set karo
+    (khud set kiye hon to unhein na chhero). Async mode me har worker ke 2 pools (sync + async).
+    """
+    if not budget or "DB_POOL_SIZE" in os.environ:
+        return None
+    pools = 2 if os.getenv("USE_ASYNC_DB", "0").lower() in ("1", "true", "yes") else 1
+    per_pool = max(1, budget // (workers * pools))
+    pool_size = max(1, per_pool // 2)  # aadhi permanent, aadhi load par (overflow)
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ.setdefault("DB_MAX_OVERFLOW", str(per_pool - pool_size))
+    return pool_size, int(os.environ["DB_MAX_OVERFLOW"])
+
+
+def _uvicorn_worker_class() -> str:
+    # uvicorn 0.30+ me worker alag package (uvicorn-worker) me hai; purana path ab bhi chalta hai
+    return "uvicorn_worker.UvicornWorker" if _installed("uvicorn_worker") else "uvicorn.workers.UvicornWorker"
+
+
+def run_gunicorn(args):
+    from gunicorn.app.base import BaseApplication
+
+    class _App(BaseApplication):
+        def load_config(self):
+            config = {
+                "bind": f"{args.host}:{args.port}",
+                "workers": args.workers,
+                "worker_class": _uvicorn_worker_class(),
+                "timeout": args.timeout,
+                "graceful_timeout": args.graceful_timeout,
+                "keepalive": args.keepalive,
+                "max_requests": args.max_requests,
+                "max_requests_jitter": args.max_requests // 10,
+                # preload: imports master me ek baar; fork ke baad pools khud naye (register_at_fork)
+                "preload_app": args.preload,
+                "accesslog": None,
+            }
+            for key, value in config.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from main import app
+            return app
+
+    _App().run()
+
+
+def run_uvicorn(args):
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_keep_alive=args.keepalive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=False,
+        **server_options(),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Freelance Tracker production server")
+    parser.add_argument("--host", default=os.getenv("WEB_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("WEB_PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_WORKERS", str(os.cpu_count() or 1))))
+    parser.add_argument("--server", choices=("auto", "gunicorn", "uvicorn"), default=os.getenv("WEB_SERVER", "auto"))
+    parser.add_argument("--timeout", type=int, default=int(os.getenv("WEB_TIMEOUT", "60")))
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.getenv("WEB_GRACEFUL_TIMEOUT", "30")))
+    parser.add_argument("--keepalive", type=int, default=int(os.getenv("WEB_KEEPALIVE", "5")))
+    parser.add_argument("--max-requests", type=int, default=int(os.getenv("WEB_MAX_REQUESTS", "0")))
+    parser.add_argument("--preload", action=argparse.BooleanOptionalAction,
+                        default=os.getenv("WEB_PRELOAD", "1").lower() in ("1", "true", "yes"))
+    args = parser.parse_args()
+
+    server = args.server
+    if server == "auto":
+        server = "gunicorn" if _installed("gunicorn") and sys.platform != "win32" else "uvicorn"
+
+    pools = size_db_pools(args.workers, int(os.getenv("DB_MAX_CONNECTIONS", "0") or 0))
+    print(f"🚀 {server}: {args.workers} workers on {args.host}:{args.port} ({server_options()})")
+    if pools:
+        print(f"🔗 DB pool per worker: pool_size={pools[0]} max_overflow={pools[1]}")
+
+    if server == "gunicorn":
+        run_gunicorn(args)
+    else:
+        run_uvicorn(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
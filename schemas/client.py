@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
+from datetime import datetime
 
 # Input schema (create/update me validate hota hai)
 class ClientCreate(BaseModel):
@@ -22,6 +23,8 @@ class ClientOut(BaseModel):
     company_name: Optional[str] = None
     address: Optional[str] = None
     is_deleted: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
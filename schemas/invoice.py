@@ -1,6 +1,6 @@
 from pydantic import BaseModel                                        # ← Pydantic BaseModel (schemas ke liye)
 from typing import Optional                                           # ← Optional fields ke type hints
-from datetime import date                                             # ← Date fields (issued_date, due_date) ke liye
+from datetime import date, datetime                                   # ← Date fields (issued_date, due_date) + timestamps
 
 class InvoiceCreate(BaseModel):                                       # ← Input schema: user jab invoice create karega to ye structure validate hoga
     project_id: int                                                   # ← Kis project ke liye invoice hai (required)
@@ -20,6 +20,8 @@ class InvoiceOut(BaseModel):                                          # ← Outp
     due_date: Optional[date] = None                                   # ← Optional due date
     paid_status: str                                                  # ← Current status (paid/unpaid/overdue…)
     is_deleted: int                                                   # ← Soft delete indicator (0/1)
+    created_at: Optional[datetime] = None                             # ← Row kab bani (UTC)
+    updated_at: Optional[datetime] = None                             # ← Aakhri change (UTC) — delta sync ke liye
 
     class Config:                                                     # ← Pydantic v2 config
         from_attributes = True                                        # ← ORM objects → schema mapping enable
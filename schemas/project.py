@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 
 # Yeh class input validation ke liye use hoti hai jab user project create karta hai
 class ProjectCreate(BaseModel):
@@ -27,6 +27,8 @@ class ProjectOut(BaseModel):
     status: str
     budget: Optional[int] = None
     is_deleted: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
      from_attributes = True
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 
 # 🟢 Input Schema: jab user new task create karta hai
 class TaskCreate(BaseModel):
@@ -25,6 +25,8 @@ class TaskOut(BaseModel):
     due_date: Optional[date] = None
     completed: bool
     is_deleted: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True  # ✅ v2
@@ -0,0 +1,108 @@
+# scripts/bench_backends.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   SQLite mode (sqlite_mode.py) ka MySQL se muqabla — list aur create endpoints par:
+#     sqlite        → WAL + tuned pragmas + single writer (SQLITE_TUNING=1, default)
+#     sqlite_plain  → plain pysqlite (rollback journal, synchronous=FULL, deferred BEGIN)
+#     mysql         → --mysql-url diya ho to
+#   Har backend ek alag bench_suite.py run (same scale, same scenarios) — in-process
+#   latency (ek client) aur load phase (--connections concurrent clients; yahin writers ki
+#   line / "database is locked" errors dikhte hain). Aakhir me scenario × backend table.
+#
+# USAGE:
+#   python scripts/bench_backends.py
+#   python scripts/bench_backends.py --mysql-url mysql+pymysql://root:@localhost:3306/fpt_bench
+#   python scripts/bench_backends.py --preset medium --connections 16 --out /tmp/backends.json
+#
+# NOTE:
+#   MySQL DB khali ho to bench_suite seed karta hai; create scenarios har run me rows jodte hain.
+#   SQLite runs seeded template ki taaza copy par chalti hain (bench_suite.py).
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH_SUITE = ROOT / "scripts" / "bench_suite.py"
+
+SCENARIOS = (
+    "clients_list", "projects_list", "tasks_list", "invoices_list",
+    "clients_create", "projects_create", "tasks_create", "invoices_create",
+)
+
+
+def backends(args) -> dict:
+    """name → (extra env, extra bench_suite args)."""
+    configs = {
+        "sqlite": ({"SQLITE_TUNING": "1"}, []),
+        "sqlite_plain": ({"SQLITE_TUNING": "0"}, []),
+    }
+    if args.mysql_url:
+        configs["mysql"] = ({}, ["--database-url", args.mysql_url])
+    return configs
+
+
+def run_backend(name: str, env_extra: dict, extra_args: list, args) -> dict:
+    out = os.path.join(tempfile.gettempdir(), f"fpt_bench_backend_{name}.json")
+    cmd = [sys.executable, str(BENCH_SUITE), "--preset", args.preset, "--only", ",".join(SCENARIOS),
+           "--requests", str(args.requests), "--connections", str(args.connections),
+           "--seconds", str(args.seconds), "--no-alloc", "--out", out, *extra_args]
+    if args.skip_load:
+        cmd.append("--skip-load")
+    print(f"\n━━ {name} ━━")
+    subprocess.run(cmd, cwd=ROOT, env={**os.environ, **env_extra}, check=True)
+    with open(out, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def print_table(reports: dict):
+    names = list(reports)
+    print(f"\n{'in-process p50 ms':24}" + "".join(f"{n:>16}" for n in names))
+    for scenario in SCENARIOS:
+        cells = [reports[n]["in_process"].get(scenario, {}).get("p50_ms") for n in names]
+        print(f"{scenario:24}" + "".join(f"{c:16.2f}" if c is not None else f"{'—':>16}" for c in cells))
+    if not any(reports[n]["load"] for n in names):
+        return
+    connections = next(iter(reports.values()))["options"]["connections"]
+    print(f"\n{f'load rps / p95 ms ({connections} conn)':24}" + "".join(f"{n:>22}" for n in names))
+    for scenario in SCENARIOS:
+        row = f"{scenario:24}"
+        for n in names:
+            r = reports[n]["load"].get(scenario)
+            cell = f"{r['throughput_rps']:.0f} / {r['p95_ms']:.1f}" if r else "—"
+            if r and r["errors"]:
+                cell += f" ({r['errors']} err)"
+            row += f"{cell:>22}"
+        print(row)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SQLite mode vs plain SQLite vs MySQL (list + create endpoints)")
+    parser.add_argument("--preset", default="small", help="bench_suite.py preset (small / medium / full)")
+    parser.add_argument("--mysql-url", help="MySQL DB (e.g. mysql+pymysql://root:@localhost:3306/fpt_bench)")
+    parser.add_argument("--requests", type=int, default=200, help="In-process requests per scenario")
+    parser.add_argument("--connections", type=int, default=8, help="Load phase concurrent connections")
+    parser.add_argument("--seconds", type=float, default=3, help="Load phase: har scenario ki muddat")
+    parser.add_argument("--skip-load", action="store_true")
+    parser.add_argument("--out", help="Saare backends ki combined JSON report")
+    args = parser.parse_args()
+
+    reports = {name: run_backend(name, env, extra, args) for name, (env, extra) in backends(args).items()}
+    print_table(reports)
+    if not args.mysql_url:
+        print("\n(mysql skip: --mysql-url nahi diya)")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(reports, fh, indent=2)
+        print(f"report → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# scripts/bench_invoice_reports.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /invoices/reports (reports.py) ko bade dataset par time karta hai.
+#   Local SQLite me N invoices seed hoti hain, phir report banti hai aur waqt do
+#   hisson me report hota hai:
+#     - sql:  aggregate queries execute + fetch (DB ka kaam)
+#     - post: fetch ke baad Python/NumPy kaam (pivot, month fill, DSO)
+#   post > --max-post-ms ho to exit code 1.
+#
+# USAGE:
+#   python scripts/bench_invoice_reports.py                  (1M invoices)
+#   python scripts/bench_invoice_reports.py --invoices 200000
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import sys
+import time
+
+from local_db import make_local_app, seed
+
+
+class _TimedSession:
+    """Session proxy: execute() + fetch ka waqt alag jama karta hai."""
+
+    def __init__(self, session):
+        self._session = session
+        self.sql_seconds = 0.0
+
+    def execute(self, *args, **kwargs):
+        start = time.perf_counter()
+        rows = self._session.execute(*args, **kwargs).all()
+        self.sql_seconds += time.perf_counter() - start
+        return _Fetched(rows)
+
+
+class _Fetched:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Invoice reports benchmark")
+    parser.add_argument("--invoices", type=int, default=1_000_000)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--projects-per-client", type=int, default=10)
+    parser.add_argument("--max-post-ms", type=float, default=250)
+    args = parser.parse_args()
+
+    from sqlalchemy.orm import Session
+    from reports import invoice_reports
+
+    _, engine = make_local_app()
+    projects = args.clients * args.projects_per_client
+    per_project = max(1, args.invoices // projects)
+    start = time.perf_counter()
+    seed(engine, args.clients, projects_per_client=args.projects_per_client,
+         tasks_per_project=0, invoices_per_project=per_project, chunk=50_000)
+    print(f"seeded {projects * per_project} invoices in {time.perf_counter() - start:.1f}s")
+
+    with Session(engine) as session:
+        invoice_reports(session)  # warm-up (SQLite page cache)
+        timed = _TimedSession(session)
+        start = time.perf_counter()
+        report = invoice_reports(timed, months=24)
+        total = time.perf_counter() - start
+
+    post_ms = (total - timed.sql_seconds) * 1000
+    print(f"sql+fetch: {timed.sql_seconds * 1000:.0f} ms   post-processing: {post_ms:.1f} ms   "
+          f"clients: {len(report['clients'])}   months: {len(report['revenue_by_month'])}   "
+          f"dso: {report['dso']}")
+    ok = post_ms <= args.max_post_ms
+    print("ok" if ok else f"FAIL: post-processing > {args.max_post_ms} ms")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# scripts/bench_search.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /search ko bade dataset par time karta hai (local SQLite + FTS5; MySQL par
+#   FULLTEXT ke sath same query shape). N tasks seed hote hain (FTS triggers index
+#   bharte hain), phir har query kai baar chala kar median / max latency print hoti hai.
+#   Median > --max-ms ho to exit code 1.
+#
+# USAGE:
+#   python scripts/bench_search.py                  (1M tasks)
+#   python scripts/bench_search.py --tasks 200000
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import statistics
+import sys
+import time
+
+from local_db import make_local_app, seed
+
+QUERIES = [
+    "Task 7 of 65432",   # selective: ek project ke tasks ("of" stopword)
+    "Project 4242",      # project title
+    "client77",          # client email prefix
+    "dev3",              # common: ~1/7 tasks match (ranking ka worst case)
+    "zzz",               # koi match nahi
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="/search benchmark")
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--tasks-per-project", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+
+    app, engine = make_local_app()
+    projects = max(1, args.tasks // args.tasks_per_project)
+    clients = max(1, projects // 10)
+    start = time.perf_counter()
+    seed(engine, clients, projects_per_client=10, tasks_per_project=args.tasks_per_project,
+         invoices_per_project=0, chunk=50_000)
+    print(f"seeded {clients * 10 * args.tasks_per_project} tasks (+ FTS index) in {time.perf_counter() - start:.1f}s")
+
+    http = TestClient(app)
+    failed = False
+    for q in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            resp = http.get("/search", params={"q": q, "limit": 20})
+            timings.append((time.perf_counter() - start) * 1000)
+            assert resp.status_code == 200, resp.text
+        hits = resp.json()["data"]
+        median = statistics.median(timings)
+        status = "ok" if median <= args.max_ms else "SLOW"
+        failed |= status != "ok"
+        top = hits[0]["entity"] + "/" + str(hits[0]["id"]) if hits else "-"
+        print(f"{status:4}  {q!r:22} median {median:7.1f} ms   max {max(timings):7.1f} ms   "
+              f"hits {len(hits):3}   top {top}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
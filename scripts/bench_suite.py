@@ -0,0 +1,455 @@
+# scripts/bench_suite.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Har router ke endpoints ka reproducible benchmark → JSON report (commits ke beech compare).
+#   1. Seed: local SQLite file (ya --database-url, MySQL-compatible) configurable scale par.
+#      SQLite template file scale ke naam se bachi rehti hai (agli run seed skip); har run
+#      uski copy par chalti hai, taa-ke write scenarios agli run ka data na badlein.
+#   2. In-process: TestClient (poora ASGI stack, network nahi) se har scenario --requests baar
+#      ek ke baad ek → p50/p95/p99, throughput (1 client), ek request ka peak Python
+#      allocation (tracemalloc) aur process RSS.
+#   3. Load: app alag process me uvicorn par; --connections concurrent httpx clients har
+#      scenario par --seconds tak (closed loop) → requests/sec, p50/p95/p99, errors,
+#      server RSS / peak RSS (Linux /proc).
+#   4. --out file me JSON (git commit, scale, versions ke sath); --compare purani JSON se
+#      p95 / throughput ka muqabla — --max-regression se zyada bigde to exit code 1.
+#
+# USAGE:
+#   python scripts/bench_suite.py --preset small --out /tmp/bench.json
+#   python scripts/bench_suite.py --out bench-full.json         (10k clients, 100k projects,
+#                                                                1M tasks, 500k invoices)
+#   python scripts/bench_suite.py --preset small --only tasks,search --compare /tmp/bench.json
+#   python scripts/bench_suite.py --skip-load                     (sirf in-process)
+#
+# NOTE:
+#   Default response cache off hai (CACHE_ENABLED=0) — benchmark DB/serialization ka kaam
+#   naapta hai; production jaisa (cache on) dekhna ho to --cache.
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+
+# Sink temp file me, taa-ke repo ka logs/notifications.log na bhare (notifications import se pehle set)
+os.environ.setdefault("NOTIFICATION_LOG_FILE", os.path.join(tempfile.gettempdir(), "bench_suite.log"))
+
+from local_db import ROOT, make_local_app, seed
+
+PRESETS = {
+    "small": {"clients": 200, "projects": 2_000, "tasks": 20_000, "invoices": 10_000},
+    "medium": {"clients": 2_000, "projects": 20_000, "tasks": 200_000, "invoices": 100_000},
+    "full": {"clients": 10_000, "projects": 100_000, "tasks": 1_000_000, "invoices": 500_000},
+}
+
+
+# ── Scenarios ───────────────────────────────────────────────────
+def _client_id(n: int, scale: dict) -> int:
+    return 1 + (n * 7919) % scale["clients"]  # prime stride: ids poori range me phailte hain
+
+
+def _project_id(n: int, scale: dict) -> int:
+    return 1 + (n * 7919) % scale["projects"]
+
+
+# (name, router, method, path, request kwargs builder(n, scale)) + options:
+#   heavy → in-process me kam requests, load phase me skip (poori table stream karte hain)
+def _scenarios():
+    today = date.today().isoformat()
+    client_id, project_id = _client_id, _project_id
+
+    def read(name, router, path, params=None, heavy=False):
+        build = params if callable(params) else (lambda n, scale, p=params or {}: {"params": p})
+        return {"name": name, "router": router, "method": "GET", "path": path, "build": build, "heavy": heavy}
+
+    def write(name, router, path, body):
+        return {"name": name, "router": router, "method": "POST", "path": path,
+                "build": lambda n, scale: {"json": body(n, scale)}, "heavy": False}
+
+    search_terms = ("Project 42", "dev3", "Task 7", "client77", "nothing")
+    reads = [
+        read("ui_projects", "frontend", "/ui/projects", {"limit": 50}),
+        read("ui_projects_filtered", "frontend", "/ui/projects", {"limit": 50, "status": "ongoing"}),
+        read("ui_projects_stream", "frontend", "/ui/projects", {"stream": 1}, heavy=True),
+        read("client_view", "client", "/clients/view/{client_id}"),
+        read("clients_list", "clients_api", "/clients/list", {"limit": 50}),
+        read("projects_list", "projects", "/projects/list", {"limit": 50}),
+        read("projects_list_filtered", "projects", "/projects/list", {"limit": 50, "status": "ongoing"}),
+        read("tasks_list", "tasks", "/tasks/list", {"limit": 50}),
+        read("tasks_export", "tasks", "/tasks/export", heavy=True),
+        read("invoices_list", "invoices", "/invoices/list", {"limit": 50, "paid_status": "unpaid"}),
+        read("invoices_export", "invoices", "/invoices/export", heavy=True),
+        read("invoices_reports", "invoices", "/invoices/reports"),
+        read("dashboard", "dashboard", "/dashboard"),
+        read("dashboard_client", "dashboard", "/dashboard/clients/{client_id}"),
+        read("changes", "changes", "/changes", {"limit": 500}),
+        read("search", "search", "/search",
+             lambda n, scale: {"params": {"q": search_terms[n % len(search_terms)], "limit": 20}}),
+        read("health_db_pool", "health", "/health/db-pool"),
+        read("health_cache", "health", "/health/cache"),
+        read("metrics", "metrics", "/metrics"),
+        read("email_health", "emailer", "/email/health"),
+    ]
+    writes = [
+        write("clients_create", "clients_api", "/clients/create",
+              lambda n, scale: {"name": f"Bench {n}", "email": f"bench-{os.getpid()}-{n}@example.com"}),
+        write("clients_bulk", "clients_api", "/clients/bulk",
+              lambda n, scale: [{"name": f"Bulk {n}-{i}"} for i in range(10)]),
+        write("projects_create", "projects", "/projects/create",
+              lambda n, scale: {"title": f"Bench project {n}", "client_id": client_id(n, scale)}),
+        write("projects_bulk", "projects", "/projects/bulk",
+              lambda n, scale: [{"title": f"Bulk project {n}-{i}", "client_id": client_id(n + i, scale)}
+                                for i in range(10)]),
+        write("tasks_create", "tasks", "/tasks/create",
+              lambda n, scale: {"title": f"Bench task {n}", "project_id": project_id(n, scale)}),
+        write("tasks_bulk", "tasks", "/tasks/bulk",
+              lambda n, scale: [{"title": f"Bulk task {n}-{i}", "project_id": project_id(n + i, scale)}
+                                for i in range(100)]),
+        write("invoices_create", "invoices", "/invoices/create",
+              lambda n, scale: {"project_id": project_id(n, scale), "amount": 100 + n % 900, "issued_date": today}),
+        write("invoices_bulk", "invoices", "/invoices/bulk",
+              lambda n, scale: [{"project_id": project_id(n + i, scale), "amount": 100 + i, "issued_date": today}
+                                for i in range(10)]),
+        write("email_send", "emailer", "/email/send",
+              lambda n, scale: {"receiver": f"user{n}@example.com", "subject": "Bench"}),
+        write("email_send_batch", "emailer", "/email/send-batch",
+              lambda n, scale: {"messages": [{"receiver": f"user{n}-{i}@example.com"} for i in range(10)]}),
+        read("email_outbox_status", "emailer", "/email/outbox/1"),
+        {"name": "notification", "router": "background_task", "method": "POST",
+         "path": "/background/send-notification/user{n}@example.com", "build": lambda n, scale: {}, "heavy": False},
+    ]
+    return reads + writes
+
+
+def uncovered_routers(app, scenarios) -> list:
+    """routers/ ke wo modules jinka koi scenario nahi (naya router aaye to yahan dikhe)."""
+    from fastapi.routing import APIRoute
+
+    modules = {route.endpoint.__module__ for route in app.routes if isinstance(route, APIRoute)}
+    routers = {m.split(".", 1)[1].removesuffix("_async") for m in modules if m.startswith("routers.")}
+    return sorted(routers - {s["router"] for s in scenarios})
+
+
+def _request(scenario, n: int, scale: dict):
+    """(method, url, httpx kwargs) — path placeholders n / scale se bharte hain."""
+    kwargs = scenario["build"](n, scale)
+    path = scenario["path"].format(n=n, client_id=_client_id(n, scale), project_id=_project_id(n, scale))
+    return scenario["method"], path, kwargs
+
+
+# ── Stats helpers ───────────────────────────────────────────────
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def latency_stats(latencies) -> dict:
+    ms = [v * 1000 for v in latencies]
+    return {
+        "requests": len(ms),
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "mean_ms": round(statistics.fmean(ms), 3) if ms else 0.0,
+    }
+
+
+def proc_memory_mb(pid="self") -> dict:
+    """VmRSS / VmHWM (peak RSS) MB me — sirf Linux; warna khali dict."""
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            fields = dict(line.split(":", 1) for line in fh if line.startswith(("VmRSS", "VmHWM")))
+    except OSError:
+        return {}
+    return {"rss_mb": round(int(fields["VmRSS"].split()[0]) / 1024, 1),
+            "peak_rss_mb": round(int(fields["VmHWM"].split()[0]) / 1024, 1)}
+
+
+# ── Database ────────────────────────────────────────────────────
+def _template_path(args, scale: dict) -> str:
+    return args.db or os.path.join(
+        tempfile.gettempdir(), "fpt_bench_{clients}_{projects}_{tasks}_{invoices}.db".format(**scale))
+
+
+def run_url(args, scale: dict) -> str:
+    """Jis DB par ye run chalegi (SQLite: template ki copy)."""
+    return args.database_url or f"sqlite:///{_template_path(args, scale)}.run"
+
+
+def prepare_database(args, scale: dict):
+    """DB seed (ya seeded template reuse) + SQLite par run copy."""
+    from sqlalchemy import func, select
+
+    if args.database_url:
+        _, engine = make_local_app(args.database_url)
+        from models.client import Client
+        with engine.connect() as conn:
+            empty = not conn.execute(select(func.count()).select_from(Client)).scalar()
+        if empty:
+            _seed(engine, scale)
+        else:
+            print("database already has data — seed skipped (write scenarios rows jodte rahenge)")
+        return
+
+    template = _template_path(args, scale)
+    if args.reseed and os.path.exists(template):
+        os.remove(template)
+    if not os.path.exists(template):
+        _, engine = make_local_app(f"sqlite:///{template}.tmp")
+        _seed(engine, scale)
+        engine.dispose()
+        os.replace(f"{template}.tmp", template)  # adhoora seed kabhi template na bane
+    else:
+        print(f"reusing seeded template {template}")
+    shutil.copyfile(template, template + ".run")
+
+
+def _seed(engine, scale: dict):
+    start = time.perf_counter()
+    projects_per_client = max(1, scale["projects"] // scale["clients"])
+    projects = scale["clients"] * projects_per_client
+    seed(engine, scale["clients"], projects_per_client=projects_per_client,
+         tasks_per_project=scale["tasks"] // projects, invoices_per_project=scale["invoices"] // projects,
+         chunk=50_000)
+    print(f"seeded {scale} in {time.perf_counter() - start:.1f}s")
+
+
+# ── Phase 1: in-process ─────────────────────────────────────────
+def run_in_process(url: str, scenarios, scale: dict, args) -> dict:
+    from fastapi.testclient import TestClient
+
+    app, _ = make_local_app(url)
+    results = {}
+    counter = itertools.count()
+    with TestClient(app) as http:  # lifespan: startup hooks (DB check, notifications)
+        for scenario in scenarios:
+            total = max(3, args.requests // 10) if scenario["heavy"] else args.requests
+            for _ in range(args.warmup):
+                _send_sync(http, scenario, next(counter), scale)
+            latencies, errors = [], 0
+            started = time.perf_counter()
+            for _ in range(total):
+                t0 = time.perf_counter()
+                errors += not _send_sync(http, scenario, next(counter), scale)
+                latencies.append(time.perf_counter() - t0)
+            elapsed = time.perf_counter() - started
+
+            result = {**latency_stats(latencies), "errors": errors,
+                      "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0}
+            if args.alloc:
+                tracemalloc.start()
+                _send_sync(http, scenario, next(counter), scale)
+                result["peak_alloc_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                tracemalloc.stop()
+            result.update(proc_memory_mb())
+            results[scenario["name"]] = result
+            _print_row("in-process", scenario["name"], result)
+    return results
+
+
+def _send_sync(http, scenario, n: int, scale: dict) -> bool:
+    method, path, kwargs = _request(scenario, n, scale)
+    resp = http.request(method, path, **kwargs)
+    return resp.status_code < 400
+
+
+# ── Phase 2: load (uvicorn child + concurrent clients) ──────────
+def serve(url: str, port: int):
+    """Child process: bina seed ke app (DB pehle se tayyar) uvicorn par."""
+    import uvicorn
+
+    app, _ = make_local_app(url)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+async def _wait_ready(http, timeout: float = 60):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if (await http.get("/health/db-pool")).status_code == 200:
+                return
+        except Exception:
+            if time.perf_counter() > deadline:
+                raise
+        await asyncio.sleep(0.2)
+
+
+async def _worker(http, scenario, scale, deadline, counter, latencies, failures):
+    while time.perf_counter() < deadline:
+        method, path, kwargs = _request(scenario, next(counter), scale)
+        t0 = time.perf_counter()
+        try:
+            resp = await http.request(method, path, **kwargs)
+            ok = resp.status_code < 400
+        except Exception:
+            ok = False
+        latencies.append(time.perf_counter() - t0)
+        failures[0] += not ok
+
+
+async def _load(url: str, scenarios, scale: dict, args, pid: int) -> dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.connections)
+    results = {}
+    counter = itertools.count(10_000_000)  # in-process phase ke ids se alag (unique emails)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=120) as http:
+        await _wait_ready(http)
+        for scenario in scenarios:
+            if scenario["heavy"]:
+                continue
+            latencies, failures = [], [0]
+            started = time.perf_counter()
+            deadline = started + args.seconds
+            await asyncio.gather(*[
+                _worker(http, scenario, scale, deadline, counter, latencies, failures)
+                for _ in range(args.connections)
+            ])
+            elapsed = time.perf_counter() - started
+            result = {**latency_stats(latencies), "errors": failures[0],
+                      "throughput_rps": round(len(latencies) / elapsed, 1), "connections": args.connections}
+            result.update({f"server_{k}": v for k, v in proc_memory_mb(pid).items()})
+            results[scenario["name"]] = result
+            _print_row("load", scenario["name"], result)
+    return results
+
+
+def run_load(url: str, scenarios, scale: dict, args) -> dict:
+    server = multiprocessing.get_context("spawn").Process(target=serve, args=(url, args.port), daemon=True)
+    server.start()
+    try:
+        return asyncio.run(_load(url, scenarios, scale, args, server.pid))
+    finally:
+        server.terminate()
+        server.join(10)
+
+
+# ── Report / compare ────────────────────────────────────────────
+def _print_row(phase: str, name: str, result: dict):
+    print(f"{phase:10} {name:24} rps {result['throughput_rps']:9.1f}   p50 {result['p50_ms']:8.2f}   "
+          f"p95 {result['p95_ms']:8.2f}   p99 {result['p99_ms']:8.2f} ms   errors {result['errors']}")
+
+
+def _git_commit() -> dict:
+    def git(*cmd):
+        return subprocess.run(["git", *cmd], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    try:
+        return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except OSError:
+        return {"commit": None, "dirty": None}
+
+
+def compare(report: dict, baseline: dict, max_regression: float, slack_ms: float) -> list:
+    """Har phase/scenario: p95 zyada ho gaya ya throughput gir gaya → regression list."""
+    regressions = []
+    for phase in ("in_process", "load"):
+        old_phase, new_phase = baseline.get(phase) or {}, report.get(phase) or {}
+        for name in sorted(set(old_phase) & set(new_phase)):
+            old, new = old_phase[name], new_phase[name]
+            p95_limit = old["p95_ms"] * (1 + max_regression) + slack_ms
+            rps_limit = old["throughput_rps"] / (1 + max_regression)
+            worse = new["p95_ms"] > p95_limit or (phase == "load" and new["throughput_rps"] < rps_limit)
+            print(f"{'REGRESSED' if worse else 'ok':9} {phase:10} {name:24} "
+                  f"p95 {old['p95_ms']:8.2f} → {new['p95_ms']:8.2f} ms   "
+                  f"rps {old['throughput_rps']:9.1f} → {new['throughput_rps']:9.1f}")
+            if worse:
+                regressions.append(f"{phase}/{name}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reproducible benchmark suite for every router")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="full")
+    for table in ("clients", "projects", "tasks", "invoices"):
+        parser.add_argument(f"--{table}", type=int, help=f"Override preset: {table} count")
+    parser.add_argument("--database-url", help="MySQL-compatible DB (default: local SQLite template)")
+    parser.add_argument("--db", help="SQLite template file path")
+    parser.add_argument("--reseed", action="store_true", help="SQLite template dobara seed karo")
+    parser.add_argument("--only", help="Comma-separated routers ya scenario names")
+    parser.add_argument("--requests", type=int, default=50, help="In-process requests per scenario")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--no-alloc", dest="alloc", action="store_false", help="tracemalloc peak skip")
+    parser.add_argument("--skip-load", action="store_true")
+    parser.add_argument("--connections", type=int, default=8, help="Load phase concurrent connections")
+    parser.add_argument("--seconds", type=float, default=3, help="Load phase: har scenario ki muddat")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--cache", action="store_true", help="Response cache on rakho")
+    parser.add_argument("--out", help="JSON report file")
+    parser.add_argument("--compare", help="Purani JSON report (baseline)")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="0.2 = 20%% bigarna regression")
+    parser.add_argument("--slack-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    # App import se pehle (child process bhi env inherit karta hai)
+    os.environ["CACHE_ENABLED"] = "1" if args.cache else "0"
+    os.environ.setdefault("PROFILE_ENABLED", "0")
+
+    scale = {table: getattr(args, table) or PRESETS[args.preset][table]
+             for table in ("clients", "projects", "tasks", "invoices")}
+    scenarios = _scenarios()
+    if args.only:
+        wanted = {name.strip() for name in args.only.split(",")}
+        scenarios = [s for s in scenarios if s["name"] in wanted or s["router"] in wanted]
+
+    # App import (make_local_app) se pehle: app ka apna engine (startup DB check) bhi isi DB par
+    url = run_url(args, scale)
+    os.environ["DATABASE_URL"] = url
+    prepare_database(args, scale)
+
+    import fastapi
+    import sqlalchemy
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": {"fastapi": fastapi.__version__, "sqlalchemy": sqlalchemy.__version__},
+        "database": url.split(":", 1)[0],
+        "scale": scale,
+        "options": {k: getattr(args, k) for k in ("requests", "warmup", "connections", "seconds", "cache")},
+        "scenarios": {s["name"]: {"router": s["router"], "method": s["method"], "path": s["path"]}
+                      for s in scenarios},
+    }
+    if not args.only:
+        app, _ = make_local_app(url)
+        report["uncovered_routers"] = uncovered_routers(app, scenarios)
+        if report["uncovered_routers"]:
+            print(f"warning: no scenarios for routers: {', '.join(report['uncovered_routers'])}")
+    report["in_process"] = run_in_process(url, scenarios, scale, args)
+    report["load"] = {} if args.skip_load else run_load(url, scenarios, scale, args)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"report → {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if baseline.get("scale") != scale:
+            print(f"warning: baseline scale {baseline.get('scale')} != {scale}")
+        regressions = compare(report, baseline, args.max_regression, args.slack_ms)
+        if regressions:
+            print(f"FAIL: {len(regressions)} regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
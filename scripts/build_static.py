@@ -0,0 +1,118 @@
+# scripts/build_static.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Static assets ka build step (deploy se pehle ek baar):
+#   - static/ ki har file → static/dist/<name>.<content hash>.<ext> (fingerprint)
+#     → /static mount inhein "immutable, max-age=1 year" ke sath bhejta hai (static_assets.py)
+#   - Text files (CSS/JS/SVG/JSON/HTML...) ke precompressed variants max level par:
+#     .gz (hamesha), .br (brotli install ho), .zst (zstandard install ho)
+#     → request par compression ka CPU zero, aur build-time par best ratio
+#   - index.html (email form page, server.py) → static/dist/index.html + variants,
+#     andar ke /static/... links hashed URLs me badal kar
+#   - static/dist/manifest.json: original → hashed naam (templates me static_url())
+#
+# USAGE:
+#   python scripts/build_static.py            (purane hashed files rehte hain — pehle se
+#                                              khule pages ke links na tootein)
+#   python scripts/build_static.py --clean    (dist/ saaf karke naya build)
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import hashlib
+import json
+import mimetypes
+import re
+import shutil
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from compression import CODECS, EXTENSIONS, compress_bytes, is_compressible
+
+STATIC = ROOT / "static"
+DIST = STATIC / "dist"
+INDEX_HTML = ROOT / "index.html"
+
+# Build-time par waqt ki fikr nahi → har codec ka max level
+BUILD_LEVELS = {"gzip": 9, "br": 11, "zstd": 19}
+MIN_COMPRESS_SIZE = 256  # is se chhoti files ka compressed version aksar bara hota hai
+HASH_LENGTH = 10         # static_assets.FINGERPRINTED isi length ka pattern dhoondta hai
+
+STATIC_REF = re.compile(r"""(?<=["'(])/static/([^"')?#\s]+)""")
+
+
+def fingerprint(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def write_variants(path: Path, data: bytes) -> list:
+    """path ke sath .gz / .br / .zst likho (sirf jo original se chhote hon); encodings return."""
+    for ext in EXTENSIONS.values():
+        Path(str(path) + ext).unlink(missing_ok=True)  # purana variant (e.g. index.html) na reh jaye
+    media = mimetypes.guess_type(path.name)[0] or ""
+    if len(data) < MIN_COMPRESS_SIZE or not is_compressible(media):
+        return []
+    written = []
+    for encoding in CODECS:
+        packed = compress_bytes(data, encoding, BUILD_LEVELS[encoding])
+        if len(packed) < len(data):
+            Path(str(path) + EXTENSIONS[encoding]).write_bytes(packed)
+            written.append((encoding, len(packed)))
+    return written
+
+
+def rewrite_static_refs(text: str, files: dict) -> str:
+    """ "/static/index.css" → "/static/dist/index.<hash>.css" (manifest me ho to)."""
+    def _swap(match):
+        entry = files.get(match.group(1))
+        return f"/static/dist/{entry['file']}" if entry else match.group(0)
+    return STATIC_REF.sub(_swap, text)
+
+
+def build(clean: bool = False) -> dict:
+    if clean and DIST.exists():
+        shutil.rmtree(DIST)
+    DIST.mkdir(parents=True, exist_ok=True)
+
+    files, report = {}, []
+    for source in sorted(p for p in STATIC.rglob("*") if p.is_file() and DIST not in p.parents):
+        rel = source.relative_to(STATIC).as_posix()
+        data = source.read_bytes()
+        hashed = source.relative_to(STATIC).with_name(f"{source.stem}.{fingerprint(data)}{source.suffix}")
+        target = DIST / hashed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        variants = write_variants(target, data)
+        files[rel] = {"file": hashed.as_posix(), "size": len(data), "encodings": [enc for enc, _ in variants]}
+        report.append((rel, len(data), variants))
+
+    # index.html: entry page (URL fix rehta hai → hash nahi, server.py revalidate karwata hai)
+    if INDEX_HTML.exists():
+        html = rewrite_static_refs(INDEX_HTML.read_text(encoding="utf-8"), files).encode("utf-8")
+        (DIST / "index.html").write_bytes(html)
+        report.append(("index.html", len(html), write_variants(DIST / "index.html", html)))
+
+    manifest = {"files": files}
+    (DIST / "manifest.json").write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+    print(f"{'file':32} {'bytes':>8}  variants")
+    for name, size, variants in report:
+        sizes = "  ".join(f"{enc}={packed} ({packed * 100 // size}%)" for enc, packed in variants) or "—"
+        print(f"{name:32} {size:8}  {sizes}")
+    print(f"📦 {len(files)} static files → {DIST.relative_to(ROOT)} (codecs: {', '.join(CODECS)})")
+    return manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fingerprint + precompress static assets")
+    parser.add_argument("--clean", action="store_true", help="dist/ pehle saaf karo")
+    args = parser.parse_args()
+    build(clean=args.clean)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
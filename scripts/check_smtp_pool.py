@@ -0,0 +1,77 @@
+# scripts/check_smtp_pool.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   smtp_pool.py ko local aiosmtpd stand-in ke khilaf chalata hai (asli SMTP
+#   provider ki zaroorat nahi):
+#   - send_many() → saare messages pohanche, connections <= pool size
+#   - server restart → stale connection par khud reconnect
+#   - per-connection message cap → connection recycle hoti hai
+#
+# USAGE:
+#   pip install aiosmtpd
+#   python scripts/check_smtp_pool.py        (exit code 1 = failure)
+# ────────────────────────────────────────────────────────────────
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from smtp_pool import SMTPConnectionPool, build_message
+
+HOST, PORT = "127.0.0.1", 8025
+MESSAGES = 500
+
+
+class _Counter:
+    received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        _Counter.received += 1
+        return "250 OK"
+
+
+def _start():
+    from aiosmtpd.controller import Controller
+
+    controller = Controller(_Counter(), hostname=HOST, port=PORT)
+    controller.start()
+    return controller
+
+
+def main() -> int:
+    failed = False
+    controller = _start()
+    pool = SMTPConnectionPool(HOST, PORT, security="none", max_connections=3,
+                              max_messages_per_connection=100)
+    msgs = [build_message(f"user{i}@example.com", "Hi", "Body", "app@example.com")
+            for i in range(MESSAGES)]
+
+    # 1️⃣ Batch send
+    start = time.perf_counter()
+    results = pool.send_many(msgs)
+    elapsed = time.perf_counter() - start
+    sent = sum(ok for ok, _ in results)
+    stats = pool.snapshot()
+    print(f"batch: {sent}/{MESSAGES} sent in {elapsed:.2f}s over {stats['connections_opened']} connections")
+    failed |= sent != MESSAGES or _Counter.received != MESSAGES
+    # 500 messages / 100 per connection → kam az kam 5 connections, zyada nahi
+    failed |= stats["connections_opened"] > MESSAGES // 100 + pool.max_connections
+
+    # 2️⃣ Server restart → pool me padi connections stale; send phir bhi kaamyab
+    controller.stop()
+    controller = _start()
+    pool.send(build_message("late@example.com", "Hi", "Body", "app@example.com"))
+    stats = pool.snapshot()
+    print(f"after restart: reconnects={stats['reconnects']} received={_Counter.received}")
+    failed |= stats["reconnects"] < 1 or _Counter.received != MESSAGES + 1
+
+    pool.close_all()
+    controller.stop()
+    print("FAIL" if failed else "ok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# scripts/local_db.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Dev scripts (query checks, load tests) ke liye shared helpers:
+#   - FastAPI app ko ek local SQLite DB ke sath wire karna (MySQL ki zaroorat nahi)
+#   - Tables me sample data tez raftaar se seed karna (Core executemany)
+# ────────────────────────────────────────────────────────────────
+
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)  # main.py "static" / "templates" relative paths use karta hai
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+def make_local_app(url: str = "sqlite://"):
+    """
+    App ko local DB ke sath chalata hai.
+    Returns: (app, engine) — engine par event listeners laga kar SQL observe kar sakte hain.
+    url == DATABASE_URL (e.g. bench_suite) → app ke apne engines / SessionLocal hi (SQLite mode:
+    pragmas + writer routing), taa-ke benchmark wahi config naape jo production me chalti hai.
+    """
+    import database
+
+    in_memory = url in ("sqlite://", "sqlite:///:memory:")
+    if url == database.DB_URL and not in_memory:  # in-memory: app engine ka har connection alag DB
+        import main
+        database.init_db()
+        _clear_caches()
+        main.app.dependency_overrides.pop(database.get_db, None)
+        return main.app, database.engine
+
+    kwargs = {"connect_args": {"check_same_thread": False}}
+    if in_memory:
+        kwargs["poolclass"] = StaticPool  # in-memory DB sab threads me same connection share kare
+    engine = create_engine(url, **kwargs)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    import main
+    import models.client, models.project, models.task, models.invoice, models.email_outbox  # noqa: F401 (tables register)
+
+    database.Base.metadata.create_all(engine)
+
+    from metrics import instrument_sql
+    instrument_sql(engine)  # /metrics me local DB ki SQL count / time bhi aaye
+
+    _clear_caches()
+
+    def _get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[database.get_db] = _get_db
+    return main.app, engine
+
+
+def _clear_caches():
+    from cache import response_cache
+    from templating import fragment_cache
+    response_cache.clear()  # naya DB → pichle app/DB ke cached responses bekaar
+    fragment_cache.clear()
+
+
+def seed(engine, clients: int, projects_per_client: int = 2, tasks_per_project: int = 3,
+         invoices_per_project: int = 1, chunk: int = 5000):
+    """
+    Har table me deterministic sample rows daalta hai (ids 1..N sequence me).
+    change_seq = 0 (migration ki purani rows jaisa): Core inserts session ke commit hook se nahi guzarte.
+    """
+    from models.client import Client
+    from models.project import Project
+    from models.task import Task
+    from models.invoice import Invoice
+
+    today = date.today()
+
+    def _chunks(rows):
+        for i in range(0, len(rows), chunk):
+            yield rows[i:i + chunk]
+
+    with engine.begin() as conn:
+        rows = [{"name": f"Client {c}", "email": f"client{c}@example.com", "is_deleted": 0,
+                 "change_seq": 0}
+                for c in range(1, clients + 1)]
+        for part in _chunks(rows):
+            conn.execute(insert(Client), part)
+
+        project_rows, task_rows, invoice_rows = [], [], []
+        project_id = 0
+        for c in range(1, clients + 1):
+            for p in range(projects_per_client):
+                project_id += 1
+                project_rows.append({
+                    "title": f"Project {project_id}", "client_id": c,
+                    "status": ("planned", "ongoing", "on_hold", "completed")[project_id % 4],
+                    "budget": 1000 * (project_id % 50 + 1), "is_deleted": 0, "change_seq": 0,
+                    "start_date": today - timedelta(days=project_id % 365),
+                })
+                for t in range(tasks_per_project):
+                    task_rows.append({
+                        "project_id": project_id, "title": f"Task {t} of {project_id}",
+                        "assigned_to": f"dev{t % 7}", "completed": t % 3 == 0, "is_deleted": 0, "change_seq": 0,
+                        "due_date": today + timedelta(days=(project_id + t) % 90 - 30),
+                    })
+                for i in range(invoices_per_project):
+                    issued = today - timedelta(days=(project_id * 7 + i) % 400)
+                    invoice_rows.append({
+                        "project_id": project_id, "amount": 100 + (project_id * 13 + i) % 5000,
+                        "issued_date": issued, "due_date": issued + timedelta(days=30),
+                        "paid_status": "paid" if (project_id + i) % 3 == 0 else "unpaid", "is_deleted": 0,
+                        "change_seq": 0,
+                    })
+        for model, all_rows in ((Project, project_rows), (Task, task_rows), (Invoice, invoice_rows)):
+            for part in _chunks(all_rows):
+                conn.execute(insert(model), part)
+
+    # Core inserts session events se nahi guzarte → response cache khud invalidate karo
+    from cache import response_cache
+    response_cache.invalidate("clients", "projects", "tasks", "invoices")
@@ -0,0 +1,167 @@
+# scripts/notification_load.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Load test: notifications produce hote waqt baqi API ki latency par asar?
+#   App alag process me uvicorn par chalti hai (local SQLite, seeded), taa-ke load
+#   generator ka CPU server ke sath share na ho. Do phases, dono me probe clients
+#   Teen phases, har ek me probe clients /projects/list ko fixed rate (--probe-rate) par hit karte hain:
+#     A) idle — aur koi traffic nahi
+#     B) control — sath me --rate/sec no-op (404) requests (sirf HTTP/CPU ka kharcha)
+#     C) notifications — sath me --rate/sec /background/send-notification/{email}
+#   Har phase ki p50/p95/p99 print hoti hai; C ki p99, B se --max-p99-ratio guna
+#   (+ --slack-ms) zyada ho to exit code 1 — yani pipeline khud latency na barhaye.
+#
+# USAGE:
+#   python scripts/notification_load.py
+#   python scripts/notification_load.py --seconds 10 --rate 1000 --producers 8
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Sink temp file me, taa-ke repo ka logs/notifications.log na bhare (notifications import se pehle set)
+os.environ.setdefault("NOTIFICATION_LOG_FILE", os.path.join(tempfile.gettempdir(), "notification_load.log"))
+
+from local_db import make_local_app, seed
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def summary(name: str, latencies) -> dict:
+    ms = [v * 1000 for v in latencies]
+    stats = {
+        "requests": len(ms),
+        "p50_ms": round(percentile(ms, 50), 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+        "mean_ms": round(statistics.fmean(ms), 2) if ms else 0.0,
+    }
+    print(f"{name:28} " + "  ".join(f"{k}={v}" for k, v in stats.items()))
+    return stats
+
+
+async def probe(http, deadline: float, interval: float, latencies: list):
+    # Open-loop (fixed rate): server saturate na ho, sirf notifications ka asar dikhe
+    next_at = time.perf_counter()
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        resp = await http.get("/projects/list", params={"limit": 50})
+        latencies.append(time.perf_counter() - start)
+        if resp.status_code != 200:
+            raise SystemExit(f"/projects/list returned {resp.status_code}")
+        next_at += interval
+        await asyncio.sleep(max(next_at - time.perf_counter(), 0))
+
+
+async def produce(http, deadline: float, interval: float, counts: dict, worker: int, path: str):
+    n = 0
+    next_at = time.perf_counter()
+    while time.perf_counter() < deadline:
+        resp = await http.post(path.format(worker=worker, n=n))
+        counts[resp.status_code] = counts.get(resp.status_code, 0) + 1
+        n += 1
+        next_at += interval
+        await asyncio.sleep(max(next_at - time.perf_counter(), 0))
+
+
+def serve(port: int):
+    """Child process: seeded local app uvicorn par (startup hook notification pipeline start karta hai)."""
+    import uvicorn
+
+    # File-based SQLite: app ka apna engine (startup DB check) bhi isi DB par
+    db_path = os.path.join(tempfile.gettempdir(), "notification_load.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    url = f"sqlite:///{db_path}"
+    os.environ["DATABASE_URL"] = url
+    app, engine = make_local_app(url)
+    seed(engine, 200, projects_per_client=3, tasks_per_project=2, invoices_per_project=1)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+async def wait_ready(http, timeout: float = 30):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if (await http.get("/projects/list")).status_code == 200:
+                return
+        except Exception:
+            if time.perf_counter() > deadline:
+                raise
+        await asyncio.sleep(0.2)
+
+
+async def run(args) -> int:
+    import httpx
+
+    server = multiprocessing.get_context("spawn").Process(target=serve, args=(args.port,), daemon=True)
+    server.start()
+    try:
+        return await measure(args, httpx)
+    finally:
+        server.terminate()  # SIGTERM → shutdown hook pending notifications flush karta hai
+        server.join(10)
+
+
+async def phase(http, args, producer_path=None):
+    """--seconds tak probes chalao (aur producer_path ho to sath me producers). Returns: (latencies, counts)"""
+    latencies, counts = [], {}
+    deadline = time.perf_counter() + args.seconds
+    jobs = [probe(http, deadline, args.probes / args.probe_rate, latencies) for _ in range(args.probes)]
+    if producer_path:
+        interval = args.producers / args.rate
+        jobs += [produce(http, deadline, interval, counts, w, producer_path) for w in range(args.producers)]
+    await asyncio.gather(*jobs)
+    return latencies, counts
+
+
+async def measure(args, httpx) -> int:
+    limits = httpx.Limits(max_connections=args.probes + args.producers)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits) as http:
+        await wait_ready(http)
+        idle, _ = await phase(http, args)
+        # Control: same rate par ek no-op (404) route — HTTP/CPU ka apna kharcha
+        control, _ = await phase(http, args, "/load-test-noop/{worker}/{n}")
+        loaded, counts = await phase(http, args, "/background/send-notification/user{worker}_{n}@example.com")
+
+    summary("idle /projects/list", idle)
+    base = summary("+ no-op requests (control)", control)
+    load = summary("+ notifications", loaded)
+    produced = sum(counts.values())
+    print(f"notifications: {produced} requests in {args.seconds}s "
+          f"({produced / args.seconds:.0f}/s), status codes {counts}")
+
+    # Pipeline ka asar = notifications phase vs control (same request rate)
+    limit = base["p99_ms"] * args.max_p99_ratio + args.slack_ms
+    ok = load["p99_ms"] <= limit and set(counts) == {200}
+    print(f"{'ok' if ok else 'FAIL'}: p99 {load['p99_ms']}ms (limit {limit:.2f}ms)")
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Notification pipeline load test")
+    parser.add_argument("--seconds", type=float, default=10, help="Har phase ki muddat")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--probes", type=int, default=4, help="Concurrent /projects/list clients")
+    parser.add_argument("--probe-rate", type=float, default=40, help="/projects/list requests per second (total)")
+    parser.add_argument("--producers", type=int, default=4, help="Concurrent notification clients")
+    parser.add_argument("--rate", type=float, default=200, help="Notifications per second (total)")
+    parser.add_argument("--max-p99-ratio", type=float, default=1.5)
+    parser.add_argument("--slack-ms", type=float, default=5)
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
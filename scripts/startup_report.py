@@ -0,0 +1,176 @@
+# scripts/startup_report.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Worker boot time ka report (autoscaling / rolling restart jitni tez, utna behtar):
+#   - Fresh process me "import main" aur app startup (startup hooks: DB pool warm-up,
+#     notification worker) ka wall-clock — kai runs ka median
+#   - python -X importtime se sab se mehngi imports: third-party packages (saare
+#     submodules ka self time jor kar) aur repo ke apne modules
+#   - Heavy modules (numpy, pandas, django) boot par load hue to FAIL — ye sirf un
+#     features me lazily import hone chahiyen jo inhein use karte hain
+#   - --preload: gunicorn preload_app jaisa (run.py WEB_PRELOAD=1) — app ek baar import,
+#     phir har worker fork; worker boot = fork + startup hooks (budget isi par lagta hai)
+#
+# USAGE:
+#   python scripts/startup_report.py                    (local SQLite DB par)
+#   python scripts/startup_report.py --budget-ms 300    (median boot is se zyada → exit 1)
+#   python scripts/startup_report.py --preload --budget-ms 300
+#   DATABASE_URL=mysql+pymysql://... python scripts/startup_report.py --keep-db-url
+# ────────────────────────────────────────────────────────────────
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("numpy", "pandas", "django")
+
+# Child process: import + startup time, aur boot ke baad kaun se heavy modules load the
+BOOT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app):
+    t2 = time.perf_counter()
+    heavy = sorted(m for m in sys.modules if m.split(".")[0] in %r and "." not in m)
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "startup_ms": (t2 - t1) * 1000, "heavy": heavy}))
+""" % (HEAVY_MODULES,)
+
+# Child process: main ek baar import, phir har run me fork → worker ready hone tak ka waqt
+PRELOAD_PROBE = """
+import json, os, sys, time
+import main
+from fastapi.testclient import TestClient
+boots = []
+for _ in range(%d):
+    read_fd, write_fd = os.pipe()
+    t0 = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        with TestClient(main.app):
+            ready_ms = (time.perf_counter() - t0) * 1000
+        os.write(write_fd, str(ready_ms).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as fh:
+        boots.append(float(fh.read()))
+    os.waitpid(pid, 0)
+print(json.dumps(boots))
+"""
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _env(keep_db_url: bool) -> dict:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # .pyc likhe jayen (asal deploy jaisa warm boot)
+    if not keep_db_url:
+        # Local SQLite file: startup ka DB warm-up bhi asal connection kholta hai
+        env["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.gettempdir(), "fpt_startup_report.db")
+    return env
+
+
+def boot_times(runs: int, env: dict) -> list:
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", BOOT_PROBE], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def preload_boot_times(runs: int, env: dict) -> list:
+    out = subprocess.run([sys.executable, "-c", PRELOAD_PROBE % runs], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def import_profile(env: dict):
+    """-X importtime → [(self_us, cumulative_us, depth, module)]."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            rows.append((int(match.group(1)), int(match.group(2)), len(match.group(3)) // 2, match.group(4)))
+    return rows
+
+
+def project_modules() -> set:
+    names = {p.stem for p in ROOT.glob("*.py")}
+    names |= {d.name for d in ROOT.iterdir() if d.is_dir() and any(d.glob("*.py"))}
+    return names
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Worker boot time + import-time report")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="median boot ki had (--preload ho to forked worker ka boot)")
+    parser.add_argument("--preload", action="store_true", help="fork se bane workers ka boot bhi napo (POSIX)")
+    parser.add_argument("--keep-db-url", action="store_true", help="DATABASE_URL env ko na badlo")
+    args = parser.parse_args()
+    env = _env(args.keep_db_url)
+
+    boot_times(1, env)  # pehla run: .pyc files + SQLite file ban jayen (cold disk cache ka asar nahi)
+    runs = boot_times(args.runs, env)
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    startup_ms = statistics.median(r["startup_ms"] for r in runs)
+    boot_ms = statistics.median(r["import_ms"] + r["startup_ms"] for r in runs)
+
+    preload_ms = None
+    if args.preload:
+        if not hasattr(os, "fork"):
+            parser.error("--preload ke liye os.fork chahiye (Linux / macOS)")
+        preload_ms = statistics.median(preload_boot_times(args.runs, env))
+
+    rows = import_profile(env)
+    ours = project_modules()
+    packages = {}
+    for self_us, _, _, name in rows:
+        package = name.split(".")[0]
+        if package not in ours:
+            packages[package] = packages.get(package, 0) + self_us
+    own = sorted((r for r in rows if r[3].split(".")[0] in ours), key=lambda r: -r[0])
+
+    print(f"⏱️  boot (median of {args.runs}): {boot_ms:.0f} ms  = import main {import_ms:.0f} ms"
+          f" + startup hooks {startup_ms:.0f} ms")
+    if preload_ms is not None:
+        print(f"⏱️  preloaded worker boot (fork + startup hooks, median of {args.runs}): {preload_ms:.0f} ms")
+    print("\nThird-party packages (saare submodules ka self time; -X importtime ke saath thora zyada):")
+    for name, total_us in sorted(packages.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"  {total_us / 1000:8.1f} ms  {name}")
+    print("\nRepo modules (self time):")
+    for self_us, cum_us, _, name in own[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}  (cumulative {cum_us / 1000:.1f} ms)")
+
+    failed = False
+    heavy = sorted({m for r in runs for m in r["heavy"]})
+    if heavy:
+        failed = True
+        print(f"\nFAIL  heavy modules loaded at boot: {', '.join(heavy)} (feature ke andar lazy import karein)")
+    else:
+        print(f"\nok    heavy modules ({', '.join(HEAVY_MODULES)}) boot par load nahi hue")
+    if args.budget_ms is not None:
+        measured = preload_ms if preload_ms is not None else boot_ms
+        over = measured > args.budget_ms
+        failed |= over
+        label = "preloaded worker boot" if preload_ms is not None else "boot"
+        print(f"{'FAIL' if over else 'ok':5} {label} {measured:.0f} ms vs budget {args.budget_ms:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
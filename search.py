@@ -0,0 +1,311 @@
+# search.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /search ka engine: projects, tasks aur clients me keyword search, ranked + paginated.
+#     projects → title, description
+#     tasks    → title, description, assigned_to
+#     clients  → name, company_name, email
+#
+# BACKENDS (DB dialect ke hisaab se):
+#   - MySQL:  FULLTEXT index per table, MATCH(...) AGAINST(:q IN BOOLEAN MODE) score
+#   - SQLite: FTS5 virtual table per table (external content = asal table, triggers se
+#             sync), bm25() score — local/test runs
+#   - Baqi / FTS na mile: LIKE '%term%' fallback (rank nahi, sirf newest-first)
+#   Index sirf matching rows deta hai — poori table scan nahi hoti.
+#
+# RANKING (bounded):
+#   Relevance score (bm25 / MATCH) har matching row ke liye banta hai — "dev3" jaisa
+#   term 1M tasks me ~140k rows match kare to sirf ranking hi ~150 ms le leti hai.
+#   Is liye pehle har entity ke matches gine jate hain (SEARCH_RANK_LIMIT + 1 tak, index
+#   se sasta); itne ya kam hon to relevance order, zyada hon to newest-first (id DESC,
+#   score 0) — itne matches me relevance waise bhi beyond-page-1 bekaar hai.
+#   SQLite bm25 har query term ki IDF ke liye us term ki poori doclist padhta hai; jo term
+#   SEARCH_RANK_LIMIT se zyada rows me ho (e.g. seed data me "task") wo score me nahi,
+#   sirf EXISTS filter me lagta hai (MySQL ye stats index me rakhta hai, wahan zaroorat nahi).
+#
+# QUERY:
+#   User ke text se words (\w+) nikalte hain, aam stopwords ("of", "the", ...) hat jate hain;
+#   har word zaroori hai, aakhri word (2+ letters) prefix match ("invoice back" → "invoice backend").
+#   Operators / quotes user se nahi aate.
+#
+# ENV VARS:
+#   SEARCH_RANK_LIMIT=5000   → is se zyada matches wali entity newest-first
+#
+# SCHEMA:
+#   create_all par DDL khud chalti hai (after_create hooks neeche) — is liye ye module
+#   create_all se PEHLE import hona chahiye (main.py → routers/search.py karta hai).
+#   Purane MySQL DB par: migrations/0004_search_fulltext.sql
+#   Purani SQLite file par: database.init_db() missing FTS tables bana kar bharta hai
+# ────────────────────────────────────────────────────────────────
+
+import os
+import re
+import weakref
+
+from sqlalchemy import (DDL, Float, String, and_, column, event, func, literal, literal_column, or_, select,
+                        table, text, union_all)
+from sqlalchemy.dialects.mysql import match as mysql_match
+
+from models.client import Client
+from models.project import Project
+from models.task import Task
+from schemas.client import ClientOut
+from schemas.project import ProjectOut
+from schemas.task import TaskOut
+from serialization import rows_by_id
+
+MAX_TERMS = 8
+PREFIX_MIN = 2     # "7" jaisa 1-letter prefix lakhon tokens se match karta hai → exact hi
+MAX_OFFSET = 1000  # ranked results: itne se aage ke pages ka koi faida nahi (query behtar karein)
+SEARCH_RANK_LIMIT = int(os.getenv("SEARCH_RANK_LIMIT", "5000"))
+
+# MySQL InnoDB ki default stopword list ka chhota hissa — har row me hote hain, filter kuch nahi karte
+STOPWORDS = {"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it",
+             "of", "on", "or", "the", "to", "with"}
+
+# entity → (model, output schema, searchable columns — pehla column sab se zyada weight)
+ENTITIES = {
+    "clients": (Client, ClientOut, ("name", "company_name", "email")),
+    "projects": (Project, ProjectOut, ("title", "description")),
+    "tasks": (Task, TaskOut, ("title", "description", "assigned_to")),
+}
+
+# bm25 column weights (title/name match description se zyada relevant)
+_WEIGHTS = {"title": 10.0, "name": 10.0, "company_name": 5.0, "email": 5.0,
+            "assigned_to": 5.0, "description": 2.0}
+
+
+# ── DDL: MySQL FULLTEXT + SQLite FTS5 (external content + triggers) ──
+def _fts5_ddl(table: str, columns) -> list:
+    """
+    FTS5 index me sirf active rows (is_deleted = 0) — search query ko asal table se
+    JOIN karke soft-deleted rows filter nahi karni parti.
+    """
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    add = f"INSERT INTO {fts}(rowid, {cols}) SELECT new.id, {new} WHERE new.is_deleted = 0;"
+    remove = f"INSERT INTO {fts}({fts}, rowid, {cols}) SELECT 'delete', old.id, {old} WHERE old.is_deleted = 0;"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+        # prefix index: 2–4 letter prefixes ("ta"*, "task"*) ek lookup; warna har matching token ki list merge
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3 4')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {add} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {remove} END",
+        # Sirf searchable columns / is_deleted badlen to re-index (updated_at waghera par nahi)
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols}, is_deleted ON {table} BEGIN {remove} {add} END",
+    ]
+
+
+def _register_ddl():
+    for model, _, columns in ENTITIES.values():
+        table = model.__table__
+        event.listen(table, "after_create", DDL(
+            f"ALTER TABLE {table.name} ADD FULLTEXT INDEX ft_{table.name}_search ({', '.join(columns)})"
+        ).execute_if(dialect="mysql"))
+        for statement in _fts5_ddl(table.name, columns):
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+        event.listen(table, "before_drop", DDL(f"DROP TABLE IF EXISTS {table.name}_fts").execute_if(dialect="sqlite"))
+
+
+_register_ddl()
+
+
+def rebuild_sqlite_index(connection):
+    """Purani SQLite file (FTS tables baad me bani) ke liye: FTS index active rows se dobara."""
+    for name, (_, _, columns) in ENTITIES.items():
+        cols = ", ".join(columns)
+        connection.exec_driver_sql(f"INSERT INTO {name}_fts({name}_fts) VALUES ('delete-all')")
+        connection.exec_driver_sql(
+            f"INSERT INTO {name}_fts(rowid, {cols}) SELECT id, {cols} FROM {name} WHERE is_deleted = 0"
+        )
+
+
+def ensure_sqlite_fts(connection) -> list:
+    """
+    database.init_db(): create_all sirf nayi tables par after_create chalata hai — purani SQLite
+    file (tables pehle se, FTS nahi) me missing FTS5 table + triggers bana kar active rows se bharo.
+    """
+    created = []
+    for name, (_, _, columns) in ENTITIES.items():
+        found = connection.exec_driver_sql(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = ?", (f"{name}_fts",)
+        ).scalar()
+        if found:
+            continue
+        for statement in _fts5_ddl(name, columns):
+            connection.exec_driver_sql(statement)
+        cols = ", ".join(columns)
+        connection.exec_driver_sql(
+            f"INSERT INTO {name}_fts(rowid, {cols}) SELECT id, {cols} FROM {name} WHERE is_deleted = 0"
+        )
+        created.append(name)
+    if created:
+        _fts_engines.clear()  # "FTS nahi hai" wala purana faisla bhool jao
+    return created
+
+
+# ── Query building ──────────────────────────────────────────────
+def terms_of(q: str) -> list:
+    words = re.findall(r"\w+", q.lower())
+    # Sirf stopwords hon ("to be or") to unhi se search
+    return ([w for w in words if w not in STOPWORDS] or words)[:MAX_TERMS]
+
+
+def _star(terms, term: str) -> str:
+    return "*" if term == terms[-1] and len(term) >= PREFIX_MIN else ""
+
+
+def _mysql_query(terms) -> str:
+    return " ".join(f"+{t}{_star(terms, t)}" for t in terms)
+
+
+def _fts5_query(terms, only=None) -> str:
+    """FTS5 MATCH string; only = terms ka subset (prefix phir bhi sirf asal aakhri word par)."""
+    return " ".join(f'"{t}"{_star(terms, t)}' for t in (only or terms))
+
+
+_fts_engines = weakref.WeakKeyDictionary()  # engine → SQLite par FTS5 tables maujood hain?
+
+
+def _backend(db) -> str:
+    bind = db.get_bind()
+    engine = getattr(bind, "engine", bind)
+    if engine.dialect.name == "mysql":
+        return "mysql"
+    if engine.dialect.name == "sqlite":
+        if engine not in _fts_engines:
+            found = db.execute(text("SELECT count(*) FROM sqlite_master WHERE name = 'tasks_fts'")).scalar()
+            _fts_engines[engine] = bool(found)
+        if _fts_engines[engine]:
+            return "sqlite"
+    return "like"
+
+
+def _fts5_match(name: str, query: str):
+    fts = table(f"{name}_fts", column("rowid"))
+    return fts, literal_column(fts.name).op("MATCH")(query)
+
+
+def _matches(backend: str, name: str, terms, common=()):
+    """
+    (FROM/WHERE wala select(entity, id), relevance score expression) — soft-deleted rows bahar.
+    common: SQLite par wo terms jo score me shamil na hon (sirf filter).
+    """
+    model, _, columns = ENTITIES[name]
+    entity = literal(name, String).label("entity")
+
+    if backend == "mysql":
+        cols = [getattr(model, c) for c in columns]
+        score = mysql_match(*cols, against=_mysql_query(terms)).in_boolean_mode()
+        return select(entity, model.id.label("id")).where(score > 0, model.is_deleted == 0), score
+
+    if backend == "sqlite":
+        # FTS5 index me sirf active rows hain → asal table ka JOIN nahi
+        scored = [t for t in terms if t not in common] or terms
+        fts, match = _fts5_match(name, _fts5_query(terms, scored))
+        weights = ", ".join(str(_WEIGHTS[c]) for c in columns)
+        score = -literal_column(f"bm25({fts.name}, {weights})", Float)  # bm25: kam = behtar
+        stmt = select(entity, fts.c.rowid.label("id")).where(match)
+        rest = [t for t in terms if t not in scored]
+        if rest:
+            other = table(f"{name}_fts", column("rowid")).alias(f"{name}_common")
+            stmt = stmt.where(select(other.c.rowid).where(
+                literal_column(f"{other.name}.{name}_fts").op("MATCH")(_fts5_query(terms, rest)),
+                other.c.rowid == fts.c.rowid,
+            ).exists())
+        return stmt, score
+
+    cols = [getattr(model, c) for c in columns]
+
+    def has(term):
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return or_(*[func.lower(c).like(pattern, escape="\\") for c in cols])
+    return select(entity, model.id.label("id")).where(and_(*[has(t) for t in terms]), model.is_deleted == 0), None
+
+
+def _capped_count(name: str, term: str, stmt, alias: str):
+    capped = stmt.limit(SEARCH_RANK_LIMIT + 1).subquery(alias)
+    return select(
+        literal(name, String).label("entity"), literal(term, String).label("term"), func.count().label("n")
+    ).select_from(capped)
+
+
+def _plan(db, backend: str, entities, terms) -> dict:
+    """
+    Har entity ke matches SEARCH_RANK_LIMIT + 1 tak gine (ek UNION ALL query) →
+    {entity: (ranked?, common terms)}. SQLite par har term bhi alag gina jata hai.
+    """
+    if backend == "like":
+        return {name: (False, ()) for name in entities}
+    counts = []
+    for name in entities:
+        stmt, _ = _matches(backend, name, terms)
+        counts.append(_capped_count(name, "", stmt, f"{name}_found"))
+        if backend == "sqlite" and len(terms) > 1:
+            for i, term in enumerate(terms):
+                fts, match = _fts5_match(name, _fts5_query(terms, [term]))
+                counts.append(_capped_count(name, term, select(fts.c.rowid).where(match), f"{name}_term_{i}"))
+    stmt = counts[0] if len(counts) == 1 else union_all(*counts)
+
+    plan = {name: [False, []] for name in entities}
+    for entity, term, n in db.execute(stmt).all():
+        if not term:
+            plan[entity][0] = n <= SEARCH_RANK_LIMIT
+        elif n > SEARCH_RANK_LIMIT:
+            plan[entity][1].append(term)
+    return {name: (ranked, tuple(common)) for name, (ranked, common) in plan.items()}
+
+
+def _branch(backend: str, name: str, terms, depth: int, ranked: bool, common=()):
+    """Ek entity ki top `depth` matches: (entity, id, score); ranked=False → newest-first, score 0."""
+    stmt, score = _matches(backend, name, terms, common if ranked else ())
+    id_col = stmt.selected_columns.id
+    if ranked:
+        stmt = stmt.add_columns(score.label("score")).order_by(score.desc(), id_col.desc())
+    else:
+        stmt = stmt.add_columns(literal(0.0, Float).label("score")).order_by(id_col.desc())
+    return stmt.limit(depth).subquery(f"{name}_hits")
+
+
+def search(db, q: str, entities=None, limit: int = 20, offset: int = 0):
+    """
+    Step by step:
+    1. Text → terms; backend chuno (MySQL FULLTEXT / SQLite FTS5 / LIKE)
+    2. Har entity ke matches gino (capped) → ranked ya newest-first
+    3. Har entity ki top (offset + limit + 1) matches, UNION ALL, score DESC merge — ek query
+    4. Us page ki rows ka data per entity ek "id IN (...)" query se
+    Returns (hits, has_more); hit = {"entity", "id", "score", "data"}
+    """
+    terms = terms_of(q)
+    if not terms:
+        return [], False
+    backend = _backend(db)
+    entities = sorted(entities or ENTITIES)
+    depth = offset + limit + 1
+    plan = _plan(db, backend, entities, terms)
+
+    branches = [select(_branch(backend, name, terms, depth, *plan[name])) for name in entities]
+    merged = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery("hits")
+    stmt = (
+        select(merged)
+        .order_by(merged.c.score.desc(), merged.c.entity, merged.c.id.desc())
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    items = db.execute(stmt).all()
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    ids = {}
+    for item in items:
+        ids.setdefault(item.entity, []).append(item.id)
+    data = {name: rows_by_id(db, *ENTITIES[name][:2], entity_ids) for name, entity_ids in ids.items()}
+
+    hits = [
+        {"entity": item.entity, "id": item.id, "score": float(item.score or 0),
+         "data": data[item.entity].get(item.id)}
+        for item in items
+    ]
+    return hits, has_more
@@ -0,0 +1,72 @@
+# serialization.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   List/export endpoints ka fast serialization path.
+#   - ORM objects hydrate karne ki jagah sirf *Out schema ke columns SELECT hote hain
+#   - Rows seedha plain dicts ban jati hain (per-row Pydantic validation nahi)
+#   - JSON encoding orjson se hoti hai (installed na ho to stdlib json fallback)
+#
+# USAGE:
+#   stmt = select(*schema_columns(TaskOut, Task)).where(...)
+#   rows = db.execute(stmt).all()
+#   return FastJSONResponse(make_response("...", rows_to_dicts(rows)))
+# ────────────────────────────────────────────────────────────────
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def schema_columns(schema, model):
+    """*Out schema ke har field ke liye model ka column (schema ke order me)."""
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+def rows_to_dicts(rows):
+    """SQLAlchemy Row objects → plain dicts (keys = selected column names)."""
+    if not rows:
+        return []
+    keys = rows[0]._fields
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def rows_by_id(db, model, schema, ids) -> dict:
+    """Di gayi ids ki rows (*Out schema columns) ek "id IN (...)" query se: {id: row dict}."""
+    if not ids:
+        return {}
+    stmt = select(*schema_columns(schema, model)).where(model.id.in_(ids))
+    return {row["id"]: row for row in rows_to_dicts(db.execute(stmt).all())}
+
+
+def _default(obj):
+    # Numeric columns (e.g. Invoice.amount) Decimal aati hain; schemas float expose karti hain
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj) -> bytes:
+    """Python object → compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse jo orjson se render karta hai.
+    Endpoint isay directly return kare to FastAPI ka jsonable_encoder (per-row walk) bhi skip ho jata hai.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -1,40 +1,60 @@
 # server.py
-import os, smtplib, ssl, json
-from email.message import EmailMessage
-from http.server import SimpleHTTPRequestHandler, HTTPServer
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   index.html ka chhota email form server (FastAPI app se alag): GET / → form, POST /send → SMTP.
+#   ThreadingHTTPServer: har connection apne thread me — ek request ka SMTP send
+#   (network round-trips, seconds lag sakte hain) baqi requests ko nahi rokta.
+#   Ek waqt me kitni SMTP connections khulein, wo smtp_pool (SMTP_POOL_SIZE) tay karta hai.
+#   scripts/build_static.py chal chuka ho to GET / static/dist/index.html ka precompressed
+#   variant (.br / .gz, Accept-Encoding ke mutabiq) bhejta hai — warna repo ka index.html.
+#
+# USAGE:
+#   python server.py        (http://127.0.0.1:8000)
+# ────────────────────────────────────────────────────────────────
+import smtplib, json, os
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs
 
-# ---- Edit these or set as environment variables ----
-SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.zoho.com")     # or "smtppro.zoho.com"
-SMTP_PORT   = int(os.getenv("SMTP_PORT", "465"))            # 465=SSL, 587=STARTTLS
-SMTP_USER   = os.getenv("SMTP_USERNAME", "you@yourdomain.com")
-SMTP_PASS   = os.getenv("SMTP_PASSWORD", "your_app_password")
-SENDER      = os.getenv("SENDER_EMAIL", SMTP_USER)
+from compression import EXTENSIONS
+from smtp_pool import SENDER_EMAIL as SENDER, build_message, get_smtp_pool
+from static_assets import precompressed_variant
 
-def send_via_smtp(receiver: str, subject: str, body: str):
-    msg = EmailMessage()
-    msg["From"] = SENDER
-    msg["To"] = receiver
-    msg["Subject"] = subject
-    msg.set_content(body)
+BUILT_INDEX = os.path.join("static", "dist", "index.html")  # scripts/build_static.py ka output
+
+# ---- SMTP config env vars se (smtp_pool.py dekhein) ----
+# SMTP_SERVER, SMTP_PORT (465=SSL, 587=STARTTLS), SMTP_USERNAME, SMTP_PASSWORD, SENDER_EMAIL
 
-    ctx = ssl.create_default_context()
-    if SMTP_PORT == 465:
-        with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=ctx) as s:
-            s.login(SMTP_USER, SMTP_PASS)
-            s.send_message(msg)
-    else:
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=30) as s:
-            s.ehlo(); s.starttls(context=ctx); s.ehlo()
-            s.login(SMTP_USER, SMTP_PASS)
-            s.send_message(msg)
+def send_via_smtp(receiver: str, subject: str, body: str):
+    # Shared pool: connection reuse hoti hai, har request par login nahi
+    get_smtp_pool().send(build_message(receiver, subject, body, SENDER))
 
 class Handler(SimpleHTTPRequestHandler):
     # Serve index.html by default
     def do_GET(self):
         if self.path in ("/", "/index.html"):
+            if self._send_built_index():
+                return
             self.path = "/index.html"
-        return super().doGET()
+        return super().do_GET()
+
+    # Build hua ho to precompressed index.html (request par compression ka kaam nahi)
+    def _send_built_index(self) -> bool:
+        if not os.path.isfile(BUILT_INDEX):
+            return False
+        encoding, available = precompressed_variant(BUILT_INDEX, self.headers.get("Accept-Encoding", ""))
+        with open(BUILT_INDEX + EXTENSIONS[encoding] if encoding else BUILT_INDEX, "rb") as fh:
+            data = fh.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-cache")  # entry page: hashed assets ke naye links foran milein
+        if available:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(data)
+        return True
 
     # Handle form POST to /send
     def do_POST(self):
@@ -77,11 +97,9 @@ class Handler(SimpleHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(data)
 
-    # Small fix: Python's SimpleHTTPRequestHandler uses do_GET name
-    def doGET(self):  # wrapper for our custom default path logic
-        return super().do_GET()
-
 if __name__ == "__main__":
     HOST, PORT = "127.0.0.1", 8000
     print(f"Running on http://{HOST}:{PORT}")
-    HTTPServer((HOST, PORT), Handler).serve_forever()
+    httpd = ThreadingHTTPServer((HOST, PORT), Handler)
+    httpd.daemon_threads = True  # Ctrl+C par atke hue SMTP sends ka intezar nahi
+    httpd.serve_forever()
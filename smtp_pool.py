@@ -0,0 +1,269 @@
+# smtp_pool.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Reusable, authenticated SMTP connections (routers/emailer.py aur server.py dono ke liye).
+#   Pehle har email par naya TLS handshake + login hota tha (~1s per email, provider
+#   rate limits). Ab:
+#   - Connections pool me rehti hain aur agle messages ke liye dobara use hoti hain
+#   - Stale connection (idle timeout / server ne band kar di) par khud reconnect
+#   - Har connection par max messages ki limit (provider caps ke liye)
+#   - send_many(): bohat se messages thodi si connections par parallel bhejna
+#
+# ENV VARS:
+#   SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, SENDER_EMAIL (pehle jaise)
+#   SMTP_SECURITY=ssl|starttls|none   (default: port 465 → ssl, warna starttls;
+#                                      "none" local aiosmtpd stand-in ke liye)
+#   SMTP_POOL_SIZE=3                  → max khuli connections
+#   SMTP_MAX_MESSAGES_PER_CONN=100    → itne messages ke baad connection recycle
+#   SMTP_IDLE_TIMEOUT=60              → itne seconds idle connection dobara use nahi hoti
+#   SMTP_TIMEOUT=30                   → socket timeout (seconds)
+# ────────────────────────────────────────────────────────────────
+
+import atexit
+import os
+import smtplib
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.message import EmailMessage
+
+SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.zoho.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+SMTP_USERNAME = os.getenv("SMTP_USERNAME", "you@yourdomain.com")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "your_app_password")
+SENDER_EMAIL = os.getenv("SENDER_EMAIL", SMTP_USERNAME)
+SMTP_SECURITY = os.getenv("SMTP_SECURITY") or ("ssl" if SMTP_PORT == 465 else "starttls")
+
+# Itni der idle rehne ke baad reuse se pehle NOOP se connection check karte hain
+NOOP_AFTER_SECONDS = 10
+
+# Ye errors aayen to connection toot chuki hai → reconnect karke ek dafa retry
+_RETRYABLE = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError, ssl.SSLError)
+
+
+def build_message(receiver: str, subject: str, body: str, sender: str = None) -> EmailMessage:
+    msg = EmailMessage()
+    msg["From"] = sender or SENDER_EMAIL
+    msg["To"] = receiver
+    msg["Subject"] = subject
+    msg.set_content(body)
+    return msg
+
+
+class _PooledConnection:
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.created = time.monotonic()
+        self.last_used = self.created
+        self.sent = 0
+
+    def close(self):
+        try:
+            self.smtp.quit()
+        except Exception:
+            try:
+                self.smtp.close()
+            except Exception:
+                pass
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe SMTP connection pool.
+
+    Usage:
+        pool = get_smtp_pool()
+        pool.send(build_message("a@b.com", "Hi", "Body"))
+        results = pool.send_many([msg1, msg2, ...])
+    """
+
+    def __init__(self, host: str, port: int, username: str = None, password: str = None,
+                 security: str = "starttls", max_connections: int = 3,
+                 max_messages_per_connection: int = 100, idle_timeout: float = 60,
+                 timeout: float = 30):
+        if security not in ("ssl", "starttls", "none"):
+            raise ValueError(f"Unknown SMTP security mode: {security}")
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.security = security
+        self.max_connections = max_connections
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+
+        self._idle = []                       # LIFO: sab se taaza connection pehle
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self.stats = {"connections_opened": 0, "messages_sent": 0, "reconnects": 0, "failures": 0}
+
+    @classmethod
+    def from_env(cls, **overrides):
+        """Env config se pool; overrides (e.g. max_connections=8) env values ke upar."""
+        kwargs = {
+            "max_connections": int(os.getenv("SMTP_POOL_SIZE", "3")),
+            "max_messages_per_connection": int(os.getenv("SMTP_MAX_MESSAGES_PER_CONN", "100")),
+            "idle_timeout": float(os.getenv("SMTP_IDLE_TIMEOUT", "60")),
+            "timeout": float(os.getenv("SMTP_TIMEOUT", "30")),
+        }
+        kwargs.update(overrides)
+        return cls(SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, SMTP_SECURITY, **kwargs)
+
+    # ── connection lifecycle ────────────────────────────────────
+    def _open(self) -> _PooledConnection:
+        ctx = ssl.create_default_context()
+        if self.security == "ssl":
+            smtp = smtplib.SMTP_SSL(self.host, self.port, context=ctx, timeout=self.timeout)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            smtp.ehlo()
+            if self.security == "starttls":
+                smtp.starttls(context=ctx)
+                smtp.ehlo()
+        if self.username and self.password:
+            smtp.login(self.username, self.password)
+        self._bump("connections_opened")
+        return _PooledConnection(smtp)
+
+    def _is_usable(self, conn: _PooledConnection) -> bool:
+        idle = time.monotonic() - conn.last_used
+        if idle > self.idle_timeout or conn.sent >= self.max_messages_per_connection:
+            return False
+        if idle > NOOP_AFTER_SECONDS:
+            try:
+                return conn.smtp.noop()[0] == 250
+            except Exception:
+                return False
+        return True
+
+    def _take_idle(self):
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return None
+            if self._is_usable(conn):
+                return conn
+            conn.close()
+
+    @contextmanager
+    def connection(self):
+        """Ek (reused ya nayi) connection deta hai; block khatam hone par pool me wapas."""
+        self._slots.acquire()
+        conn = None
+        try:
+            conn = self._take_idle() or self._open()
+            yield conn
+        except BaseException:
+            if conn is not None:
+                conn.close()
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                conn.last_used = time.monotonic()
+                if conn.sent >= self.max_messages_per_connection:
+                    conn.close()
+                else:
+                    with self._lock:
+                        self._idle.append(conn)
+            self._slots.release()
+
+    def _bump(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    # ── sending ─────────────────────────────────────────────────
+    def _send_on(self, conn: _PooledConnection, msg: EmailMessage) -> _PooledConnection:
+        """Message bhejta hai; connection toot gayi ho to reconnect karke ek dafa retry."""
+        try:
+            conn.smtp.send_message(msg)
+        except _RETRYABLE:
+            conn.close()
+            self._bump("reconnects")
+            fresh = self._open()
+            conn.smtp, conn.sent, conn.created = fresh.smtp, 0, fresh.created
+            conn.smtp.send_message(msg)
+        conn.sent += 1
+        self._bump("messages_sent")
+        return conn
+
+    def send(self, msg: EmailMessage):
+        with self.connection() as conn:
+            self._send_on(conn, msg)
+
+    def _send_batch(self, msgs):
+        """Ek connection par messages ki list; per-message (ok, error) results."""
+        results = []
+        remaining = list(msgs)
+        while remaining:
+            try:
+                with self.connection() as conn:
+                    while remaining and conn.sent < self.max_messages_per_connection:
+                        msg = remaining.pop(0)
+                        try:
+                            self._send_on(conn, msg)
+                            results.append((True, None))
+                        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as e:
+                            # Server ne sirf ye message reject kiya; connection theek hai
+                            self._bump("failures")
+                            results.append((False, str(e)))
+                        except Exception as e:
+                            self._bump("failures")
+                            results.append((False, str(e)))
+                            conn.sent = self.max_messages_per_connection  # kharab → pool me wapas na jaye
+                            break  # naya connection le kar baqi bhejo
+            except Exception as e:
+                # Connection khul hi nahi saki (server down / auth fail) → baqi sab failed
+                self._bump("failures", len(remaining))
+                results.extend((False, str(e)) for _ in remaining)
+                remaining = []
+        return results
+
+    def send_many(self, msgs, connections: int = None):
+        """
+        Bohat se messages ko kuch connections par parallel bhejta hai.
+        Returns: har message ke liye (ok: bool, error: str|None), input order me.
+        """
+        msgs = list(msgs)
+        if not msgs:
+            return []
+        workers = max(1, min(connections or self.max_connections, self.max_connections, len(msgs)))
+        # Round-robin slices: har worker apni slice ek (reused) connection par bhejta hai
+        slices = [msgs[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="smtp") as pool:
+            per_worker = list(pool.map(self._send_batch, slices))
+
+        results = [None] * len(msgs)
+        for w, worker_results in enumerate(per_worker):
+            for k, result in enumerate(worker_results):
+                results[w + k * workers] = result
+        return results
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"max_connections": self.max_connections, "idle": len(self._idle), **self.stats}
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Process-wide shared pool (env config se, pehli call par banta hai)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SMTPConnectionPool.from_env()
+                atexit.register(_pool.close_all)
+    return _pool
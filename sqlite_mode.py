@@ -0,0 +1,135 @@
+# sqlite_mode.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Single-node / edge installs ke liye embedded SQLite backend (MySQL server ki zaroorat nahi):
+#     DATABASE_URL=sqlite:////var/lib/fpt/tracker.db python run.py
+#   database.py file-based SQLite URL dekh kar ye mode khud on karta hai:
+#   - Har connection par tuned pragmas: WAL journal (readers writer ko nahi rokte),
+#     synchronous=NORMAL (WAL me crash-safe; sirf aakhri commits power loss par ja sakte hain),
+#     mmap, page cache, busy timeout, temp_store=MEMORY, foreign_keys=ON (MySQL jaisa)
+#   - Single writer / multi reader:
+#       reader engine → normal pool (DB_POOL_SIZE), SELECTs ek sath chalti hain
+#       writer engine → 1 connection per process, har transaction "BEGIN IMMEDIATE"
+#     RoutingSession flush / INSERT / UPDATE / DELETE / SELECT ... FOR UPDATE ko writer par
+#     bhejta hai; transaction me ek baar likh diya to baqi reads bhi writer par (apni writes
+#     dikhein). Process ke andar writers writer pool par line lagate hain (checkout wait =
+#     /health/db-pool "sqlite_writer"), workers ke beech busy_timeout tak intezar — deferred
+#     transaction ko beech me write lock na milne wali "database is locked" errors nahi aati.
+#   - Schema: database.init_db() models se tables + indexes + FTS5 search tables (search.py)
+#
+# NOTE:
+#   USE_ASYNC_DB=1 (aiosqlite) par sirf pragmas lagte hain, writer routing nahi — async
+#   SQLite local testing ke liye hai. In-memory SQLite ("sqlite://") par ye mode off hai.
+#
+# ENV VARS:
+#   SQLITE_TUNING=1                → 0 = plain pysqlite (koi pragma / writer routing nahi; benchmark baseline)
+#   SQLITE_JOURNAL_MODE=WAL
+#   SQLITE_SYNCHRONOUS=NORMAL      → FULL = har commit par fsync (zyada durable, slow writes)
+#   SQLITE_MMAP_SIZE=268435456     → bytes (256 MB) jo reads ke liye memory-map hon (0 = off)
+#   SQLITE_CACHE_SIZE=-65536       → page cache per connection (negative = KiB → 64 MB)
+#   SQLITE_BUSY_TIMEOUT_MS=5000    → lock ka itna intezar, phir "database is locked"
+#   SQLITE_INIT_SCHEMA=1           → startup par init_db() (missing tables / FTS bana do)
+# ────────────────────────────────────────────────────────────────
+
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from db_pool import engine_kwargs
+
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "1").lower() in ("1", "true", "yes")
+SQLITE_INIT_SCHEMA = os.getenv("SQLITE_INIT_SCHEMA", "1").lower() in ("1", "true", "yes")
+
+# Har nayi connection par (order ahem: busy_timeout pehle, taa-ke journal_mode switch bhi lock ka intezar kare)
+PRAGMAS = (
+    ("busy_timeout", int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))),
+    ("journal_mode", os.getenv("SQLITE_JOURNAL_MODE", "WAL")),
+    ("synchronous", os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")),
+    ("mmap_size", int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))),
+    ("cache_size", int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))),
+    ("temp_store", "MEMORY"),
+    ("foreign_keys", "ON"),
+)
+
+
+def is_sqlite_file(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def apply_pragmas(dbapi_connection):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in PRAGMAS:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def tune_engine(engine, writer: bool = False):
+    """
+    Engine (sync, ya AsyncEngine.sync_engine) ki har connection par PRAGMAS.
+    writer=True: pysqlite ka apna (deferred) BEGIN band karke har transaction "BEGIN IMMEDIATE"
+    — write lock transaction ke shuru me hi (busy_timeout ke sath) milta hai, beech me nahi.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        if writer:
+            dbapi_connection.isolation_level = None  # BEGIN ab neeche wala "begin" event deta hai
+        apply_pragmas(dbapi_connection)
+
+    if writer:
+        @event.listens_for(engine, "begin")
+        def _on_begin(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+def writer_engine_kwargs(url: str) -> dict:
+    """Writer engine: process me ek hi connection (writes line me), baqi pool settings wahi."""
+    return {**engine_kwargs(url), "pool_size": 1, "max_overflow": 0}
+
+
+def _is_write(clause) -> bool:
+    if clause is None:
+        return False
+    if getattr(clause, "is_dml", False):
+        return True
+    # outbox claim (SELECT ... FOR UPDATE → UPDATE) writer ki transaction me: claims line me
+    return isinstance(clause, Select) and clause._for_update_arg is not None
+
+
+class RoutingSession(Session):
+    """
+    Session jo reads reader engine par aur writes writer engine par bhejta hai.
+    Step by step (get_bind):
+    1. Is transaction me pehle likh chuke → writer (apni uncommitted writes padhne ke liye)
+    2. Flush (ORM add / update / delete) ya DML / FOR UPDATE statement → writer, aur yaad rakho
+    3. Warna → reader (bind)
+    Bahar wali transaction khatam (commit / rollback) hone ke baad phir se reader se shuru —
+    SAVEPOINT (begin_nested) release / rollback par nahi: writer ka BEGIN IMMEDIATE lock
+    tab bhi usi connection par hai.
+    """
+
+    def __init__(self, *args, writer=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writer = writer
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.writer is not None:
+            if self.info.get("sqlite_writing") or self._flushing or _is_write(clause):
+                self.info["sqlite_writing"] = True
+                return self.writer
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _back_to_reader(session, transaction):
+    # after_commit / after_rollback SAVEPOINT par bhi chalte hain → sirf outermost transaction
+    if transaction.parent is None:
+        session.info.pop("sqlite_writing", None)
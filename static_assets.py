@@ -0,0 +1,106 @@
+# static_assets.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /static mount jo build step (scripts/build_static.py) ka output istemal karta hai:
+#   - Fingerprinted files (static/dist/index.3f2a9c1d0b.css): naam me content hash hai,
+#     is liye "Cache-Control: public, max-age=31536000, immutable" — browser dobara
+#     poochta bhi nahi; content badla = naya naam = naya URL
+#   - Har file ke sath precompressed variants (.zst / .br / .gz) disk par pare hain;
+#     Accept-Encoding ke mutabiq wahi file seedhi bhej di jati hai (Content-Encoding set)
+#     → per-request compression ka CPU zero (CompressionMiddleware encoded responses chhor deta hai)
+#   - Baqi (unhashed) files: "no-cache" → ETag / Last-Modified se 304
+#   - Templates me static_url("projects_list.css") → manifest se hashed URL (build na hua ho to
+#     /static/projects_list.css); projects_list.html / client_detail.html ki CSS isi tarah aati hai
+#
+# BUILD:
+#   python scripts/build_static.py   (deploy step; static/ badle to dobara chalayein)
+# ────────────────────────────────────────────────────────────────
+
+import json
+import mimetypes
+import os
+import re
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from compression import EXTENSIONS, negotiate
+
+STATIC_DIR = "static"
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST_PATH = os.path.join(DIST_DIR, "manifest.json")
+STATIC_PREFIX = "/static"
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+FINGERPRINTED = re.compile(r"\.[0-9a-f]{10}\.[A-Za-z0-9]+$")  # name.<10 hex>.ext
+
+_manifest = None
+
+
+def load_manifest() -> dict:
+    """manifest.json (original path → hashed path, encodings); process me ek baar padha jata hai."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as fh:
+                _manifest = json.load(fh).get("files", {})
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def static_url(path: str) -> str:
+    """Template global: "index.css" → "/static/dist/index.<hash>.css" (build na ho to "/static/index.css")."""
+    entry = load_manifest().get(path)
+    if entry:
+        return f"{STATIC_PREFIX}/dist/{entry['file']}"
+    return f"{STATIC_PREFIX}/{path}"
+
+
+def precompressed_variant(full_path: str, accept_encoding: str):
+    """
+    (encoding ya None, available encodings) — disk par maujood variants me se jo client le sake,
+    un me sab se chhoti file (build-time par br-11 aksar zstd-19 / gzip-9 se chhota hota hai).
+    """
+    sizes = {}
+    for encoding, ext in EXTENSIONS.items():
+        try:
+            sizes[encoding] = os.path.getsize(full_path + ext)
+        except OSError:
+            continue
+    if not sizes:
+        return None, []
+    available = sorted(sizes, key=sizes.get)
+    return negotiate(accept_encoding, available), available
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles jaisa hi, magar file_response me:
+    1. Accept-Encoding ke mutabiq "<file>.br" / ".zst" / ".gz" mojood ho to wohi bhejo
+    2. Fingerprinted file → immutable cache headers; warna no-cache (revalidate)
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        immutable = bool(FINGERPRINTED.search(full_path))
+        headers = {"Cache-Control": IMMUTABLE if immutable else REVALIDATE}
+
+        encoding, available = precompressed_variant(full_path, request_headers.get("accept-encoding", ""))
+        if available:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            variant = full_path + EXTENSIONS[encoding]
+            # Content-Type original file ka (index.css.br → text/css)
+            response = FileResponse(variant, status_code=status_code, stat_result=os.stat(variant),
+                                    headers={**headers, "Content-Encoding": encoding},
+                                    media_type=mimetypes.guess_type(full_path)[0] or "text/plain")
+        else:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
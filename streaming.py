@@ -0,0 +1,113 @@
+# streaming.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Full-table exports (nightly sync waghera) ke liye streaming helpers.
+#   - DB se rows server-side cursor (stream_results + yield_per) ke zariye
+#     batch by batch aati hain, poori table memory me load nahi hoti
+#   - Har batch fetch hote hi response me likh diya jata hai, is liye
+#     time-to-first-byte sirf pehle batch jitna hota hai
+#   - Rows column-projected hoti hain (select(*schema_columns(...))) aur
+#     serialization.dumps (orjson) se encode hoti hain
+#
+# FORMATS:
+#   ndjson → har line ek JSON object (application/x-ndjson)
+#   json   → ek JSON array jo chunks me stream hota hai (application/json)
+# ────────────────────────────────────────────────────────────────
+
+from fastapi.responses import StreamingResponse
+
+from serialization import dumps
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 10_000
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def iter_batches(db, stmt, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Query ko server-side cursor ke sath chalata hai aur har batch ko
+    dicts ki list (max batch_size) ke taur par yield karta hai.
+    """
+    stmt = stmt.execution_options(stream_results=True, yield_per=batch_size)
+    result = db.execute(stmt)
+    keys = list(result.keys())
+    for batch in result.partitions(batch_size):
+        yield [dict(zip(keys, row)) for row in batch]
+
+
+async def iter_batches_async(db, stmt, batch_size: int = DEFAULT_BATCH_SIZE):
+    """iter_batches() ka AsyncSession version (AsyncSession.stream → server-side cursor)."""
+    stmt = stmt.execution_options(yield_per=batch_size)
+    result = await db.stream(stmt)
+    keys = list(result.keys())
+    async for batch in result.partitions(batch_size):
+        yield [dict(zip(keys, row)) for row in batch]
+
+
+def _ndjson_chunk(batch):
+    return b"".join(dumps(item) + b"\n" for item in batch)
+
+
+def _ndjson_chunks(batches):
+    for batch in batches:
+        yield _ndjson_chunk(batch)
+
+
+def _json_array_chunks(batches):
+    yield b"["
+    first = True
+    for batch in batches:
+        chunk = b",".join(dumps(item) for item in batch)
+        if not chunk:
+            continue
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]"
+
+
+async def _ndjson_chunks_async(batches):
+    async for batch in batches:
+        yield _ndjson_chunk(batch)
+
+
+async def _json_array_chunks_async(batches):
+    yield b"["
+    first = True
+    async for batch in batches:
+        chunk = b",".join(dumps(item) for item in batch)
+        if not chunk:
+            continue
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]"
+
+
+def stream_export(db, stmt, fmt: str = "ndjson", batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Step by step:
+    1. Query ko batches me iterate karo (memory ≈ batch_size rows)
+    2. Har batch ko format ke hisaab se JSON bytes chunk me badlo
+    3. StreamingResponse return karo jo chunks fetch hote hi bhejta hai
+
+    stmt column-projected hona chahiye; column names hi JSON keys bante hain.
+    """
+    batches = iter_batches(db, stmt, batch_size)
+    if fmt == "json":
+        chunks = _json_array_chunks(batches)
+    else:
+        chunks = _ndjson_chunks(batches)
+    return StreamingResponse(chunks, media_type=EXPORT_FORMATS[fmt])
+
+
+def stream_export_async(db, stmt, fmt: str = "ndjson", batch_size: int = DEFAULT_BATCH_SIZE):
+    """stream_export() ka AsyncSession version; chunks event loop par hi bante hain."""
+    batches = iter_batches_async(db, stmt, batch_size)
+    if fmt == "json":
+        chunks = _json_array_chunks_async(batches)
+    else:
+        chunks = _ndjson_chunks_async(batches)
+    return StreamingResponse(chunks, media_type=EXPORT_FORMATS[fmt])
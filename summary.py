@@ -0,0 +1,140 @@
+# summary.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Dashboard counters: per-client aur per-project aggregates, ek SQL query me.
+#   - projects_count, budget_total
+#   - open_tasks, completed_tasks
+#   - invoiced_total, outstanding (paid_status != "paid" wale invoices ka amount)
+#
+#   Projects/tasks/invoices Python me load nahi hote. Tasks aur invoices pehle
+#   project_id par GROUP BY hote hain (derived tables), phir projects se JOIN —
+#   is tarah JOIN fan-out (projects × tasks × invoices) se sums double nahi hote.
+#   Result dict {id: counters} hota hai, taa-ke har client ka lookup O(1) ho.
+#
+# USAGE:
+#   summaries = client_summaries(db)            # saare active clients
+#   summaries = client_summaries(db, [5])       # sirf client 5 (uske projects tak mehdood)
+#   summaries[5]["open_tasks"]
+# ────────────────────────────────────────────────────────────────
+
+from sqlalchemy import case, func, select, true
+
+from models.client import Client
+from models.invoice import Invoice
+from models.project import Project
+from models.task import Task
+
+COUNTERS = ("projects_count", "budget_total", "open_tasks", "completed_tasks",
+            "invoiced_total", "outstanding")
+
+
+def _project_aggregates(project_ids=None):
+    """Active tasks/invoices ke per-project aggregates (derived tables)."""
+    tasks = (
+        select(
+            Task.project_id,
+            func.sum(case((Task.completed == true(), 0), else_=1)).label("open_tasks"),
+            func.sum(case((Task.completed == true(), 1), else_=0)).label("completed_tasks"),
+        )
+        .where(Task.is_deleted == 0)
+        .group_by(Task.project_id)
+    )
+    invoices = (
+        select(
+            Invoice.project_id,
+            func.sum(Invoice.amount).label("invoiced_total"),
+            func.sum(case((Invoice.paid_status == "paid", 0), else_=Invoice.amount)).label("outstanding"),
+        )
+        .where(Invoice.is_deleted == 0)
+        .group_by(Invoice.project_id)
+    )
+    if project_ids is not None:
+        # Sirf zaroori projects ki rows aggregate hon (index: project_id, is_deleted)
+        tasks = tasks.where(Task.project_id.in_(project_ids))
+        invoices = invoices.where(Invoice.project_id.in_(project_ids))
+    return tasks.subquery("task_agg"), invoices.subquery("invoice_agg")
+
+
+def _as_dict(rows, key: str) -> dict:
+    out = {}
+    for row in rows:
+        data = row._asdict()
+        out[data.pop(key)] = data
+    return out
+
+
+def client_summaries(db, client_ids=None) -> dict:
+    """
+    Step by step:
+    1. (Optional) client_ids ke active projects ka subquery
+    2. Tasks/invoices project-wise aggregate
+    3. Clients ⟕ projects ⟕ aggregates, GROUP BY client — ek query
+    Returns: {client_id: {projects_count, budget_total, open_tasks, ...}}
+    (Jin clients ka koi project nahi unke counters 0 hote hain.)
+    """
+    project_ids = None
+    if client_ids is not None:
+        project_ids = select(Project.id).where(Project.client_id.in_(client_ids), Project.is_deleted == 0)
+    task_agg, invoice_agg = _project_aggregates(project_ids)
+
+    stmt = (
+        select(
+            Client.id.label("client_id"),
+            func.count(Project.id).label("projects_count"),
+            func.coalesce(func.sum(Project.budget), 0).label("budget_total"),
+            func.coalesce(func.sum(task_agg.c.open_tasks), 0).label("open_tasks"),
+            func.coalesce(func.sum(task_agg.c.completed_tasks), 0).label("completed_tasks"),
+            func.coalesce(func.sum(invoice_agg.c.invoiced_total), 0).label("invoiced_total"),
+            func.coalesce(func.sum(invoice_agg.c.outstanding), 0).label("outstanding"),
+        )
+        .select_from(Client)
+        .outerjoin(Project, (Project.client_id == Client.id) & (Project.is_deleted == 0))
+        .outerjoin(task_agg, task_agg.c.project_id == Project.id)
+        .outerjoin(invoice_agg, invoice_agg.c.project_id == Project.id)
+        .where(Client.is_deleted == 0)
+        .group_by(Client.id)
+    )
+    if client_ids is not None:
+        stmt = stmt.where(Client.id.in_(client_ids))
+    return _as_dict(db.execute(stmt).all(), "client_id")
+
+
+def project_summaries(db, client_id=None) -> dict:
+    """
+    Per-project counters (client_id do to sirf us client ke projects).
+    Returns: {project_id: {title, status, budget, open_tasks, completed_tasks, invoiced_total, outstanding}}
+    """
+    project_ids = None
+    if client_id is not None:
+        project_ids = select(Project.id).where(Project.client_id == client_id, Project.is_deleted == 0)
+    task_agg, invoice_agg = _project_aggregates(project_ids)
+
+    stmt = (
+        select(
+            Project.id.label("project_id"),
+            Project.title,
+            Project.status,
+            Project.budget,
+            func.coalesce(task_agg.c.open_tasks, 0).label("open_tasks"),
+            func.coalesce(task_agg.c.completed_tasks, 0).label("completed_tasks"),
+            func.coalesce(invoice_agg.c.invoiced_total, 0).label("invoiced_total"),
+            func.coalesce(invoice_agg.c.outstanding, 0).label("outstanding"),
+        )
+        .outerjoin(task_agg, task_agg.c.project_id == Project.id)
+        .outerjoin(invoice_agg, invoice_agg.c.project_id == Project.id)
+        .where(Project.is_deleted == 0)
+        .order_by(Project.id)
+    )
+    if client_id is not None:
+        stmt = stmt.where(Project.client_id == client_id)
+    return _as_dict(db.execute(stmt).all(), "project_id")
+
+
+def totals(summaries: dict) -> dict:
+    """Saare clients ke counters ka jor (dashboard header ke liye)."""
+    out = {name: 0 for name in COUNTERS}
+    for counters in summaries.values():
+        for name in COUNTERS:
+            out[name] += counters[name]
+    out["clients_count"] = len(summaries)
+    return out
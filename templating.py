@@ -0,0 +1,191 @@
+# templating.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   HTML views (Jinja2) ke do caches:
+#   1) Bytecode cache: templates ka compiled Python code disk par (TEMPLATE_CACHE_DIR).
+#      Har worker cold start par templates dobara compile nahi karta — pehla worker
+#      likhta hai, baqi (aur restart ke baad naye workers) wahi file load karte hain.
+#      Key me template source ka checksum hota hai → template badla to khud naya compile.
+#   2) Fragment cache: per-row / per-client partials (e.g. projects table ki ek row)
+#      ka rendered HTML, key = (kind, row id), sath row ka version (updated_at).
+#      Version mismatch = row badal chuki → dobara render. Writes par (create/update
+#      handlers ka commit) Session events us row ke fragments foran nikal dete hain.
+#
+# USAGE (template ke andar):
+#   {{ fragment("partials/project_row.html", "project_row", p.id, p.version, p=p) }}
+#   Partial ka HTML sirf (kind, id, version) par depend kare — loop.index jaisi cheezein bahar.
+#
+# NOTE:
+#   Fragment cache har worker ka apna hai; dusre worker ke writes version (updated_at)
+#   ke zariye pakre jate hain kyun ke version har request ki query se aata hai.
+#
+# ENV VARS:
+#   TEMPLATE_CACHE_DIR=<tmp>/fpt-jinja-cache   → bytecode cache folder (khali = off)
+#   FRAGMENT_CACHE_ENABLED=1                   → 0 = har fragment har baar render
+#   FRAGMENT_CACHE_MAX_ENTRIES=50000           → LRU bound (fragments ki tadaad)
+# ────────────────────────────────────────────────────────────────
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, pass_environment
+from markupsafe import Markup
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from static_assets import static_url
+
+TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "fpt-jinja-cache"))
+FRAGMENT_CACHE_ENABLED = os.getenv("FRAGMENT_CACHE_ENABLED", "1").lower() in ("1", "true", "yes")
+FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv("FRAGMENT_CACHE_MAX_ENTRIES", "50000"))
+
+# fragment kind → jis table ki row se bana (writes par invalidation ke liye)
+FRAGMENT_TABLES = {
+    "project_row": "projects",
+    "client_card": "clients",
+}
+
+
+def _bytecode_cache(directory: str):
+    """Folder bana kar FileSystemBytecodeCache; likh na saken (read-only FS) to None (cache off)."""
+    if not directory:
+        return None
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(directory, os.W_OK):
+        return None
+    # Jinja temp file + rename se likhta hai → kai workers ek sath likhen to bhi adhuri file nahi
+    return FileSystemBytecodeCache(directory, "fpt-%s.cache")
+
+
+class FragmentCache:
+    """
+    In-process LRU: (kind, id) → (version, rendered Markup).
+    Thread-safe (sync endpoints threadpool me render karte hain).
+    """
+
+    def __init__(self, max_entries: int = FRAGMENT_CACHE_MAX_ENTRIES, enabled: bool = FRAGMENT_CACHE_ENABLED):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0, "invalidations": 0}
+
+    def render(self, kind: str, key, version, build) -> Markup:
+        """
+        Step by step:
+        1. (kind, key) ki entry dhoondo; version same ho → cached HTML (hit)
+        2. Na mili (miss) ya purane version ki (stale) → build() se render
+        3. Naya HTML version ke sath LRU me (max_entries se zyada → sab se purani nikal do)
+        """
+        if not self.enabled:
+            return Markup(build())
+        cache_key = (kind, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["stale" if entry is not None else "misses"] += 1
+
+        html = Markup(build())  # lock ke bahar: render ke dauran dusri threads na rukein
+        with self._lock:
+            self._entries[cache_key] = (version, html)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return html
+
+    def invalidate(self, kind: str, *keys):
+        """Di gayi ids ke fragments nikal do; ids na di hon to us kind ke saare."""
+        with self._lock:
+            if keys:
+                dropped = [k for k in ((kind, key) for key in keys) if k in self._entries]
+            else:
+                dropped = [k for k in self._entries if k[0] == kind]
+            for cache_key in dropped:
+                del self._entries[cache_key]
+            self.stats["invalidations"] += len(dropped)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"] + self.stats["stale"]
+            return {**self.stats, "entries": len(self._entries), "max_entries": self.max_entries,
+                    "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+                    "enabled": self.enabled, "bytecode_cache_dir": TEMPLATE_CACHE_DIR or None}
+
+
+fragment_cache = FragmentCache()
+
+
+@pass_environment
+def fragment(env, template_name: str, kind: str, key, version, **context) -> Markup:
+    """Template global: partial ko fragment cache ke zariye render karta hai."""
+    return fragment_cache.render(kind, key, version, lambda: env.get_template(template_name).render(**context))
+
+
+def make_templates(directory: str = "templates") -> Jinja2Templates:
+    """Jinja2Templates + bytecode cache + fragment() / static_url() globals (main.py app.state.templates)."""
+    env = Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=True,                                   # Jinja2Templates ka default bhi yahi
+        bytecode_cache=_bytecode_cache(TEMPLATE_CACHE_DIR),
+    )
+    env.globals["fragment"] = fragment
+    env.globals["static_url"] = static_url  # "projects_list.css" → hashed /static/dist/... URL (static_assets.py)
+    return Jinja2Templates(env=env)
+
+
+# ── Write tracking: commit par likhi gayi rows ke fragments invalidate ──
+def _written(session) -> set:
+    return session.info.setdefault("fragment_written_rows", set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    # ORM update/delete (naye rows ka koi fragment hota hi nahi)
+    for obj in (*session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table in FRAGMENT_TABLES.values():
+            _written(session).add((table, obj.id))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_execute(orm_execute_state):
+    # session.execute(update(...)/delete(...)): ids maloom nahi → us table ke saare fragments
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and table.name in FRAGMENT_TABLES.values():
+            _written(orm_execute_state.session).add((table.name, None))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.in_nested_transaction():
+        return  # SAVEPOINT release: asal commit abhi baqi hai
+    rows = session.info.pop("fragment_written_rows", None)
+    if not rows:
+        return
+    for kind, table in FRAGMENT_TABLES.items():
+        ids = [row_id for name, row_id in rows if name == table]
+        if None in ids:
+            fragment_cache.invalidate(kind)
+        elif ids:
+            fragment_cache.invalidate(kind, *ids)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_on_rollback(session, transaction):
+    if transaction.parent is None:  # SAVEPOINT rollback par pehle likhi rows yaad rahein
+        session.info.pop("fragment_written_rows", None)
@@ -0,0 +1,19 @@
+# tests/conftest.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   pytest ke shared setup: repo root + scripts/ (local_db helpers) import path par,
+#   aur app import se pehle env (koi MySQL server / repo me log file nahi chahiye).
+# ────────────────────────────────────────────────────────────────
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")  # app ka apna engine bhi local (tests make_local_app use karte hain)
+os.environ.setdefault("NOTIFICATION_LOG_FILE", os.path.join(tempfile.gettempdir(), "fpt_tests_notifications.log"))
@@ -0,0 +1,82 @@
+# tests/test_change_feed.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   /changes feed commit order me chalta hai (change_seq), updated_at order me nahi:
+#   jo transaction purane updated_at ke sath baad me commit ho, uski row bhi agli poll me aaye.
+# ────────────────────────────────────────────────────────────────
+
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from local_db import make_local_app, seed
+
+from models.project import Project
+from models.timestamps import utcnow
+
+
+def _poll(client, cursor=None):
+    params = {"limit": 1000, **({"since": cursor} if cursor else {})}
+    body = client.get("/changes", params=params).json()
+    return body["data"], body["page"]["next_cursor"]
+
+
+def test_late_commit_with_old_updated_at_is_not_skipped():
+    app, engine = make_local_app()
+    seed(engine, 2)
+    client = TestClient(app)
+
+    changes, cursor = _poll(client)
+    assert len(changes) == 2 + 4 + 12 + 4  # seed: clients + projects + tasks + invoices
+
+    # Lambi transaction: row ka updated_at ek ghanta pehle laga, commit ab hua
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add(Project(title="Slow commit", client_id=1, updated_at=utcnow() - timedelta(hours=1)))
+        db.commit()
+
+    changes, cursor = _poll(client, cursor)
+    assert [(c["entity"], c["op"], c["data"]["title"]) for c in changes] == [("projects", "upsert", "Slow commit")]
+    assert _poll(client, cursor)[0] == []
+    engine.dispose()
+
+
+def test_bulk_insert_rows_reach_the_feed():
+    app, engine = make_local_app()
+    seed(engine, 1)
+    client = TestClient(app)
+    _, cursor = _poll(client)
+
+    response = client.post("/clients/bulk", json=[{"name": "Bulk A"}, {"name": "Bulk B"}])
+    assert response.status_code == 200, response.text
+
+    changes, _ = _poll(client, cursor)
+    assert sorted(c["data"]["name"] for c in changes) == ["Bulk A", "Bulk B"]
+    engine.dispose()
+
+
+def test_savepoint_rollback_keeps_earlier_rows_in_the_feed():
+    app, engine = make_local_app()
+    seed(engine, 1)
+    client = TestClient(app)
+    _, cursor = _poll(client)
+
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add(Project(title="Before savepoint", client_id=1))
+        db.flush()
+        try:
+            with db.begin_nested():
+                db.add(Project(title="Rolled back", client_id=1))
+                db.flush()
+                raise ValueError("savepoint rollback")
+        except ValueError:
+            pass
+        with db.begin_nested():
+            db.add(Project(title="Released savepoint", client_id=1))
+        db.commit()
+
+    changes, _ = _poll(client, cursor)
+    assert sorted(c["data"]["title"] for c in changes) == ["Before savepoint", "Released savepoint"]
+    engine.dispose()
@@ -0,0 +1,95 @@
+# tests/test_conditional_cache.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   conditional_get + response_cache: kisi aur process ki write (is worker ke cache
+#   versions tak nahi pohanchti) ke baad purani cached body naye ETag ke sath serve na ho —
+#   warna client ka agla If-None-Match 304 paata aur purane data par atak jata.
+#   Invalidation asal commit par ho, SAVEPOINT release par nahi (partial bulk).
+# ────────────────────────────────────────────────────────────────
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+
+from local_db import make_local_app, seed
+
+import conditional
+from bulk import bulk_insert
+from cache import response_cache
+from models.client import Client
+
+
+def test_stale_cache_hit_is_not_served_with_fresh_etag(monkeypatch):
+    monkeypatch.setattr(conditional, "ETAG_FINGERPRINT_TTL", 0)  # har request par fingerprint query
+    response_cache.clear()
+    app, engine = make_local_app()
+    seed(engine, 2)
+    client = TestClient(app)
+
+    first = client.get("/projects/list")
+    again = client.get("/projects/list")
+    assert again.headers["x-cache"] == "HIT" and again.headers["etag"] == first.headers["etag"]
+
+    # Dusre worker ki write: seedha connection se, Session events (cache invalidation) ke bagair
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE projects SET title = 'Renamed', updated_at = '2999-01-01 00:00:00' WHERE id = 1"))
+
+    fresh = client.get("/projects/list", headers={"If-None-Match": first.headers["etag"]})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != first.headers["etag"]
+    assert fresh.headers["x-cache"] == "MISS"
+    assert "Renamed" in fresh.text
+
+    # Naya ETag ab isi (taaza) body ka hai: cached HIT aur 304 dono usi par
+    assert client.get("/projects/list").headers["x-cache"] == "HIT"
+    assert client.get("/projects/list", headers={"If-None-Match": fresh.headers["etag"]}).status_code == 304
+    engine.dispose()
+
+
+def test_compressed_etag_is_strong_and_revalidates():
+    response_cache.clear()
+    app, engine = make_local_app()
+    seed(engine, 20)
+    client = TestClient(app)
+
+    first = client.get("/projects/list", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('-gzip"')
+
+    again = client.get("/projects/list", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert again.status_code == 304 and again.headers["etag"] == etag
+
+    plain = client.get("/projects/list", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers and plain.headers["etag"] == etag.replace("-gzip", "")
+    engine.dispose()
+
+
+def test_partial_bulk_invalidates_after_the_real_commit(tmp_path):
+    response_cache.clear()
+    app, engine = make_local_app(f"sqlite:///{tmp_path / 'cache.db'}")
+    seed(engine, 2)
+    client = TestClient(app)
+    assert client.get("/clients/list").headers["x-cache"] == "MISS"
+
+    # Commit se theek pehle (SAVEPOINTs release ho chuke) ek aur request list cache kar le
+    Session = sessionmaker(bind=engine)
+    window = []
+    with Session() as db:
+        @event.listens_for(db, "before_commit")
+        def _concurrent_get(session):
+            if not session.in_nested_transaction():
+                window.append(client.get("/clients/list").json()["data"])
+
+        rows = [(0, {"name": "Bulk A", "email": None, "is_deleted": 0}),
+                (1, {"name": "Dup", "email": "client1@example.com", "is_deleted": 0}),  # unique email → fail
+                (2, {"name": "Bulk C", "email": None, "is_deleted": 0})]
+        ids, errors = bulk_insert(db, Client, rows, partial=True)
+    assert len(ids) == 2 and [e["index"] for e in errors] == [1]
+    assert "Bulk A" not in [row["name"] for row in window[0]]  # commit se pehle wala snapshot
+
+    after = client.get("/clients/list")
+    assert after.headers["x-cache"] == "MISS"
+    names = [row["name"] for row in after.json()["data"]]
+    assert "Bulk A" in names and "Bulk C" in names
+    engine.dispose()
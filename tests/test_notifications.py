@@ -0,0 +1,38 @@
+# tests/test_notifications.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Notification pipeline: ek batch ka write fail ho (koi bhi exception) to worker task
+#   zinda rahe aur baad ki notifications file tak pohanchti rahein.
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+
+from notifications import NotificationPipeline, render_notification
+
+
+def test_writer_survives_a_failed_batch(tmp_path):
+    pipeline = NotificationPipeline(path=tmp_path / "notifications.log", flush_seconds=0)
+    real_write = pipeline._write
+    calls = []
+
+    def failing_once(lines):
+        calls.append(lines)
+        if len(calls) == 1:
+            raise UnicodeEncodeError("utf-8", "x", 0, 1, "forced failure")
+        real_write(lines)
+
+    pipeline._write = failing_once
+
+    async def scenario():
+        await pipeline.start()
+        assert pipeline.publish(render_notification("first@example.com", "lost"))
+        while not calls:
+            await asyncio.sleep(0.01)
+        assert pipeline.running
+        assert pipeline.publish(render_notification("second@example.com", "kept"))
+        await pipeline.stop()
+
+    asyncio.run(scenario())
+    text = (tmp_path / "notifications.log").read_text(encoding="utf-8")
+    assert "second@example.com" in text and "first@example.com" not in text
+    assert pipeline.stats["failed"] == 1 and pipeline.stats["written"] == 1
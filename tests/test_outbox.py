@@ -0,0 +1,56 @@
+# tests/test_outbox.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Outbox idempotency: same dedupe_key wali do requests ek sath aayen (dono ka
+#   "pehle se hai?" check khali) to bhi doosri ko pehli row ki id "duplicate" ke sath mile.
+#   Claim token lambe hostnames par bhi claimed_by column me fit ho.
+# ────────────────────────────────────────────────────────────────
+
+from local_db import make_local_app
+
+import outbox
+
+
+def _message(key, receiver="user@example.com"):
+    return {"receiver": receiver, "subject": "Hi", "body": "Body", "dedupe_key": key}
+
+
+def test_enqueue_race_returns_existing_id(monkeypatch):
+    _, engine = make_local_app()
+    from sqlalchemy.orm import sessionmaker
+
+    Session = sessionmaker(bind=engine)
+    with Session() as first:
+        winner = outbox.enqueue(first, [_message("order-42")])[0]
+    assert winner["status"] == "queued"
+
+    # Race simulate: doosri request ka pehla check winner ke commit se pehle chala tha
+    real_lookup = outbox._existing_ids
+    calls = []
+
+    def stale_then_real(db, keys):
+        calls.append(keys)
+        return {} if len(calls) == 1 else real_lookup(db, keys)
+
+    monkeypatch.setattr(outbox, "_existing_ids", stale_then_real)
+    with Session() as second:
+        results = outbox.enqueue(second, [_message("order-42"), _message("order-43", "other@example.com")])
+
+    assert results[0] == {"id": winner["id"], "status": "duplicate"}
+    assert results[1]["status"] == "queued" and results[1]["id"] != winner["id"]
+    engine.dispose()
+
+
+def test_claim_token_fits_column_for_long_hostnames():
+    _, engine = make_local_app()
+    from sqlalchemy.orm import sessionmaker
+
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        outbox.enqueue(db, [_message("long-host")])
+        worker_id = f"{'pod-' + 'x' * 59}:{4194304}"  # 63-char hostname (Kubernetes pod) + pid
+        token, rows = outbox.claim_batch(db, worker_id, 10)
+
+    assert len(token) <= outbox.CLAIM_TOKEN_LENGTH
+    assert token.startswith("pod-") and [row.receiver for row in rows] == ["user@example.com"]
+    engine.dispose()
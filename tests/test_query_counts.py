@@ -0,0 +1,56 @@
+# tests/test_query_counts.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   N+1 / relationship fan-out guard.
+#   Har list endpoint ko chhote aur bade dataset par chalata hai aur check
+#   karta hai ke SQL statements ki tadaad row count se independent hai.
+# ────────────────────────────────────────────────────────────────
+
+import pytest
+from fastapi.testclient import TestClient
+
+from local_db import make_local_app, seed
+
+LIST_ENDPOINTS = [
+    "/projects/list",
+    "/tasks/list",
+    "/clients/list",
+    "/invoices/list",
+    "/tasks/export",
+    "/invoices/export",
+    "/ui/projects",
+    "/clients/view/1",
+]
+
+SCALES = (3, 60)  # clients; projects/tasks/invoices inke hisaab se barhte hain
+
+
+def measure(clients: int) -> dict:
+    from database import count_queries
+
+    app, engine = make_local_app()
+    seed(engine, clients, projects_per_client=3, tasks_per_project=4, invoices_per_project=2)
+    http = TestClient(app)
+
+    counts = {}
+    for path in LIST_ENDPOINTS:
+        with count_queries(engine) as statements:
+            resp = http.get(path)
+        assert resp.status_code == 200, f"{path} returned {resp.status_code}: {resp.text[:200]}"
+        counts[path] = len(statements)
+    engine.dispose()
+    return counts
+
+
+@pytest.fixture(scope="module")
+def counts():
+    small, large = (measure(n) for n in SCALES)
+    return small, large
+
+
+@pytest.mark.parametrize("path", LIST_ENDPOINTS)
+def test_statement_count_independent_of_rows(counts, path):
+    small, large = counts
+    assert small[path] == large[path], (
+        f"{path}: {small[path]} statements ({SCALES[0]} clients) vs {large[path]} ({SCALES[1]} clients) — N+1?"
+    )
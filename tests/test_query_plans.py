@@ -0,0 +1,112 @@
+# tests/test_query_plans.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   Query-plan guard for list endpoints.
+#   Local SQLite DB par har endpoint (filters ke sath bhi) chalata hai, jo SQL
+#   chali use capture karke EXPLAIN QUERY PLAN karta hai, aur fail karta hai agar
+#   kisi table ka full scan ("SCAN <table>" bina index ke) nazar aaye ya jo index
+#   us query pattern ke liye bana hai (models ke __table_args__) plan me na ho.
+#   sqlite3 / FTS5 na ho to skip.
+# ────────────────────────────────────────────────────────────────
+
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+sqlite3 = pytest.importorskip("sqlite3")
+
+from local_db import make_local_app, seed
+
+# (path, params, indexes jo plan me hone chahiyen)
+REQUESTS = [
+    ("/projects/list", {}, ("ix_projects_active_id",)),
+    ("/projects/list", {"status": "ongoing"}, ("ix_projects_active_status",)),
+    ("/projects/list", {"client_id": 3}, ("ix_projects_client_active",)),
+    ("/tasks/list", {}, ("ix_tasks_active_id",)),
+    ("/tasks/list", {"project_id": 5, "completed": "false"}, ("ix_tasks_project_active_completed",)),
+    ("/tasks/list", {"due_from": "2025-01-01", "due_to": "2025-02-01"}, ("ix_tasks_active_due",)),
+    ("/clients/list", {}, ("ix_clients_active_id",)),
+    ("/invoices/list", {}, ("ix_invoices_active_id",)),
+    ("/invoices/list", {"project_id": 5}, ("ix_invoices_project_active",)),
+    ("/invoices/list", {"paid_status": "unpaid", "due_to": "2025-01-01"}, ("ix_invoices_active_id",)),
+    ("/tasks/export", {}, ("ix_tasks_active_id",)),
+    ("/invoices/export", {}, ("ix_invoices_active_id",)),
+    ("/ui/projects", {}, ("ix_projects_active_id",)),
+    ("/ui/projects", {"status": "ongoing", "limit": 20}, ("ix_projects_active_status",)),
+    ("/ui/projects", {"client_id": 3, "start_from": "2025-01-01"}, ("ix_projects_client_active",)),
+    ("/ui/projects", {"stream": 1}, ("ix_projects_active_id",)),
+    ("/clients/view/1", {}, ("ix_projects_client_active", "ix_tasks_project_active_completed",
+                             "ix_invoices_project_active")),
+    ("/dashboard/clients/3", {}, ("ix_projects_client_active", "ix_tasks_project_active_completed",
+                                  "ix_invoices_project_active")),
+    # limit ≪ table size: page table ki aadhi+ ids le aaye to "id IN (...)" data query ka SCAN planner ka sahi faisla hai
+    ("/changes", {"limit": 20}, ("ix_clients_change_seq", "ix_projects_change_seq", "ix_tasks_change_seq", "ix_invoices_change_seq")),
+    ("/changes", {"entities": "projects,tasks", "limit": 50}, ("ix_projects_change_seq", "ix_tasks_change_seq")),
+    ("/search", {"q": "task 1"}, ("tasks_fts",)),
+    ("/search", {"q": "project", "entities": "projects,tasks"}, ("projects_fts", "tasks_fts")),
+]
+
+# "SCAN tasks" = full table scan; "SCAN tasks USING INDEX ..." / "SEARCH ..." theek hai.
+# Sirf asal tables check hoti hain — "SCAN <subquery>" (e.g. LIMIT wala derived table) bounded hai.
+FULL_SCAN = re.compile(r"^SCAN (\w+)\b(?! USING (COVERING )?INDEX)")
+
+
+def _has_fts5() -> bool:
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="module")
+def local():
+    app, engine = make_local_app()
+    import database
+    seed(engine, 200, projects_per_client=3, tasks_per_project=4, invoices_per_project=2)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    yield TestClient(app), engine, set(database.Base.metadata.tables)
+    engine.dispose()
+
+
+def plans_for(http, engine, path: str, params: dict) -> list:
+    """Request chalao; har SELECT ka EXPLAIN QUERY PLAN (detail lines) return."""
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        resp = http.get(path, params=params)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert resp.status_code == 200, f"{path} returned {resp.status_code}: {resp.text[:200]}"
+
+    with engine.connect() as conn:
+        return [[row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+                for statement, parameters in captured]
+
+
+@pytest.mark.parametrize("path,params,indexes", REQUESTS,
+                         ids=[f"{path} {params}" if params else path for path, params, _ in REQUESTS])
+def test_plan_uses_index(local, path, params, indexes):
+    if path == "/search" and not _has_fts5():
+        pytest.skip("SQLite build me FTS5 nahi")
+    http, engine, tables = local
+    plans = plans_for(http, engine, path, params)
+    details = [d for plan in plans for d in plan]
+
+    scans = [d for d in details if (match := FULL_SCAN.match(d)) and match.group(1) in tables]
+    assert not scans, f"{path} {params}: full table scan {scans}\n" + "\n".join(details)
+    for index in indexes:
+        assert any(re.search(rf"\b{index}\b", d) for d in details), (
+            f"{path} {params}: {index} plan me nahi\n" + "\n".join(details)
+        )
@@ -0,0 +1,55 @@
+# tests/test_sqlite_mode.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   SQLite mode (sqlite_mode.py) file DB par end to end: reader pool + ek writer connection
+#   (BEGIN IMMEDIATE) + RoutingSession. partial bulk insert har chunk SAVEPOINT me chalata hai;
+#   SAVEPOINT release ke baad bhi session writer par rahe, warna commit ke waqt ki writes
+#   reader par ja kar "database is locked" deti hain.
+# ────────────────────────────────────────────────────────────────
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from local_db import make_local_app, seed
+
+import database
+from db_pool import engine_kwargs
+from sqlite_mode import RoutingSession, tune_engine, writer_engine_kwargs
+
+
+def _sqlite_mode_app(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tracker.db'}"
+    app, plain = make_local_app(url)  # schema + app
+    seed(plain, 2)
+    plain.dispose()
+
+    reader = tune_engine(create_engine(url, **engine_kwargs(url)))
+    writer = tune_engine(create_engine(url, **writer_engine_kwargs(url)), writer=True)
+    SessionLocal = sessionmaker(bind=reader, class_=RoutingSession, writer=writer, autoflush=False)
+
+    def _get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[database.get_db] = _get_db
+    return app, reader, writer
+
+
+def test_partial_bulk_insert_in_file_mode(tmp_path):
+    app, reader, writer = _sqlite_mode_app(tmp_path)
+    client = TestClient(app)
+
+    payload = [{"name": "Bulk A"}, {"name": "Bulk B", "email": "client1@example.com"}, {"name": "Bulk C"}]
+    response = client.post("/clients/bulk", params={"partial": "true"}, json=payload)
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["inserted"] == 2 and [e["index"] for e in data["errors"]] == [1]
+
+    names = [row["name"] for row in client.get("/clients/list", params={"limit": 1000}).json()["data"]]
+    assert "Bulk A" in names and "Bulk C" in names and "Bulk B" not in names
+    reader.dispose()
+    writer.dispose()
@@ -0,0 +1,34 @@
+# tests/test_startup.py
+# ────────────────────────────────────────────────────────────────
+# PURPOSE:
+#   main.startup_event: DB pool warm-up timeout (DB hang) par worker chup chaap "ready" na bane —
+#   ❌ log hamesha, aur DB_WARMUP_REQUIRED=1 par startup fail.
+# ────────────────────────────────────────────────────────────────
+
+import asyncio
+
+import pytest
+
+import main
+
+
+def _timed_out_warm_up():
+    async def _warm_up():
+        return {"pools": {"sync": {"opened": 0, "requested": 5, "timed_out": True}}, "elapsed_ms": 3000.0}
+    return _warm_up
+
+
+def test_warm_up_timeout_fails_startup_when_required(monkeypatch, capsys):
+    monkeypatch.setattr(main, "warm_up", _timed_out_warm_up())
+    monkeypatch.setattr(main, "WARMUP_REQUIRED", True)
+    with pytest.raises(RuntimeError, match="DB_WARMUP_REQUIRED"):
+        asyncio.run(main.startup_event())
+    assert "❌ sync pool warm-up TIMED OUT" in capsys.readouterr().out
+
+
+def test_warm_up_timeout_logs_loudly_when_not_required(monkeypatch, capsys):
+    monkeypatch.setattr(main, "warm_up", _timed_out_warm_up())
+    monkeypatch.setattr(main, "WARMUP_REQUIRED", False)
+    asyncio.run(main.startup_event())
+    out = capsys.readouterr().out
+    assert "❌ sync pool warm-up TIMED OUT" in out and "✅" not in out